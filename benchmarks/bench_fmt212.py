@@ -0,0 +1,138 @@
+"""
+Benchmark the decoding of format 212 signals.
+
+A synthetic multi-hour record, sampled like the MIT-BIH Arrhythmia
+Database (2 signals at 360 Hz), is written in format 212 to a temporary
+directory. The decoding of its raw bytes, and reading the whole record
+with `rdrecord`, are then timed, and reported in MB/s of dat file.
+
+Run from the repository root with:
+
+    python benchmarks/bench_fmt212.py --hours 6
+
+"""
+import argparse
+import os
+import tempfile
+import time
+
+import numpy as np
+
+import wfdb
+from wfdb.io import _signal
+
+
+def write_record(record_name, hours, fs=360, n_sig=2, seed=0, write_dir=""):
+    """
+    Write a synthetic format 212 record.
+
+    Parameters
+    ----------
+    record_name : str
+        The name of the record to write.
+    hours : float
+        The duration of the record in hours.
+    fs : int, optional
+        The sampling frequency of the record.
+    n_sig : int, optional
+        The number of signals of the record.
+    seed : int, optional
+        The seed of the random noise added to the signals.
+    write_dir : str, optional
+        The directory in which to write the record.
+
+    Returns
+    -------
+    n_samp : int
+        The total number of samples written.
+
+    """
+    sig_len = int(hours * 3600 * fs)
+    rng = np.random.default_rng(seed)
+    t = np.arange(sig_len) / fs
+    d_signal = np.empty((sig_len, n_sig), dtype="int16")
+    for ch in range(n_sig):
+        wave = 600 * np.sin(2 * np.pi * 1.2 * t + ch)
+        noise = rng.normal(0, 40, sig_len)
+        d_signal[:, ch] = np.clip(wave + noise, -2047, 2047)
+    # Some invalid samples
+    d_signal[::10007, 0] = -2048
+
+    wfdb.wrsamp(
+        record_name,
+        fs=fs,
+        units=["mV"] * n_sig,
+        sig_name=["sig%d" % ch for ch in range(n_sig)],
+        d_signal=d_signal,
+        fmt=["212"] * n_sig,
+        adc_gain=[200.0] * n_sig,
+        baseline=[0] * n_sig,
+        write_dir=write_dir,
+    )
+    return d_signal.size
+
+
+def best_time(func, repeat):
+    """
+    Return the shortest time taken by a number of calls of a function.
+
+    """
+    times = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func()
+        times.append(time.perf_counter() - start)
+    return min(times)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument(
+        "--hours",
+        type=float,
+        default=6,
+        help="duration of the synthetic record (default: 6)",
+    )
+    parser.add_argument(
+        "--repeat",
+        type=int,
+        default=5,
+        help="number of timed runs, of which the best is reported",
+    )
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as write_dir:
+        n_samp = write_record("synthetic212", args.hours, write_dir=write_dir)
+        record_name = os.path.join(write_dir, "synthetic212")
+        dat_path = record_name + ".dat"
+        n_bytes = os.path.getsize(dat_path)
+        sig_data = np.fromfile(dat_path, dtype="uint8")
+
+        print(
+            "%g hours, %d samples, %.1f MB"
+            % (args.hours, n_samp, n_bytes / 1e6)
+        )
+        for label, func in [
+            (
+                "decode bytes",
+                lambda: _signal._blocks_to_samples(sig_data, n_samp, "212"),
+            ),
+            (
+                "rdrecord digital",
+                lambda: wfdb.rdrecord(record_name, physical=False),
+            ),
+            ("rdrecord physical", lambda: wfdb.rdrecord(record_name)),
+            (
+                "rdrecord physical float32",
+                lambda: wfdb.rdrecord(record_name, return_res=32),
+            ),
+        ]:
+            elapsed = best_time(func, args.repeat)
+            print(
+                "%-26s %8.1f ms %8.1f MB/s"
+                % (label, elapsed * 1e3, n_bytes / elapsed / 1e6)
+            )
+
+
+if __name__ == "__main__":
+    main()
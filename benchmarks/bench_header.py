@@ -0,0 +1,132 @@
+"""
+Benchmark the parsing of large header files.
+
+A synthetic single-segment header with many signals (like high-density
+EEG), and a synthetic multi-segment header with many segments, are
+written to a temporary directory. Reading them with `rdheader` is then
+timed.
+
+Run from the repository root with:
+
+    python benchmarks/bench_header.py --n-sig 1000 --n-seg 10000
+
+"""
+import argparse
+import os
+import tempfile
+import time
+
+import wfdb
+
+
+def write_signal_header(record_name, n_sig, write_dir=""):
+    """
+    Write a synthetic single-segment header file.
+
+    Parameters
+    ----------
+    record_name : str
+        The name of the record to write.
+    n_sig : int
+        The number of signals of the record.
+    write_dir : str, optional
+        The directory in which to write the header.
+
+    Returns
+    -------
+    N/A
+
+    """
+    lines = ["%s %d 500 1800000 12:30:00 01/02/2020" % (record_name, n_sig)]
+    for ch in range(n_sig):
+        lines.append(
+            "%s.dat 16 %d(%d)/uV 16 0 %d 0 0 EEG %d"
+            % (record_name, 100 + ch % 7, ch % 11 - 5, ch * 3 - 500, ch)
+        )
+    lines.append("# Synthetic header")
+    with open(os.path.join(write_dir, record_name + ".hea"), "w") as f:
+        f.write("\n".join(lines) + "\n")
+
+
+def write_segment_header(record_name, n_seg, write_dir=""):
+    """
+    Write a synthetic multi-segment header file.
+
+    Parameters
+    ----------
+    record_name : str
+        The name of the record to write.
+    n_seg : int
+        The number of segments of the record.
+    write_dir : str, optional
+        The directory in which to write the header.
+
+    Returns
+    -------
+    N/A
+
+    """
+    lines = ["%s/%d 4 125 %d" % (record_name, n_seg, n_seg * 7500)]
+    lines.append("%s_layout 0" % record_name)
+    for seg in range(1, n_seg):
+        if seg % 10 == 0:
+            lines.append("~ 7500")
+        else:
+            lines.append("%s_%05d 7500" % (record_name, seg))
+    with open(os.path.join(write_dir, record_name + ".hea"), "w") as f:
+        f.write("\n".join(lines) + "\n")
+
+
+def best_time(func, repeat):
+    """
+    Return the shortest time taken by a number of calls of a function.
+
+    """
+    times = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func()
+        times.append(time.perf_counter() - start)
+    return min(times)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument(
+        "--n-sig",
+        type=int,
+        default=1000,
+        help="number of signals of the single-segment header (default: 1000)",
+    )
+    parser.add_argument(
+        "--n-seg",
+        type=int,
+        default=10000,
+        help="number of segments of the multi-segment header "
+        "(default: 10000)",
+    )
+    parser.add_argument(
+        "--repeat",
+        type=int,
+        default=5,
+        help="number of timed runs, of which the best is reported",
+    )
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as write_dir:
+        write_signal_header("signals", args.n_sig, write_dir=write_dir)
+        write_segment_header("segments", args.n_seg, write_dir=write_dir)
+
+        for label, record_name in [
+            ("%d signals" % args.n_sig, "signals"),
+            ("%d segments" % args.n_seg, "segments"),
+        ]:
+            elapsed = best_time(
+                lambda: wfdb.rdheader(os.path.join(write_dir, record_name)),
+                args.repeat,
+            )
+            print("rdheader %-16s %8.2f ms" % (label, elapsed * 1e3))
+
+
+if __name__ == "__main__":
+    main()
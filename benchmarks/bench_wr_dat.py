@@ -0,0 +1,102 @@
+"""
+Benchmark the encoding and writing of dat files.
+
+A synthetic digital signal is written to a temporary directory in each
+writable format with `wr_dat_file`. The time taken and the peak memory
+allocated by numpy are reported, the speed in MB/s of dat file written.
+
+Run from the repository root with:
+
+    python benchmarks/bench_wr_dat.py --mb 1024
+
+"""
+import argparse
+import os
+import tempfile
+import time
+import tracemalloc
+
+import numpy as np
+
+from wfdb.io import _signal
+
+
+# Number of bytes per sample of each benchmarked format
+FMT_BYTES = {
+    "80": 1,
+    "212": 1.5,
+    "16": 2,
+    "24": 3,
+    "32": 4,
+    "516": 2,
+}
+
+# Digital sample range of each benchmarked format
+FMT_RANGE = {
+    "80": 127,
+    "212": 2047,
+    "16": 32767,
+    "24": 8388607,
+    "32": 2147483647,
+    "516": 32767,
+}
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument(
+        "--mb",
+        type=float,
+        default=1024,
+        help="size of each dat file written, in MB (default: 1024)",
+    )
+    parser.add_argument(
+        "--n-sig",
+        type=int,
+        default=8,
+        help="number of signals of the record (default: 8)",
+    )
+    parser.add_argument(
+        "--fmt",
+        nargs="+",
+        default=list(FMT_BYTES),
+        help="formats to benchmark (default: all)",
+    )
+    args = parser.parse_args()
+
+    rng = np.random.default_rng(0)
+    with tempfile.TemporaryDirectory() as write_dir:
+        for fmt in args.fmt:
+            sig_len = int(args.mb * 1e6 / FMT_BYTES[fmt] / args.n_sig)
+            d_signal = rng.integers(
+                -FMT_RANGE[fmt],
+                FMT_RANGE[fmt],
+                size=(sig_len, args.n_sig),
+                dtype="int16" if FMT_RANGE[fmt] < 32768 else "int32",
+            )
+
+            tracemalloc.start()
+            start = time.perf_counter()
+            _signal.wr_dat_file(
+                "bench.dat", fmt, d_signal, 0, write_dir=write_dir
+            )
+            elapsed = time.perf_counter() - start
+            peak = tracemalloc.get_traced_memory()[1]
+            tracemalloc.stop()
+
+            n_bytes = os.path.getsize(os.path.join(write_dir, "bench.dat"))
+            os.remove(os.path.join(write_dir, "bench.dat"))
+            print(
+                "fmt %-4s %8.1f MB %8.2f s %8.1f MB/s %8.1f MB peak"
+                % (
+                    fmt,
+                    n_bytes / 1e6,
+                    elapsed,
+                    n_bytes / elapsed / 1e6,
+                    peak / 1e6,
+                )
+            )
+
+
+if __name__ == "__main__":
+    main()
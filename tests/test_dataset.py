@@ -0,0 +1,130 @@
+import os
+import shutil
+import tempfile
+import unittest
+
+import numpy as np
+
+import wfdb
+from wfdb.dataset import WindowDataset
+
+
+class TestWindowDataset(unittest.TestCase):
+    """
+    Tests for the wfdb.dataset.WindowDataset class
+    """
+
+    def assertWindowsMatchRecords(self, dataset, indices, **kwargs):
+        """
+        Check that windows match the signals read with `rdrecord`.
+
+        """
+        for index in indices:
+            record_name, start, sig_name = dataset.locate(index)
+            record = wfdb.rdrecord(
+                os.path.join(dataset.db_dir, record_name),
+                sampfrom=start,
+                sampto=start + dataset.window_len,
+                channel_names=sig_name,
+                **kwargs,
+            )
+            signal = record.p_signal if dataset.physical else record.d_signal
+            np.testing.assert_array_equal(dataset[index], signal)
+
+    def test_single_segment(self):
+        """
+        Windows of single segment records, with overlapping strides.
+        """
+        dataset = WindowDataset(
+            "sample-data",
+            window_len=1000,
+            stride=300,
+            record_names=["100", "test01_00s_skewframe"],
+            physical=False,
+            return_res=16,
+        )
+        self.assertEqual(len(dataset), 2164 + 11)
+        self.assertEqual(dataset.locate(2163), ("100", 648900, ["MLII", "V5"]))
+        self.assertEqual(dataset[-1].shape, (1000, 3))
+        self.assertWindowsMatchRecords(
+            dataset, [0, 1, 2163, 2164, 2174], physical=False, return_res=16
+        )
+        with self.assertRaises(IndexError):
+            dataset[len(dataset)]
+
+    def test_multi_segment(self):
+        """
+        Windows of variable layout multi-segment records only contain
+        the requested signals, and do not span segments.
+        """
+        dataset = WindowDataset(
+            "sample-data/multi-segment/s00001",
+            window_len=2000,
+            sig_name=["V", "II"],
+        )
+        self.assertEqual(len(dataset.ranges), 9)
+        for window_range in dataset.ranges:
+            self.assertEqual(window_range.sig_name, ["V", "II"])
+        # The sample data only includes the dat files of some segments
+        self.assertWindowsMatchRecords(dataset, [0, 2, len(dataset) - 1])
+
+    def test_iter_windows(self):
+        """
+        Iterating over shuffled windows with background threads gives the
+        windows of a permutation of the indices.
+        """
+        dataset = WindowDataset(
+            "sample-data",
+            window_len=500,
+            record_names=["multi-segment/fixed1/v102s"],
+            return_res=32,
+        )
+        indices = np.random.default_rng(1).permutation(len(dataset))
+        windows = list(dataset.iter_windows(shuffle=True, seed=1, n_workers=3))
+        self.assertEqual(len(windows), len(dataset))
+        for index in [0, 17, len(dataset) - 1]:
+            np.testing.assert_array_equal(
+                windows[index], dataset[indices[index]]
+            )
+
+    def test_find_records(self):
+        """
+        Without a RECORDS file, the segments of multi-segment records are
+        not indexed as records.
+        """
+        temp_dir = tempfile.mkdtemp()
+        try:
+            shutil.copytree(
+                "sample-data/multi-segment/fixed1",
+                os.path.join(temp_dir, "fixed1"),
+            )
+            dataset = WindowDataset(temp_dir, window_len=75000)
+            self.assertEqual(len(dataset), 3)
+            self.assertEqual(
+                {r.record_name for r in dataset.ranges},
+                {os.path.join("fixed1", "v102s")},
+            )
+        finally:
+            shutil.rmtree(temp_dir)
+
+    def test_missing_sig_len(self):
+        """
+        Records whose header has no signal length are indexed with the
+        length of their dat files.
+        """
+        temp_dir = tempfile.mkdtemp()
+        try:
+            shutil.copy("sample-data/100.dat", temp_dir)
+            with open("sample-data/100.hea") as f:
+                header = f.read().replace("100 2 360 650000", "100 2 360")
+            with open(os.path.join(temp_dir, "100.hea"), "w") as f:
+                f.write(header)
+            dataset = WindowDataset(temp_dir, window_len=3600)
+            self.assertEqual(len(dataset), 650000 // 3600)
+            self.assertWindowsMatchRecords(dataset, [0, len(dataset) - 1])
+        finally:
+            shutil.rmtree(temp_dir)
+
+
+if __name__ == "__main__":
+    unittest.main()
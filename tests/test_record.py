@@ -335,6 +335,63 @@ def test_read_flac_longduration(self):
         )
         np.testing.assert_array_equal(record.p_signal, sig_target)
 
+    def test_read_flac_n_workers(self):
+        """
+        Decoding pieces of a FLAC file concurrently, or block by block
+        from the same stream, gives the same samples as decoding it at
+        once.
+        """
+        sig_len = 300000
+        rng = np.random.default_rng(516)
+        d_signal = rng.integers(-30000, 30000, (sig_len, 3), dtype="int16")
+        wfdb.wrsamp(
+            "flac_random",
+            fs=1000,
+            units=["mV"] * 3,
+            sig_name=["a", "b", "c"],
+            d_signal=d_signal,
+            fmt=["516"] * 3,
+            adc_gain=[200.0] * 3,
+            baseline=[0] * 3,
+            write_dir=self.temp_path,
+        )
+        record_name = os.path.join(self.temp_path, "flac_random")
+
+        for sampfrom, sampto in [(0, sig_len), (12345, 290001)]:
+            for physical in [False, True]:
+                record = wfdb.rdrecord(
+                    record_name,
+                    sampfrom=sampfrom,
+                    sampto=sampto,
+                    physical=physical,
+                )
+                record_2 = wfdb.rdrecord(
+                    record_name,
+                    sampfrom=sampfrom,
+                    sampto=sampto,
+                    physical=physical,
+                    n_workers=4,
+                )
+                if not physical:
+                    np.testing.assert_array_equal(
+                        record.d_signal, d_signal[sampfrom:sampto]
+                    )
+                assert record == record_2
+
+            blocks = [
+                signal
+                for _, signal in wfdb.iter_record(
+                    record_name,
+                    chunk_frames=70000,
+                    sampfrom=sampfrom,
+                    sampto=sampto,
+                    physical=False,
+                )
+            ]
+            np.testing.assert_array_equal(
+                np.concatenate(blocks), d_signal[sampfrom:sampto]
+            )
+
     # ------------------ 2. Special format records ------------------ #
 
     def test_2a(self):
@@ -676,6 +733,183 @@ def test_write_smoothed(self):
         )
         np.testing.assert_array_equal(record.d_signal, record2.d_signal)
 
+    def test_write_long_expanded(self):
+        """
+        Writing expanded signals spanning several chunks of frames, with
+        an odd number of samples, in each writable uncompressed format,
+        without modifying the signals.
+        """
+        sig_len = wfdb.io._signal.CHUNK_SIZE * 2 + 1
+        rng = np.random.default_rng(0)
+        for fmt, max_value in [
+            ("80", 127),
+            ("212", 2047),
+            ("16", 32767),
+            ("24", 8388607),
+            ("32", 2147483647),
+        ]:
+            e_d_signal = [
+                rng.integers(-max_value, max_value, sig_len * spf)
+                for spf in [1, 2]
+            ]
+            e_d_signal[0][:2] = [-max_value, max_value]
+            e_d_signal_copy = [sig.copy() for sig in e_d_signal]
+            record = wfdb.Record(
+                record_name="long" + fmt,
+                n_sig=2,
+                fs=100,
+                sig_len=sig_len,
+                file_name=["long%s.dat" % fmt] * 2,
+                fmt=[fmt] * 2,
+                samps_per_frame=[1, 2],
+                adc_gain=[100.0] * 2,
+                baseline=[0] * 2,
+                units=["mV"] * 2,
+                sig_name=["a", "b"],
+                e_d_signal=e_d_signal,
+            )
+            record.set_d_features(expanded=True)
+            record.set_defaults()
+            record.wrsamp(write_dir=self.temp_path, expanded=True)
+            record_write = wfdb.rdrecord(
+                os.path.join(self.temp_path, "long" + fmt),
+                physical=False,
+                smooth_frames=False,
+            )
+            for sig, sig_copy, sig_write in zip(
+                e_d_signal, e_d_signal_copy, record_write.e_d_signal
+            ):
+                np.testing.assert_array_equal(sig, sig_copy)
+                np.testing.assert_array_equal(sig_write, sig)
+
+    def test_record_writer(self):
+        """
+        Writing a record in blocks of frames with RecordWriter, and
+        comparing it with the same record written by wrsamp.
+        """
+        rng = np.random.default_rng(0)
+        for fmt in ["80", "212", "16", "24", "32"]:
+            d_signal = rng.integers(-100, 100, size=(1001, 3))
+            fields = dict(
+                fs=100,
+                units=["mV"] * 3,
+                sig_name=["a", "b", "c"],
+                fmt=[fmt] * 3,
+                adc_gain=[200.0] * 3,
+                baseline=[0] * 3,
+                write_dir=self.temp_path,
+            )
+            with wfdb.RecordWriter("blocks" + fmt, **fields) as writer:
+                for start, stop in [(0, 7), (7, 8), (8, 8), (8, 1001)]:
+                    writer.write_frames(d_signal=d_signal[start:stop])
+                    writer.flush()
+                    record_write = wfdb.rdrecord(
+                        os.path.join(self.temp_path, "blocks" + fmt),
+                        physical=False,
+                    )
+                    np.testing.assert_array_equal(
+                        record_write.d_signal, d_signal[:stop]
+                    )
+
+            wfdb.wrsamp("whole" + fmt, d_signal=d_signal, **fields)
+            record_whole = wfdb.rdheader(
+                os.path.join(self.temp_path, "whole" + fmt)
+            )
+            self.assertEqual(record_write.checksum, record_whole.checksum)
+            self.assertEqual(record_write.init_value, record_whole.init_value)
+            with open(
+                os.path.join(self.temp_path, "blocks%s.dat" % fmt), "rb"
+            ) as f_blocks, open(
+                os.path.join(self.temp_path, "whole%s.dat" % fmt), "rb"
+            ) as f_whole:
+                self.assertEqual(f_blocks.read(), f_whole.read())
+
+        # Expanded physical frames
+        e_p_signal = [rng.integers(-500, 500, 100) / 200, np.zeros(50)]
+        e_p_signal[1][10] = np.nan
+        with wfdb.RecordWriter(
+            "blocks_expanded",
+            fs=100,
+            units=["mV"] * 2,
+            sig_name=["a", "b"],
+            fmt=["212"] * 2,
+            adc_gain=[200.0] * 2,
+            baseline=[0] * 2,
+            samps_per_frame=[2, 1],
+            write_dir=self.temp_path,
+        ) as writer:
+            writer.write_frames(
+                e_p_signal=[e_p_signal[0][:6], e_p_signal[1][:3]]
+            )
+            writer.write_frames(
+                e_p_signal=[e_p_signal[0][6:], e_p_signal[1][3:]]
+            )
+            with self.assertRaises(IndexError):
+                writer.write_frames(e_d_signal=[np.full(2, 5000), np.zeros(1)])
+        record_write = wfdb.rdrecord(
+            os.path.join(self.temp_path, "blocks_expanded"),
+            smooth_frames=False,
+        )
+        self.assertEqual(record_write.sig_len, 50)
+        for sig, sig_write in zip(e_p_signal, record_write.e_p_signal):
+            np.testing.assert_array_equal(sig_write, sig)
+
+    def test_write_blocks(self):
+        """
+        Writing memory-mapped and iterable signals with wrsamp, one block
+        at a time, gives the same record as writing the whole signal.
+        """
+        sig_len = wfdb.io._signal.CHUNK_SIZE * 2 + 1
+        p_signal = np.random.default_rng(0).normal(size=(sig_len, 2))
+        p_signal[5, 1] = np.nan
+        p_path = os.path.join(self.temp_path, "p_signal.npy")
+        np.save(p_path, p_signal)
+        fields = dict(
+            fs=100,
+            units=["mV"] * 2,
+            sig_name=["a", "b"],
+            fmt=["16", "212"],
+            write_dir=self.temp_path,
+        )
+        wfdb.wrsamp("whole", p_signal=p_signal, **fields)
+        record_whole = wfdb.rdrecord(
+            os.path.join(self.temp_path, "whole"), physical=False
+        )
+        d_signal = record_whole.d_signal
+
+        wfdb.wrsamp("memmap", p_signal=np.load(p_path, mmap_mode="r"), **fields)
+        fields.update(
+            adc_gain=record_whole.adc_gain, baseline=record_whole.baseline
+        )
+        wfdb.wrsamp(
+            "p_blocks",
+            p_signal=(p_signal[i : i + 1000] for i in range(0, sig_len, 1000)),
+            **fields,
+        )
+        wfdb.wrsamp(
+            "d_blocks", d_signal=iter([d_signal[:7], d_signal[7:]]), **fields
+        )
+        for record_name in ["memmap", "p_blocks", "d_blocks"]:
+            record_write = wfdb.rdrecord(
+                os.path.join(self.temp_path, record_name), physical=False
+            )
+            record_write.record_name = "whole"
+            record_write.file_name = record_whole.file_name
+            assert record_write.__eq__(record_whole, verbose=True)
+
+        # Memory-mapped signals need both or neither of gain and baseline
+        with self.assertRaisesRegex(Exception, "memory-mapped"):
+            wfdb.wrsamp(
+                "memmap_gain",
+                p_signal=np.load(p_path, mmap_mode="r"),
+                **dict(fields, baseline=None),
+            )
+
+        # An empty iterable writes an empty record
+        wfdb.wrsamp("empty", d_signal=iter([]), **fields)
+        record_write = wfdb.rdheader(os.path.join(self.temp_path, "empty"))
+        self.assertEqual(record_write.sig_len, 0)
+
     def test_to_dataframe(self):
         record = wfdb.rdrecord("sample-data/test01_00s")
         df = record.to_dataframe()
@@ -710,6 +944,676 @@ def test_header_with_non_utf8(self):
         ]
         assert record.units.__eq__(sig_units_target)
 
+    def test_read_mmap(self):
+        """
+        Memory-mapped reading of aligned formats, with skew and multiple
+        samples per frame, matches regular reading.
+        """
+        for record_name, kwargs in [
+            ("sample-data/test01_00s", {}),
+            ("sample-data/test01_00s", {"sampfrom": 100, "channels": [3, 1]}),
+            ("sample-data/test01_00s_skewframe", {"sampfrom": 17}),
+            ("sample-data/binformats", {"channels": [1, 2, 3, 4, 9]}),
+            ("sample-data/a103l", {"sampto": 5000}),
+        ]:
+            for physical in [True, False]:
+                record = wfdb.rdrecord(record_name, physical=physical, **kwargs)
+                mapped = wfdb.rdrecord(
+                    record_name, physical=physical, mmap=True, **kwargs
+                )
+                if physical:
+                    target, signal = record.p_signal, mapped.p_signal
+                else:
+                    target, signal = record.d_signal, mapped.d_signal
+
+                self.assertIsInstance(signal, wfdb.io._signal.MappedSignal)
+                self.assertEqual(signal.shape, target.shape)
+                self.assertEqual(signal.dtype, target.dtype)
+                np.testing.assert_array_equal(np.asarray(signal), target)
+                np.testing.assert_array_equal(
+                    signal[10:50:3, 1:], target[10:50:3, 1:]
+                )
+                np.testing.assert_array_equal(signal[-1, 0], target[-1, 0])
+                np.testing.assert_array_equal(
+                    signal[[7, 2, 5]], target[[7, 2, 5]]
+                )
+                self.assertEqual(record.init_value, mapped.init_value)
+                self.assertEqual(record.sig_len, mapped.sig_len)
+
+        with self.assertRaises(ValueError):
+            wfdb.rdrecord("sample-data/100", mmap=True)
+
+        # Signal proxies must implement _read_digital
+        class IncompleteSignal(wfdb.io._signal.SignalProxy):
+            pass
+
+        with self.assertRaises(TypeError):
+            IncompleteSignal(10, ["16"], [200.0], [0], physical=True)
+
+    def test_read_lazy(self):
+        """
+        Lazily read signals of all formats match regular reading.
+        """
+        for record_name, kwargs in [
+            ("sample-data/100", {"sampfrom": 1000, "sampto": 3000}),
+            ("sample-data/test01_00s_skewframe", {"channels": [1, 0]}),
+            ("sample-data/binformats", {"sampfrom": 3}),
+            ("sample-data/flacformats", {}),
+        ]:
+            for physical in [True, False]:
+                record = wfdb.rdrecord(record_name, physical=physical, **kwargs)
+                lazy = wfdb.rdrecord(
+                    record_name, physical=physical, lazy=True, **kwargs
+                )
+                if physical:
+                    target, signal = record.p_signal, lazy.p_signal
+                else:
+                    target, signal = record.d_signal, lazy.d_signal
+
+                self.assertIsInstance(signal, wfdb.io._signal.LazySignal)
+                self.assertEqual(signal.shape, target.shape)
+                self.assertEqual(signal.dtype, target.dtype)
+                np.testing.assert_array_equal(np.asarray(signal), target)
+                np.testing.assert_array_equal(
+                    signal[101:150, ::-1], target[101:150, ::-1]
+                )
+                np.testing.assert_array_equal(signal[-3:, 0], target[-3:, 0])
+                self.assertEqual(record.init_value, lazy.init_value)
+
+        with self.assertRaises(ValueError):
+            wfdb.rdrecord("sample-data/100", lazy=True, mmap=True)
+
+    def test_read_n_workers(self):
+        """
+        Reading the dat files of a record concurrently gives the same
+        result as reading them one at a time.
+        """
+        for record_name in [
+            "sample-data/binformats",
+            "sample-data/flacformats",
+        ]:
+            for physical in [True, False]:
+                record = wfdb.rdrecord(record_name, physical=physical)
+                record_2 = wfdb.rdrecord(
+                    record_name, physical=physical, n_workers=4
+                )
+                assert record.__eq__(record_2)
+
+    def test_iter_record(self):
+        """
+        Blocks of a single segment record match reading the entire
+        range, with skew, multiple samples per frame, and format 8.
+        """
+        for record_name, kwargs in [
+            ("sample-data/100", {"sampfrom": 100, "sampto": 10000}),
+            ("sample-data/test01_00s_skewframe", {"channels": [2, 1]}),
+            ("sample-data/binformats", {"sampfrom": 7}),
+        ]:
+            record = wfdb.rdrecord(record_name, **kwargs)
+            blocks = list(wfdb.iter_record(record_name, 333, **kwargs))
+            self.assertEqual(
+                [start for start, _ in blocks],
+                list(
+                    range(
+                        kwargs.get("sampfrom", 0),
+                        kwargs.get("sampfrom", 0) + record.sig_len,
+                        333,
+                    )
+                ),
+            )
+            np.testing.assert_array_equal(
+                np.concatenate([signal for _, signal in blocks]),
+                record.p_signal,
+            )
+
+        record = wfdb.rdrecord(
+            "sample-data/test01_00s_frame", physical=False, smooth_frames=False
+        )
+        blocks = list(
+            wfdb.iter_record(
+                "sample-data/test01_00s_frame",
+                100,
+                physical=False,
+                smooth_frames=False,
+            )
+        )
+        for ch in range(record.n_sig):
+            np.testing.assert_array_equal(
+                np.concatenate([signal[ch] for _, signal in blocks]),
+                record.e_d_signal[ch],
+            )
+
+    def test_read_physical_chunks(self):
+        """
+        Physical signals decoded and converted in chunks match the
+        conversion of the whole digital signal, including NaN samples.
+        """
+        for record_name, kwargs in [
+            ("sample-data/100skew", {"sampfrom": 1000}),
+            ("sample-data/03700181", {"channels": [2, 0]}),
+        ]:
+            for return_res in [64, 32]:
+                record = wfdb.rdrecord(
+                    record_name, return_res=return_res, **kwargs
+                )
+                digital = wfdb.rdrecord(
+                    record_name, physical=False, return_res=return_res, **kwargs
+                )
+                np.testing.assert_array_equal(
+                    record.p_signal, digital.dac(return_res=return_res)
+                )
+                self.assertEqual(record.checksum, digital.checksum)
+                self.assertEqual(record.init_value, digital.init_value)
+
+    def test_dac_lut(self):
+        """
+        Converting low resolution signals with lookup tables gives the
+        same result as converting them arithmetically.
+        """
+        for record_name, resolutions in [
+            ("sample-data/100skew", [64, 32, 16]),
+            ("sample-data/3000003_0003", [64, 32, 16]),
+            ("sample-data/binformats", [64, 32]),
+        ]:
+            record = wfdb.rdrecord(record_name, physical=False)
+            for return_res in resolutions:
+                p_signal = record.dac(return_res=return_res)
+                np.testing.assert_array_equal(
+                    record.dac(return_res=return_res, lut=True), p_signal
+                )
+                np.testing.assert_array_equal(
+                    wfdb.rdrecord(record_name, return_res=return_res).p_signal,
+                    p_signal,
+                )
+
+        # Samples outside of the range of the format
+        record = wfdb.rdrecord("sample-data/100", physical=False)
+        record.d_signal[5, 0] = 5000
+        np.testing.assert_array_equal(record.dac(lut=True), record.dac())
+
+    def test_fmt212_round_trip(self):
+        """
+        Format 212 samples, including the extreme and invalid values,
+        are read back as written, for odd and even numbers of samples
+        and starting samples.
+        """
+        rng = np.random.default_rng(212)
+        for sig_len, n_sig in [(1, 1), (2, 1), (1001, 1), (1000, 3)]:
+            d_signal = rng.integers(-2048, 2048, (sig_len, n_sig))
+            d_signal[0, 0] = -2048
+            d_signal[-1, -1] = 2047
+            wfdb.wrsamp(
+                "fmt212",
+                fs=100,
+                units=["mV"] * n_sig,
+                sig_name=["sig%d" % ch for ch in range(n_sig)],
+                d_signal=d_signal,
+                fmt=["212"] * n_sig,
+                adc_gain=[100.0] * n_sig,
+                baseline=[0] * n_sig,
+                write_dir=self.temp_path,
+            )
+            record_name = os.path.join(self.temp_path, "fmt212")
+            for sampfrom in range(min(sig_len, 3)):
+                record = wfdb.rdrecord(
+                    record_name, sampfrom=sampfrom, physical=False
+                )
+                np.testing.assert_array_equal(
+                    record.d_signal, d_signal[sampfrom:]
+                )
+
+    def test_read_channel_subset(self):
+        """
+        Reading some channels of packed format dat files, which only
+        unpacks their samples, gives the same samples as reading all
+        channels.
+        """
+        # Format 311 record with 4 samples per frame, so that a channel
+        # occupies every position of the 3 sample blocks.
+        sig_len = 750
+        rng = np.random.default_rng(311)
+        rng.integers(0, 256, sig_len * 4 * 4 // 3, dtype="uint8").tofile(
+            os.path.join(self.temp_path, "fmt311.dat")
+        )
+        with open(os.path.join(self.temp_path, "fmt311.hea"), "w") as f:
+            f.write("fmt311 3 100 %d\n" % sig_len)
+            f.write("fmt311.dat 311x2 200 10 0 0 0 0 sig0\n")
+            for ch in [1, 2]:
+                f.write("fmt311.dat 311 200 10 0 0 0 0 sig%d\n" % ch)
+
+        for record_name in [
+            "sample-data/03700181",
+            "sample-data/310derive",
+            "sample-data/v102s",
+            os.path.join(self.temp_path, "fmt311"),
+        ]:
+            for sampfrom in [0, 1, 100]:
+                record = wfdb.rdrecord(
+                    record_name,
+                    sampfrom=sampfrom,
+                    physical=False,
+                    smooth_frames=False,
+                )
+                for ch in range(record.n_sig):
+                    for channels in [[ch], [ch, 0]]:
+                        if channels == [0, 0]:
+                            continue
+                        record_2 = wfdb.rdrecord(
+                            record_name,
+                            sampfrom=sampfrom,
+                            channels=channels,
+                            physical=False,
+                            smooth_frames=False,
+                        )
+                        for i, c in enumerate(channels):
+                            np.testing.assert_array_equal(
+                                record_2.e_d_signal[i], record.e_d_signal[c]
+                            )
+
+    def test_fmt8_index(self):
+        """
+        Format 8 signals of an indexed record read from any sample
+        number match the same samples of the entire record.
+        """
+        # Format 8 record with multiple samples per frame and skew
+        sig_len = 500
+        rng = np.random.default_rng(8)
+        rng.integers(-128, 128, sig_len * 3, dtype="int8").tofile(
+            os.path.join(self.temp_path, "fmt8.dat")
+        )
+        with open(os.path.join(self.temp_path, "fmt8.hea"), "w") as f:
+            f.write("fmt8 2 100 %d\n" % sig_len)
+            f.write("fmt8.dat 8x2 200 12 0 -40 0 0 sig0\n")
+            f.write("fmt8.dat 8:3 200 12 0 25 0 0 sig1\n")
+        record_name = os.path.join(self.temp_path, "fmt8")
+
+        # Format 8 has no invalid sample value to pad the skewed signal
+        # beyond the end of the dat file with.
+        record = wfdb.rdrecord(
+            record_name, sampto=497, physical=False, smooth_frames=False
+        )
+
+        # Blocks no longer than the skew of the format 8 signal
+        for chunk_frames in [1, 3]:
+            blocks = list(
+                wfdb.iter_record(
+                    record_name,
+                    chunk_frames,
+                    sampto=497,
+                    physical=False,
+                    smooth_frames=False,
+                )
+            )
+            for ch in range(record.n_sig):
+                np.testing.assert_array_equal(
+                    np.concatenate([signal[ch] for _, signal in blocks]),
+                    record.e_d_signal[ch],
+                )
+
+        wfdb.wr_fmt8_index(record_name, interval=7)
+
+        for sampfrom, sampto in [(1, 20), (7, 14), (13, 400), (250, 497)]:
+            record_2 = wfdb.rdrecord(
+                record_name,
+                sampfrom=sampfrom,
+                sampto=sampto,
+                physical=False,
+                smooth_frames=False,
+            )
+            for ch, spf in enumerate([2, 1]):
+                np.testing.assert_array_equal(
+                    record_2.e_d_signal[ch],
+                    record.e_d_signal[ch][sampfrom * spf : sampto * spf],
+                )
+
+            # Lazily read windows within the range
+            d_signal = wfdb.rdrecord(
+                record_name, sampfrom=sampfrom, sampto=sampto, physical=False
+            ).d_signal
+            record_2 = wfdb.rdrecord(
+                record_name,
+                sampfrom=sampfrom,
+                sampto=sampto,
+                physical=False,
+                lazy=True,
+            )
+            np.testing.assert_array_equal(record_2.d_signal[5:], d_signal[5:])
+
+            for chunk_frames in [2, 30]:
+                blocks = [
+                    signal
+                    for _, signal in wfdb.iter_record(
+                        record_name,
+                        chunk_frames=chunk_frames,
+                        sampfrom=sampfrom,
+                        sampto=sampto,
+                        physical=False,
+                    )
+                ]
+                np.testing.assert_array_equal(np.concatenate(blocks), d_signal)
+
+        # An index which does not match the header is ignored, and the
+        # initial value is taken as the value preceding sampfrom.
+        with open(os.path.join(self.temp_path, "fmt8.hea"), "w") as f:
+            f.write("fmt8 2 100 %d\n" % sig_len)
+            f.write("fmt8.dat 8x2 200 12 0 -39 0 0 sig0\n")
+            f.write("fmt8.dat 8:3 200 12 0 25 0 0 sig1\n")
+        record_2 = wfdb.rdrecord(
+            record_name,
+            sampfrom=100,
+            sampto=200,
+            physical=False,
+            smooth_frames=False,
+        )
+        dif_frames = np.fromfile(record_name + ".dat", dtype="int8")
+        np.testing.assert_array_equal(
+            record_2.e_d_signal[0][:2],
+            dif_frames.reshape(-1, 3)[100, :2].cumsum() - 39,
+        )
+
+        # So is the index of a dat file rewritten with the same size
+        with open(os.path.join(self.temp_path, "fmt8.hea"), "w") as f:
+            f.write("fmt8 2 100 %d\n" % sig_len)
+            f.write("fmt8.dat 8x2 200 12 0 -40 0 0 sig0\n")
+            f.write("fmt8.dat 8:3 200 12 0 25 0 0 sig1\n")
+        dif_frames = rng.integers(-128, 128, sig_len * 3, dtype="int8")
+        dif_frames.tofile(record_name + ".dat")
+        dat_stat = os.stat(record_name + ".dat")
+        os.utime(
+            record_name + ".dat",
+            ns=(dat_stat.st_atime_ns, dat_stat.st_mtime_ns + 10**9),
+        )
+        record_2 = wfdb.rdrecord(
+            record_name,
+            sampfrom=100,
+            sampto=200,
+            physical=False,
+            smooth_frames=False,
+        )
+        np.testing.assert_array_equal(
+            record_2.e_d_signal[0][:2],
+            dif_frames.reshape(-1, 3)[100, :2].cumsum() - 40,
+        )
+
+    def test_signal_cache(self):
+        """
+        Reading records through the decoded signal cache gives the same
+        signals as reading them directly, and reuses the cached blocks.
+        """
+        windows = [(0, 300), (250, 499), (100, 101), (199, 401)]
+        expected = {}
+        for record_name in [
+            "sample-data/100",
+            "sample-data/flacformats",
+            "sample-data/test01_00s_skewframe",
+            "sample-data/03700181",
+        ]:
+            sig_len = wfdb.rdheader(record_name).sig_len
+            for sampfrom, sampto in windows + [(sig_len - 150, sig_len)]:
+                expected[record_name, sampfrom, sampto] = wfdb.rdrecord(
+                    record_name,
+                    sampfrom=sampfrom,
+                    sampto=sampto,
+                    physical=False,
+                    smooth_frames=False,
+                )
+
+        try:
+            wfdb.set_signal_cache(64 * 1024**2, block_frames=100)
+            for (record_name, sampfrom, sampto), record in expected.items():
+                for _ in range(2):
+                    record_2 = wfdb.rdrecord(
+                        record_name,
+                        sampfrom=sampfrom,
+                        sampto=sampto,
+                        physical=False,
+                        smooth_frames=False,
+                    )
+                    assert record_2 == record
+                    # Returned signals do not alter the cache
+                    record_2.e_d_signal[0][:] = 0
+            info = wfdb.signal_cache_info()
+            assert info.hits > info.misses > 0
+            assert 0 < info.n_bytes <= info.max_bytes
+
+            # Blocks are evicted to stay within the budget
+            wfdb.set_signal_cache(1000, block_frames=100)
+            for sampfrom, sampto in windows:
+                record_2 = wfdb.rdrecord(
+                    "sample-data/100",
+                    sampfrom=sampfrom,
+                    sampto=sampto,
+                    physical=False,
+                    smooth_frames=False,
+                )
+                assert record_2 == expected["sample-data/100", sampfrom, sampto]
+            info = wfdb.signal_cache_info()
+            assert info.hits == 2
+            assert info.n_blocks == 2 and info.n_bytes <= 1000
+
+            # Modified dat files are read again
+            record_name = os.path.join(self.temp_path, "cached")
+            for value in [1, 2]:
+                wfdb.wrsamp(
+                    "cached",
+                    fs=100,
+                    units=["mV"],
+                    sig_name=["sig"],
+                    d_signal=np.full((100, 1), value, dtype="int16"),
+                    fmt=["16"],
+                    adc_gain=[200.0],
+                    baseline=[0],
+                    write_dir=self.temp_path,
+                )
+                os.utime(record_name + ".dat", ns=(value, value))
+                record_2 = wfdb.rdrecord(record_name, physical=False)
+                assert (record_2.d_signal == value).all()
+        finally:
+            wfdb.set_signal_cache(0)
+
+    def test_rdrecords(self):
+        """
+        Reading records in parallel gives the same records, in order, as
+        reading them one at a time.
+        """
+        record_names = [
+            "sample-data/100",
+            "sample-data/test01_00s_skewframe",
+            "sample-data/flacformats",
+            "sample-data/multi-segment/fixed1/v102s",
+        ]
+        for kwargs in [
+            {"sampto": 499, "physical": False},
+            {"sampto": 400, "smooth_frames": False},
+        ]:
+            expected = [wfdb.rdrecord(name, **kwargs) for name in record_names]
+            for executor in ["thread", "process"]:
+                records = wfdb.rdrecords(
+                    record_names, n_workers=3, executor=executor, **kwargs
+                )
+                assert records == expected
+
+        # Whole signals are passed back through shared memory
+        records = wfdb.rdrecords(
+            ["sample-data/100", "sample-data/100"],
+            n_workers=2,
+            executor="process",
+        )
+        expected = wfdb.rdrecord("sample-data/100")
+        assert records[0].p_signal.nbytes >= wfdb.io.SHARED_MEMORY_MIN_BYTES
+        assert not records[0].p_signal.flags.owndata
+        assert records == [expected, expected]
+
+        with self.assertRaises(FileNotFoundError):
+            wfdb.rdrecords(
+                ["sample-data/100", "sample-data/no-such-record"],
+                n_workers=2,
+                executor="process",
+            )
+        with self.assertRaises(ValueError):
+            wfdb.rdrecords(record_names, executor="fork")
+
+    def test_header_field_defaults(self):
+        """
+        Missing header fields are given their read defaults, a baseline
+        defaults to the ADC zero, and an ADC gain of 0 means 200.
+        """
+        with open(os.path.join(self.temp_path, "fields.hea"), "w") as f:
+            f.write(
+                "fields 4 250.0 1000 10:20:30 01/02/2003\n"
+                "fields.dat 16\n"
+                "fields.dat 16x2:1+24 0(-5)/uV 12 7 -3 10 0 ECG lead II\n"
+                "fields.dat 16 100/mV 12 7\n"
+                "fields.dat 80 5.5 8\n"
+                "# comment\n"
+            )
+        record = wfdb.rdheader(os.path.join(self.temp_path, "fields"))
+        assert record.fs == 250 and isinstance(record.fs, int)
+        assert record.base_datetime == datetime.datetime(2003, 2, 1, 10, 20, 30)
+        assert record.fmt == ["16", "16", "16", "80"]
+        assert record.samps_per_frame == [1, 2, 1, 1]
+        assert record.skew == [None, 1, None, None]
+        assert record.byte_offset == [None, 24, None, None]
+        assert record.adc_gain == [200.0, 200.0, 100.0, 5.5]
+        assert record.baseline == [0, -5, 7, 0]
+        assert record.units == ["mV", "uV", "mV", "mV"]
+        assert record.adc_res == [None, 12, 12, 8]
+        assert record.adc_zero == [None, 7, 7, None]
+        assert record.init_value == [None, -3, None, None]
+        assert record.sig_name == [None, "ECG lead II", None, None]
+        assert record.comments == ["comment"]
+
+    def test_header_cache(self):
+        """
+        Reading headers through the parsed header cache gives the same
+        records as parsing them directly, and returns independent copies.
+        """
+        record_names = [
+            "sample-data/100",
+            "sample-data/test01_00s_skewframe",
+            "sample-data/multi-segment/fixed1/v102s",
+            "sample-data/multi-segment/s00001/s00001-2896-10-10-00-31",
+        ]
+        expected = {}
+        for record_name in record_names:
+            for rd_segments in [False, True]:
+                expected[record_name, rd_segments] = wfdb.rdheader(
+                    record_name, rd_segments=rd_segments
+                )
+
+        try:
+            wfdb.set_header_cache(1000)
+            for (record_name, rd_segments), record in expected.items():
+                for _ in range(2):
+                    record_2 = wfdb.rdheader(
+                        record_name, rd_segments=rd_segments
+                    )
+                    # MultiRecord has no equality operator
+                    assert type(record_2) == type(record)
+                    fields = vars(record).copy()
+                    fields_2 = vars(record_2).copy()
+                    assert fields_2.pop("segments", None) == fields.pop(
+                        "segments", None
+                    )
+                    assert fields_2 == fields
+                    # Returned records do not alter the cache
+                    record_2.comments.append("modified")
+                    record_2.fs = 1
+            info = wfdb.header_cache_info()
+            assert info.hits > info.misses > 0
+            assert info.n_headers == info.misses
+
+            # Headers are evicted to stay within the capacity
+            wfdb.set_header_cache(2)
+            for record_name in record_names[:3]:
+                wfdb.rdheader(record_name)
+            assert wfdb.header_cache_info().n_headers == 2
+            wfdb.rdheader(record_names[0])
+            assert wfdb.header_cache_info().hits == 0
+
+            # Modified header files are parsed again
+            record_name = os.path.join(self.temp_path, "cached")
+            for fs in [100, 200]:
+                wfdb.wrsamp(
+                    "cached",
+                    fs=fs,
+                    units=["mV"],
+                    sig_name=["sig"],
+                    d_signal=np.zeros((100, 1), dtype="int16"),
+                    fmt=["16"],
+                    adc_gain=[200.0],
+                    baseline=[0],
+                    write_dir=self.temp_path,
+                )
+                os.utime(record_name + ".hea", ns=(fs, fs))
+                assert wfdb.rdheader(record_name).fs == fs
+
+            wfdb.clear_header_cache()
+            assert wfdb.header_cache_info() == (0, 0, 2, 0)
+        finally:
+            wfdb.set_header_cache(0)
+
+    def test_read_out(self):
+        """
+        Reading a record into a view of a larger array gives the same
+        signal as reading it normally, and leaves the rest untouched.
+        """
+        for record_name, kwargs in [
+            ("sample-data/100", {"sampfrom": 100, "sampto": 10000}),
+            ("sample-data/test01_00s_skewframe", {"channels": [2, 1]}),
+            ("sample-data/binformats", {"sampfrom": 7}),
+            ("sample-data/multi-segment/fixed1/v102s", {"sampto": 60000}),
+        ]:
+            for physical, return_res, dtype in [
+                (True, 64, "float64"),
+                (True, 32, "float32"),
+                (False, 32, "int32"),
+            ]:
+                record = wfdb.rdrecord(
+                    record_name,
+                    physical=physical,
+                    return_res=return_res,
+                    **kwargs,
+                )
+                signal = record.p_signal if physical else record.d_signal
+                batch = np.zeros((2, *signal.shape), dtype=dtype)
+                record_2 = wfdb.rdrecord(
+                    record_name, physical=physical, out=batch[1], **kwargs
+                )
+                signal_2 = record_2.p_signal if physical else record_2.d_signal
+                assert signal_2.base is batch
+                np.testing.assert_array_equal(batch[1], signal)
+                assert not batch[0].any()
+                if not physical:
+                    self.assertEqual(record.checksum, record_2.checksum)
+                    self.assertEqual(record.init_value, record_2.init_value)
+
+        with self.assertRaises(ValueError):
+            wfdb.rdrecord("sample-data/100", out=np.empty((10, 2)))
+        with self.assertRaises(TypeError):
+            wfdb.rdrecord(
+                "sample-data/100", physical=False, out=np.empty((650000, 2))
+            )
+        # Integer dtypes must hold the digital range of the formats read
+        wfdb.rdrecord(
+            "sample-data/100",
+            physical=False,
+            sampto=1000,
+            out=np.empty((1000, 2), dtype="int16"),
+        )
+        for record_name in [
+            "sample-data/100",
+            "sample-data/multi-segment/fixed1/v102s",
+        ]:
+            n_sig = wfdb.rdheader(record_name).n_sig
+            with self.assertRaises(TypeError):
+                wfdb.rdrecord(
+                    record_name,
+                    physical=False,
+                    sampto=1000,
+                    out=np.empty((1000, n_sig), dtype="int8"),
+                )
+
     @classmethod
     def setUpClass(cls):
         cls.temp_directory = tempfile.TemporaryDirectory()
@@ -961,6 +1865,68 @@ def test_multi_variable_d(self):
         assert record.__eq__(record_pn)
         assert record.__eq__(record_named)
 
+    def test_multi_n_workers(self):
+        """
+        Reading the segments of multi-segment records concurrently gives
+        the same result as converting the individually read segments.
+        """
+        for record_name, kwargs in [
+            ("sample-data/multi-segment/fixed1/v102s", {}),
+            (
+                "sample-data/multi-segment/s00001/s00001-2896-10-10-00-31",
+                {"sampto": 100000, "channels": [3, 1], "force_channels": False},
+            ),
+        ]:
+            for smooth_frames in [True, False]:
+                multi_record = wfdb.rdrecord(
+                    record_name,
+                    smooth_frames=smooth_frames,
+                    m2s=False,
+                    **kwargs,
+                )
+                record = multi_record.multi_to_single(
+                    physical=True, expanded=not smooth_frames
+                )
+                for n_workers in [1, 4]:
+                    record_2 = wfdb.rdrecord(
+                        record_name,
+                        smooth_frames=smooth_frames,
+                        n_workers=n_workers,
+                        **kwargs,
+                    )
+                    assert record.__eq__(record_2)
+
+    def test_multi_iter_record(self):
+        """
+        Blocks of multi-segment records, spanning segment boundaries,
+        match reading the entire range.
+        """
+        for record_name, kwargs in [
+            ("sample-data/multi-segment/fixed1/v102s", {"sampto": 60000}),
+            (
+                "sample-data/multi-segment/s25047/s25047-2704-05-04-10-44",
+                {"sampto": 100000, "channels": [2, 0]},
+            ),
+            (
+                "sample-data/multi-segment/p000878/p000878-2137-10-26-16-57",
+                {
+                    "sampfrom": 3550,
+                    "sampto": 7500,
+                    "channels": [0, 1],
+                    "physical": False,
+                },
+            ),
+        ]:
+            record = wfdb.rdrecord(record_name, **kwargs)
+            if kwargs.get("physical", True):
+                target = record.p_signal
+            else:
+                target = record.d_signal
+            blocks = list(wfdb.iter_record(record_name, 7001, **kwargs))
+            signal = np.concatenate([block for _, block in blocks])
+            self.assertEqual(signal.dtype, target.dtype)
+            np.testing.assert_array_equal(signal, target)
+
 
 class TestTimeConversion(unittest.TestCase):
     """
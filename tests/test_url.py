@@ -1,8 +1,15 @@
 import gzip
+import hashlib
 import http.server
+import os
+import tempfile
 import threading
 import unittest
+import unittest.mock
 
+import numpy as np
+
+import wfdb
 import wfdb.io._url
 
 
@@ -252,6 +259,355 @@ def test_whole_file(self):
         np.testing.assert_array_equal(data1, data2)
 
 
+class TestTransfers(unittest.TestCase):
+    """
+    Test the options of remote transfers.
+    """
+
+    def tearDown(self):
+        wfdb.set_transfer_options()
+
+    def test_reset_session(self):
+        """
+        Changing the transfer options closes the previous session.
+        """
+        session = wfdb.io._url._get_session()
+        with unittest.mock.patch.object(session, "close") as close:
+            wfdb.set_transfer_options(max_connections=2)
+        close.assert_called_once_with()
+        self.assertIsNot(wfdb.io._url._get_session(), session)
+
+    def test_parts(self):
+        """
+        Large ranges are read as parts requested concurrently, and
+        requests are retried after transient errors.
+        """
+        content = np.random.default_rng(0).bytes(10000)
+        wfdb.set_transfer_options(
+            max_connections=4, part_size=1000, backoff_factor=0
+        )
+        for allow_range in (False, True):
+            with DummyHTTPServer(
+                {"/foo.dat": content}, allow_range=allow_range
+            ) as server:
+                url = server.url("/foo.dat")
+                with wfdb.io._url.openurl(url, "rb", buffering=0) as bf:
+                    bf.seek(500)
+                    self.assertEqual(bf.read(8000), content[500:8500])
+                    bf.seek(9500)
+                    self.assertEqual(bf.read(2000), content[9500:])
+                    self.assertEqual(bf.read(2000), b"")
+                # 8 parts, 1 at the end of the file, and 1 after it
+                if allow_range:
+                    self.assertEqual(server.n_requests, 10)
+
+                server.n_failures = 2
+                with wfdb.io._url.openurl(url, "rb") as bf:
+                    self.assertEqual(bf.read(), content)
+
+                server.n_failures = 4
+                with self.assertRaises(wfdb.io._url.NetFileError):
+                    with wfdb.io._url.openurl(url, "rb") as bf:
+                        bf.read()
+
+    def test_read_ahead(self):
+        """
+        Sequential reads are served from ranges read ahead, which grow
+        as they are used, and other reads are not affected.
+        """
+        content = np.random.default_rng(0).bytes(1000000)
+        with DummyHTTPServer({"/foo.dat": content}) as server:
+            url = server.url("/foo.dat")
+            with wfdb.io._url.openurl(url, "rb") as bf:
+                result = b""
+                while True:
+                    chunk = bf.read(50000)
+                    result += chunk
+                    if len(chunk) < 50000:
+                        break
+                self.assertEqual(result, content)
+                self.assertLess(server.n_requests, 10)
+
+                bf.seek(123)
+                self.assertEqual(bf.read(1000), content[123:1123])
+                bf.seek(500000)
+                chunk = bytearray(70000)
+                for start in range(500000, 1000000, 70000):
+                    count = bf.readinto(chunk)
+                    self.assertEqual(
+                        chunk[:count], content[start : start + 70000]
+                    )
+
+    def test_read_into_arrays(self):
+        """
+        Remote dat ranges, annotation files, and downloaded files are
+        read into their destination chunk by chunk.
+        """
+        content = np.random.default_rng(0).bytes(100001)
+        file_content = {
+            "/db/1.0.0/foo.dat": content,
+            "/db/1.0.0/foo.atr": content,
+            "/db/1.0.0/bar.atr": content[:1001],
+        }
+        with DummyHTTPServer(file_content) as server:
+            wfdb.set_db_index_url(server.url())
+            try:
+                sig_data = wfdb.io.download._stream_dat(
+                    "foo.dat", "db/1.0.0", 60000, 40001, np.dtype("<i2")
+                )
+                np.testing.assert_array_equal(
+                    sig_data, np.frombuffer(content[40001:], "<i2")
+                )
+                self.assertTrue(sig_data.flags.writeable)
+                for file_name, file_data in [
+                    ("foo.atr", content),
+                    ("bar.atr", content[:1001]),
+                ]:
+                    np.testing.assert_array_equal(
+                        wfdb.io.download._stream_annotation(
+                            file_name, "db/1.0.0"
+                        ),
+                        np.frombuffer(file_data, "<u1"),
+                    )
+            finally:
+                wfdb.set_db_index_url()
+
+            with tempfile.TemporaryDirectory() as dl_dir:
+                local_file = os.path.join(dl_dir, "foo.dat")
+                with unittest.mock.patch.object(
+                    wfdb.io.download, "DOWNLOAD_CHUNK_SIZE", 7000
+                ):
+                    wfdb.io.download.dl_full_file(
+                        server.url("/db/1.0.0/foo.dat"), local_file
+                    )
+                    with open(local_file, "rb") as f:
+                        self.assertEqual(f.read(), content)
+
+                    # Partially downloaded files are completed
+                    with open(local_file, "r+b") as f:
+                        f.truncate(12345)
+                    wfdb.set_db_index_url(server.url())
+                    try:
+                        wfdb.io.download.dl_pn_file(
+                            ["foo.dat", "", "db/1.0.0", dl_dir, True, False]
+                        )
+                    finally:
+                        wfdb.set_db_index_url()
+                    with open(local_file, "rb") as f:
+                        self.assertEqual(f.read(), content)
+
+    def test_multi_segment(self):
+        """
+        The segment headers and dat file ranges of a remote multi-segment
+        record are each requested once, and ranges of a dat file shared
+        by several segments are coalesced into a single request.
+        """
+        # Record, directory, and number of requests: the record header,
+        # segment headers, and dat files of each segment
+        records = [
+            ("s25047-2704-05-04-10-44", "s25047", 1 + 19 + 18),
+            ("v102s", "fixed1", 1 + 3 + 1),
+        ]
+        for record_name, dir_name, n_requests in records:
+            local_dir = os.path.join("sample-data", "multi-segment", dir_name)
+            file_content = {}
+            for file_name in os.listdir(local_dir):
+                with open(os.path.join(local_dir, file_name), "rb") as f:
+                    file_content["/db/1.0.0/" + file_name] = f.read()
+            with DummyHTTPServer(file_content, allow_gzip=False) as server:
+                wfdb.set_db_index_url(server.url())
+                try:
+                    record = wfdb.rdrecord(
+                        record_name, pn_dir="db/1.0.0", sampfrom=100
+                    )
+                finally:
+                    wfdb.set_db_index_url()
+                self.assertEqual(server.n_requests, n_requests)
+
+            record_local = wfdb.rdrecord(
+                os.path.join(local_dir, record_name), sampfrom=100
+            )
+            np.testing.assert_array_equal(
+                record.p_signal, record_local.p_signal
+            )
+
+    def test_range_plan(self):
+        """
+        A range plan only holds a bounded number of bytes ahead of its
+        reads, and is only used by the thread which entered it and by
+        the workers it wraps.
+        """
+        content = np.random.default_rng(0).bytes(1000000)
+        starts = [0, 200000, 400000, 600000]
+        with DummyHTTPServer({"/foo.dat": content}) as server:
+            url = server.url("/foo.dat")
+            with unittest.mock.patch.object(
+                wfdb.io.download, "PLAN_MAX_BYTES", 1500
+            ):
+                with wfdb.io.download._RangePlan() as plan:
+                    for start in starts:
+                        plan.add(url, start, start + 1000)
+                    plan.fetch()
+                    self.assertEqual(plan._n_bytes, 2000)
+
+                    def planned_read(start):
+                        return wfdb.io.download._planned_read(
+                            url, start, start + 1000
+                        )
+
+                    # The last range is fetched as soon as it is read
+                    self.assertEqual(
+                        bytes(planned_read(600000)), content[600000:601000]
+                    )
+                    self.assertEqual(bytes(planned_read(0)), content[:1000])
+                    self.assertEqual(plan._n_bytes, 2000)
+
+                    results = []
+                    thread = threading.Thread(
+                        target=lambda: results.append(planned_read(200000))
+                    )
+                    thread.start()
+                    thread.join()
+                    self.assertIsNone(results[0])
+
+                    thread = threading.Thread(
+                        target=wfdb.io.download._with_plan(
+                            lambda: results.append(planned_read(200000))
+                        )
+                    )
+                    thread.start()
+                    thread.join()
+                    self.assertEqual(bytes(results[1]), content[200000:201000])
+                self.assertIsNone(plan.read(url, 400000, 401000))
+                self.assertIsNone(planned_read(400000))
+            self.assertEqual(server.n_requests, 4)
+
+
+class TestRemoteCache(unittest.TestCase):
+    """
+    Test the persistent cache of remote files.
+    """
+
+    def setUp(self):
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.cache_dir = os.path.join(self.temp_dir.name, "cache")
+
+    def tearDown(self):
+        wfdb.set_remote_cache(None)
+        wfdb.set_db_index_url()
+        self.temp_dir.cleanup()
+
+    def test_ranges(self):
+        """
+        Reading ranges of a remote file only downloads the blocks that
+        are not cached, and files that change on the server are
+        downloaded again.
+        """
+        block_size = wfdb.io._remote_cache.CACHE_BLOCK_SIZE
+        content = np.random.default_rng(0).bytes(block_size * 5 // 2)
+        with DummyHTTPServer({"/foo.dat": content}) as server:
+            url = server.url("/foo.dat")
+            wfdb.set_remote_cache(self.cache_dir)
+
+            # Part of the second block
+            with wfdb.io._url.openurl(url, "rb", buffering=0) as bf:
+                bf.seek(block_size + 100)
+                self.assertEqual(
+                    bf.read(1000), content[block_size + 100 : block_size + 1100]
+                )
+            self.assertEqual(server.n_requests, 1)
+
+            # The whole file, by another process using the directory
+            wfdb.set_remote_cache(self.cache_dir)
+            with wfdb.io._url.openurl(url, "rb") as bf:
+                self.assertEqual(bf.read(), content)
+                self.assertEqual(bf.seek(0, os.SEEK_END), len(content))
+            self.assertEqual(server.n_requests, 3)
+            info = wfdb.remote_cache_info()
+            self.assertEqual((info.hits, info.misses), (1, 2))
+            self.assertEqual((info.n_bytes, info.n_blocks), (len(content), 3))
+
+            # Changed content is detected once max_age has passed
+            new_content = content[::-1]
+            server.file_content["/foo.dat"] = new_content
+            with wfdb.io._url.openurl(url, "rb") as bf:
+                self.assertEqual(bf.read(), content)
+            wfdb.set_remote_cache(self.cache_dir, max_age=0)
+            with wfdb.io._url.openurl(url, "rb") as bf:
+                self.assertEqual(bf.read(), new_content)
+            info = wfdb.remote_cache_info()
+            self.assertEqual((info.hits, info.misses), (0, 3))
+            self.assertEqual(info.n_blocks, 3)
+
+            # A read never mixes two versions of a file: a file changed
+            # on the server is read again, or if blocks of the old
+            # version have already been returned, the read fails
+            wfdb.set_remote_cache(self.cache_dir)
+            for file_name, cached_start in [
+                ("/baz.dat", block_size),
+                ("/qux.dat", 0),
+            ]:
+                server.file_content[file_name] = content
+                with wfdb.io._url.openurl(
+                    server.url(file_name), "rb", buffering=0
+                ) as bf:
+                    bf.seek(cached_start)
+                    self.assertEqual(
+                        bf.read(100), content[cached_start : cached_start + 100]
+                    )
+                server.file_content[file_name] = new_content
+                with wfdb.io._url.openurl(server.url(file_name), "rb") as bf:
+                    if cached_start:
+                        self.assertEqual(bf.read(), new_content)
+                    else:
+                        with self.assertRaises(wfdb.io._url.NetFileError):
+                            bf.read()
+                with wfdb.io._url.openurl(server.url(file_name), "rb") as bf:
+                    self.assertEqual(bf.read(), new_content)
+
+            # The least recently used blocks are evicted
+            wfdb.set_remote_cache(self.cache_dir, max_bytes=block_size * 2)
+            server.file_content["/bar.dat"] = content
+            with wfdb.io._url.openurl(server.url("/bar.dat"), "rb") as bf:
+                self.assertEqual(bf.read(), content)
+            self.assertLessEqual(
+                wfdb.remote_cache_info().n_bytes, block_size * 2
+            )
+
+            wfdb.clear_remote_cache()
+            self.assertEqual(wfdb.remote_cache_info().n_blocks, 0)
+
+    def test_record(self):
+        """
+        Reading a remote record again does not download any file.
+        """
+        file_content = {}
+        for file_name in ["100.hea", "100.dat", "100.atr"]:
+            with open(os.path.join("sample-data", file_name), "rb") as f:
+                file_content["/db/1.0.0/" + file_name] = f.read()
+        with DummyHTTPServer(file_content, allow_gzip=False) as server:
+            wfdb.set_db_index_url(server.url())
+            wfdb.set_remote_cache(self.cache_dir)
+            record = wfdb.rdrecord("100", pn_dir="db/1.0.0", sampto=1000)
+            annotation = wfdb.rdann(
+                "100", "atr", pn_dir="db/1.0.0", sampto=1000
+            )
+            n_requests = server.n_requests
+
+            record_cached = wfdb.rdrecord("100", pn_dir="db/1.0.0", sampto=1000)
+            annotation_cached = wfdb.rdann(
+                "100", "atr", pn_dir="db/1.0.0", sampto=1000
+            )
+            self.assertEqual(server.n_requests, n_requests)
+
+        np.testing.assert_array_equal(record_cached.p_signal, record.p_signal)
+        np.testing.assert_array_equal(
+            annotation_cached.sample, annotation.sample
+        )
+        record_local = wfdb.rdrecord("sample-data/100", sampto=1000)
+        np.testing.assert_array_equal(record.p_signal, record_local.p_signal)
+
+
 class DummyHTTPServer(http.server.HTTPServer):
     """
     HTTPServer used to simulate a web server for testing.
@@ -279,6 +635,11 @@ class DummyHTTPServer(http.server.HTTPServer):
         server should listen for connections.  If the port is 0, an
         arbitrary unused port is selected.  The default address is
         "127.0.0.1" and the default port is 0.
+    n_requests : int
+        The number of requests handled by the server.
+    n_failures : int
+        The number of following requests to which the server should
+        respond with 503 Service Unavailable.
 
     """
 
@@ -293,6 +654,8 @@ def __init__(
         self.file_content = file_content
         self.allow_gzip = allow_gzip
         self.allow_range = allow_range
+        self.n_requests = 0
+        self.n_failures = 0
 
     def url(self, path="/"):
         """
@@ -343,12 +706,20 @@ def log_message(self, message, *args):
         pass
 
     def send_head(self):
+        self.server.n_requests += 1
+        if self.server.n_failures > 0:
+            self.server.n_failures -= 1
+            self.send_error(503)
+            return b""
         content = self.server.file_content.get(self.path)
         if content is None:
             self.send_error(404)
             return b""
 
-        headers = {"Content-Type": "text/plain"}
+        headers = {
+            "Content-Type": "text/plain",
+            "ETag": '"%s"' % hashlib.md5(content).hexdigest(),
+        }
         status = 200
 
         if self.server.allow_gzip:
@@ -1,15 +1,27 @@
 from wfdb.io.record import (
     Record,
     MultiRecord,
+    RecordWriter,
     rdheader,
     rdrecord,
+    rdrecords,
     rdsamp,
+    iter_record,
     wrsamp,
+    wr_fmt8_index,
     dl_database,
     sampfreq,
     signame,
     wfdbdesc,
     wfdbtime,
+    set_header_cache,
+    header_cache_info,
+    clear_header_cache,
+)
+from wfdb.io._signal import (
+    set_signal_cache,
+    signal_cache_info,
+    clear_signal_cache,
 )
 from wfdb.io.annotation import (
     Annotation,
@@ -24,6 +36,10 @@
     get_dbs,
     get_record_list,
     set_db_index_url,
+    set_transfer_options,
+    set_remote_cache,
+    remote_cache_info,
+    clear_remote_cache,
 )
 
 
@@ -39,4 +55,6 @@
 
 from wfdb.plot.plot import plot_items, plot_wfdb, plot_all_records
 
+from wfdb import dataset
+
 from wfdb.version import __version__
@@ -0,0 +1,6 @@
+"""
+The dataset subpackage contains tools for sampling windows of the
+signals of WFDB databases, such as for training models.
+"""
+
+from wfdb.dataset.windows import WindowDataset, WindowRange
@@ -0,0 +1,400 @@
+import collections
+import multiprocessing.dummy
+import os
+
+import numpy as np
+
+from wfdb.io import record as wfdb_record
+
+
+# A range of frames of a record, contained in a single segment, in
+# which all of the signals of a dataset are present
+WindowRange = collections.namedtuple(
+    "WindowRange", ["record_name", "seg_name", "sig_name", "start", "stop"]
+)
+
+
+class WindowDataset(object):
+    """
+    Fixed-length windows of the signals of the records of a local WFDB
+    database, addressed by a global index.
+
+    The headers of the records are read once, when the dataset is
+    created, to build an index of the frame ranges in which all of the
+    requested signals are present. Each window is then read with
+    `rdrecord` from a single segment. Windows do not span segment
+    boundaries, or gaps in the requested signals of multi-segment
+    records.
+
+    Parameters
+    ----------
+    db_dir : str
+        The local directory of the database.
+    window_len : int
+        The number of frames of each window.
+    sig_name : list, optional
+        The names of the signals to read, in the order of the channels of
+        the windows. Only the parts of records which contain all of them
+        are used. By default, all of the signals of each record are read,
+        so the number of channels may differ between records.
+    stride : int, optional
+        The number of frames between the starts of consecutive windows of
+        a range. By default, windows do not overlap.
+    record_names : list, optional
+        The names of the records to use, relative to `db_dir`. By
+        default, the records listed in the database's RECORDS file, or
+        if there is none, every record whose header is found in `db_dir`
+        or its subdirectories, except for the segments of multi-segment
+        records.
+    physical : bool, optional
+        Specifies whether to return signals in physical units (True), or
+        digital units (False).
+    return_res : int, optional
+        The numpy array dtype of the returned signals. Options are: 64,
+        32, 16, and 8, where the value represents the numpy int or float
+        dtype. Note that the value cannot be 8 when physical is True
+        since there is no float8 format.
+
+    Attributes
+    ----------
+    ranges : list
+        The `WindowRange` tuples of record name, segment name, signal
+        names, and start and stop frames (relative to the start of the
+        record) of the ranges from which windows are taken.
+
+    Notes
+    -----
+    Windows of format 8 signals are only correct if their dat files have
+    been indexed with `wr_fmt8_index`, or if they start at the start of
+    their segment.
+
+    Examples
+    --------
+    >>> dataset = wfdb.dataset.WindowDataset('mitdb', window_len=3600,
+                                             sig_name=['MLII'])
+    >>> for signal in dataset.iter_windows(shuffle=True, n_workers=4):
+    ...     train_step(signal)
+
+    """
+
+    def __init__(
+        self,
+        db_dir,
+        window_len,
+        sig_name=None,
+        stride=None,
+        record_names=None,
+        physical=True,
+        return_res=64,
+    ):
+        if not hasattr(window_len, "__index__") or window_len < 1:
+            raise ValueError("window_len must be a positive integer")
+        if stride is None:
+            stride = window_len
+        elif not hasattr(stride, "__index__") or stride < 1:
+            raise ValueError("stride must be a positive integer")
+        if return_res not in [64, 32, 16, 8]:
+            raise ValueError(
+                "return_res must be one of the following: 64, 32, 16, 8"
+            )
+        if physical and return_res == 8:
+            raise ValueError(
+                "return_res must be one of the following when physical is True: 64, 32, 16"
+            )
+
+        self.db_dir = db_dir
+        self.window_len = window_len
+        self.sig_name = sig_name
+        self.stride = stride
+        self.physical = physical
+        self.return_res = return_res
+
+        if record_names is None:
+            record_names = _find_record_names(db_dir)
+
+        self.ranges = []
+        # The path, channels, and start frame of the segment of each
+        # range
+        self._segments = []
+        for record_name in record_names:
+            self._index_record(record_name)
+
+        n_windows = [
+            max(0, (r.stop - r.start - window_len) // stride + 1)
+            for r in self.ranges
+        ]
+        # The global index of the first window after each range
+        self._range_ends = np.cumsum(n_windows, dtype="int64")
+
+    def _index_record(self, record_name):
+        """
+        Add the ranges of a record which contain the signals of the
+        dataset to its index.
+
+        Parameters
+        ----------
+        record_name : str
+            The name of the record, relative to `db_dir`.
+
+        Returns
+        -------
+        N/A
+
+        """
+        record = wfdb_record.rdheader(
+            os.path.join(self.db_dir, record_name), rd_segments=True
+        )
+        sig_name = self.sig_name
+        if isinstance(record, wfdb_record.Record):
+            if sig_name is None:
+                sig_name = record.sig_name
+            elif not set(sig_name).issubset(record.sig_name):
+                return
+            sig_len = record.sig_len
+            if sig_len is None:
+                sig_len = wfdb_record._infer_record_sig_len(
+                    record,
+                    os.path.abspath(
+                        os.path.dirname(os.path.join(self.db_dir, record_name))
+                    ),
+                )
+            if sig_len:
+                self._add_range(
+                    record_name, None, sig_name, record, 0, sig_len, 0
+                )
+            return
+
+        if sig_name is None:
+            sig_name = [s for s in record.sig_name if s is not None]
+        contained = record.contained_combined_ranges(sig_name)
+        seg_start = 0
+        for seg_name, seg_len, segment in zip(
+            record.seg_name, record.seg_len, record.segments
+        ):
+            seg_stop = seg_start + seg_len
+            if segment is not None and seg_len:
+                for start, stop in contained:
+                    start = max(start, seg_start)
+                    stop = min(stop, seg_stop)
+                    if start < stop:
+                        self._add_range(
+                            record_name,
+                            seg_name,
+                            sig_name,
+                            segment,
+                            start,
+                            stop,
+                            seg_start,
+                        )
+            seg_start = seg_stop
+
+    def _add_range(
+        self, record_name, seg_name, sig_name, segment, start, stop, seg_start
+    ):
+        """
+        Add a range of frames of a single segment to the index.
+
+        Parameters
+        ----------
+        record_name : str
+            The name of the record, relative to `db_dir`.
+        seg_name : str
+            The name of the segment, or None for single segment records.
+        sig_name : list
+            The names of the signals to read.
+        segment : Record
+            The header of the segment.
+        start : int
+            The frame at which the range starts, relative to the record.
+        stop : int
+            The frame at which the range stops, relative to the record.
+        seg_start : int
+            The frame at which the segment starts, relative to the record.
+
+        Returns
+        -------
+        N/A
+
+        """
+        channels = [segment.sig_name.index(name) for name in sig_name]
+        if seg_name is None:
+            seg_path = os.path.join(self.db_dir, record_name)
+        else:
+            seg_path = os.path.join(
+                self.db_dir, os.path.dirname(record_name), seg_name
+            )
+        self.ranges.append(
+            WindowRange(record_name, seg_name, list(sig_name), start, stop)
+        )
+        self._segments.append((seg_path, channels, seg_start))
+
+    def __len__(self):
+        return int(self._range_ends[-1]) if len(self._range_ends) else 0
+
+    def locate(self, index):
+        """
+        Find the location of a window in the database.
+
+        Parameters
+        ----------
+        index : int
+            The global index of the window.
+
+        Returns
+        -------
+        record_name : str
+            The name of the record, relative to `db_dir`.
+        start : int
+            The frame of the record at which the window starts.
+        sig_name : list
+            The names of the signals of the window.
+
+        """
+        range_num, start = self._locate(index)
+        window_range = self.ranges[range_num]
+        return window_range.record_name, start, window_range.sig_name
+
+    def _locate(self, index):
+        """
+        Return the number of the range containing a window, and the
+        frame of the record at which the window starts.
+
+        """
+        if not hasattr(index, "__index__"):
+            raise TypeError("window indices must be integers")
+        n_windows = len(self)
+        if index < 0:
+            index += n_windows
+        if not 0 <= index < n_windows:
+            raise IndexError("window index out of range")
+        range_num = int(np.searchsorted(self._range_ends, index, side="right"))
+        if range_num:
+            index -= int(self._range_ends[range_num - 1])
+        return range_num, self.ranges[range_num].start + index * self.stride
+
+    def __getitem__(self, index):
+        """
+        Read a window.
+
+        Parameters
+        ----------
+        index : int
+            The global index of the window.
+
+        Returns
+        -------
+        signal : ndarray
+            The (window_len x n_sig) signals of the window.
+
+        """
+        range_num, start = self._locate(index)
+        seg_path, channels, seg_start = self._segments[range_num]
+        segment = wfdb_record.rdrecord(
+            seg_path,
+            sampfrom=start - seg_start,
+            sampto=start - seg_start + self.window_len,
+            channels=channels,
+            physical=self.physical,
+            return_res=self.return_res,
+        )
+        return segment.p_signal if self.physical else segment.d_signal
+
+    def iter_windows(
+        self, indices=None, shuffle=False, seed=None, n_workers=1, prefetch=8
+    ):
+        """
+        Iterate over windows, reading the following windows ahead in
+        background threads.
+
+        Parameters
+        ----------
+        indices : list, optional
+            The global indices of the windows to read, in order. All of
+            the windows by default.
+        shuffle : bool, optional
+            Whether to read the windows in a random order.
+        seed : int, optional
+            The seed of the random order, if `shuffle` is True.
+        n_workers : int, optional
+            The number of threads reading windows.
+        prefetch : int, optional
+            The maximum number of windows read ahead of the one being
+            consumed.
+
+        Returns
+        -------
+        windows : generator
+            Generator of the (window_len x n_sig) signals of each window.
+
+        """
+        if indices is None:
+            indices = np.arange(len(self))
+        else:
+            indices = np.asarray(indices, dtype="int64")
+        if shuffle:
+            indices = np.random.default_rng(seed).permutation(indices)
+        if not hasattr(n_workers, "__index__") or n_workers < 1:
+            raise ValueError("n_workers must be a positive integer")
+        if not hasattr(prefetch, "__index__") or prefetch < 1:
+            raise ValueError("prefetch must be a positive integer")
+
+        return self._iter_windows(indices.tolist(), n_workers, prefetch)
+
+    def _iter_windows(self, indices, n_workers, prefetch):
+        """
+        Generator of the windows of `iter_windows`.
+
+        """
+        with multiprocessing.dummy.Pool(processes=n_workers) as pool:
+            pending = collections.deque()
+            for index in indices:
+                pending.append(pool.apply_async(self.__getitem__, (index,)))
+                if len(pending) > prefetch:
+                    yield pending.popleft().get()
+            while pending:
+                yield pending.popleft().get()
+
+
+def _find_record_names(db_dir):
+    """
+    List the records of a local database.
+
+    Parameters
+    ----------
+    db_dir : str
+        The local directory of the database.
+
+    Returns
+    -------
+    record_names : list
+        The records listed in the database's RECORDS file, or if there is
+        none, every record whose header is found in `db_dir` or its
+        subdirectories, except for the segments of multi-segment records.
+
+    """
+    records_file = os.path.join(db_dir, "RECORDS")
+    if os.path.isfile(records_file):
+        with open(records_file, "r") as f:
+            return [line.strip() for line in f if line.strip()]
+
+    record_names = []
+    seg_names = set()
+    for dir_path, dir_names, file_names in os.walk(db_dir):
+        dir_names.sort()
+        rel_dir = os.path.relpath(dir_path, db_dir)
+        for file_name in sorted(file_names):
+            if not file_name.endswith(".hea"):
+                continue
+            record_name = os.path.normpath(
+                os.path.join(rel_dir, file_name[:-4])
+            )
+            record = wfdb_record.rdheader(os.path.join(db_dir, record_name))
+            if isinstance(record, wfdb_record.MultiRecord):
+                seg_names.update(
+                    os.path.normpath(os.path.join(rel_dir, s))
+                    for s in record.seg_name
+                    if s != "~"
+                )
+            record_names.append(record_name)
+
+    return [r for r in record_names if r not in seg_names]
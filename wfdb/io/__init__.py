@@ -1,18 +1,32 @@
 from wfdb.io.record import (
     Record,
     MultiRecord,
+    RecordWriter,
     rdheader,
     rdrecord,
+    rdrecords,
     rdsamp,
+    iter_record,
     wrsamp,
+    wr_fmt8_index,
     dl_database,
     sampfreq,
     signame,
     wfdbdesc,
     wfdbtime,
+    set_header_cache,
+    header_cache_info,
+    clear_header_cache,
     SIGNAL_CLASSES,
+    SHARED_MEMORY_MIN_BYTES,
+)
+from wfdb.io._signal import (
+    est_res,
+    wr_dat_file,
+    set_signal_cache,
+    signal_cache_info,
+    clear_signal_cache,
 )
-from wfdb.io._signal import est_res, wr_dat_file
 from wfdb.io.annotation import (
     Annotation,
     rdann,
@@ -26,6 +40,10 @@
     get_dbs,
     get_record_list,
     set_db_index_url,
+    set_transfer_options,
+    set_remote_cache,
+    remote_cache_info,
+    clear_remote_cache,
 )
 
 from wfdb.io.datasource import (
@@ -128,6 +128,25 @@
 # Specifications of all WFDB header fields, except for comments
 FIELD_SPECS = pd.concat((RECORD_SPECS, SIGNAL_SPECS, SEGMENT_SPECS))
 
+# The allowed types and read defaults of the record, signal, and segment
+# fields, in the order in which they are written, as plain tuples. They
+# are used when parsing header files, where looking them up in the
+# DataFrames for every field of every line is slow.
+_RECORD_READ_SPECS = tuple(
+    zip(
+        RECORD_SPECS.index,
+        RECORD_SPECS["allowed_types"],
+        RECORD_SPECS["read_default"],
+    )
+)
+_SIGNAL_READ_SPECS = tuple(
+    zip(
+        SIGNAL_SPECS.index,
+        SIGNAL_SPECS["allowed_types"],
+        SIGNAL_SPECS["read_default"],
+    )
+)
+
 
 class BaseHeaderMixin(object):
     """
@@ -1012,51 +1031,38 @@ def _parse_record_line(record_line: str) -> dict:
         The fields for the given record line.
 
     """
-    # Dictionary for record fields
-    record_fields: Dict[str, Any] = {}
-
     # Read string fields from record line
     match = rx_record.match(record_line)
     if match is None:
         raise HeaderSyntaxError("invalid syntax in record line")
-    (
-        record_fields["record_name"],
-        record_fields["n_seg"],
-        record_fields["n_sig"],
-        record_fields["fs"],
-        record_fields["counter_freq"],
-        record_fields["base_counter"],
-        record_fields["sig_len"],
-        record_fields["base_time"],
-        record_fields["base_date"],
-    ) = match.groups()
-
-    for field in RECORD_SPECS.index:
+
+    # Dictionary for record fields
+    record_fields: Dict[str, Any] = {}
+    for (field, allowed_types, read_default), value in zip(
+        _RECORD_READ_SPECS, match.groups()
+    ):
         # Replace empty strings with their read defaults (which are
         # mostly None)
-        if record_fields[field] == "":
-            record_fields[field] = RECORD_SPECS.loc[field, "read_default"]
+        if value == "":
+            record_fields[field] = read_default
         # Typecast non-empty strings for non-string (numerical/datetime)
         # fields
+        elif allowed_types is int_types:
+            record_fields[field] = int(value)
+        elif allowed_types is float_types:
+            value = float(value)
+            # cast fs to an int if it is close
+            if field == "fs" and round(value, 8) == float(int(value)):
+                value = int(value)
+            record_fields[field] = value
+        elif field == "base_time":
+            record_fields[field] = wfdb_strptime(value)
+        elif field == "base_date":
+            record_fields[field] = datetime.datetime.strptime(
+                value, "%d/%m/%Y"
+            ).date()
         else:
-            if RECORD_SPECS.loc[field, "allowed_types"] == int_types:
-                record_fields[field] = int(record_fields[field])
-            elif RECORD_SPECS.loc[field, "allowed_types"] == float_types:
-                record_fields[field] = float(record_fields[field])
-                # cast fs to an int if it is close
-                if field == "fs":
-                    fs = float(record_fields["fs"])
-                    if round(fs, 8) == float(int(fs)):
-                        fs = int(fs)
-                    record_fields["fs"] = fs
-            elif field == "base_time":
-                record_fields["base_time"] = wfdb_strptime(
-                    record_fields["base_time"]
-                )
-            elif field == "base_date":
-                record_fields["base_date"] = datetime.datetime.strptime(
-                    record_fields["base_date"], "%d/%m/%Y"
-                ).date()
+            record_fields[field] = value
 
     # This is not a standard WFDB field, but is useful to set.
     if record_fields["base_date"] and record_fields["base_time"]:
@@ -1082,62 +1088,46 @@ def _parse_signal_lines(signal_lines):
         The fields for the given signal line.
 
     """
-    n_sig = len(signal_lines)
-    # Dictionary for signal fields
+    # Read string fields from signal lines, and gather them by field
+    matches = [rx_signal.match(line) for line in signal_lines]
+    if None in matches:
+        raise HeaderSyntaxError("invalid syntax in signal line")
+    columns = list(zip(*(match.groups() for match in matches)))
+    if not columns:
+        columns = [()] * len(_SIGNAL_READ_SPECS)
+    columns = dict(zip(SIGNAL_SPECS.index, columns))
+
+    # Dictionary for signal fields. Each field is a list, in which empty
+    # strings are replaced with their read defaults (which are mostly
+    # None).
+    # Note: Never set a field to None. [None]* n_sig is accurate,
+    # indicating that different channels can be present or missing.
     signal_fields = {}
+    for field, allowed_types, read_default in _SIGNAL_READ_SPECS:
+        column = columns[field]
+        # Typecast non-empty strings for numerical fields
+        if allowed_types is int_types:
+            signal_fields[field] = [
+                int(value) if value else read_default for value in column
+            ]
+        elif allowed_types is float_types:
+            signal_fields[field] = [
+                float(value) if value else read_default for value in column
+            ]
+        else:
+            signal_fields[field] = [
+                value if value else read_default for value in column
+            ]
 
-    # Each dictionary field is a list
-    for field in SIGNAL_SPECS.index:
-        signal_fields[field] = n_sig * [None]
-
-    # Read string fields from signal line
-    for ch in range(n_sig):
-        match = rx_signal.match(signal_lines[ch])
-        if match is None:
-            raise HeaderSyntaxError("invalid syntax in signal line")
-        (
-            signal_fields["file_name"][ch],
-            signal_fields["fmt"][ch],
-            signal_fields["samps_per_frame"][ch],
-            signal_fields["skew"][ch],
-            signal_fields["byte_offset"][ch],
-            signal_fields["adc_gain"][ch],
-            signal_fields["baseline"][ch],
-            signal_fields["units"][ch],
-            signal_fields["adc_res"][ch],
-            signal_fields["adc_zero"][ch],
-            signal_fields["init_value"][ch],
-            signal_fields["checksum"][ch],
-            signal_fields["block_size"][ch],
-            signal_fields["sig_name"][ch],
-        ) = match.groups()
-
-        for field in SIGNAL_SPECS.index:
-            # Replace empty strings with their read defaults (which are mostly None)
-            # Note: Never set a field to None. [None]* n_sig is accurate, indicating
-            # that different channels can be present or missing.
-            if signal_fields[field][ch] == "":
-                signal_fields[field][ch] = SIGNAL_SPECS.loc[
-                    field, "read_default"
-                ]
-
-                # Special case: missing baseline defaults to ADCzero if present
-                if field == "baseline" and signal_fields["adc_zero"][ch] != "":
-                    signal_fields["baseline"][ch] = int(
-                        signal_fields["adc_zero"][ch]
-                    )
-            # Typecast non-empty strings for numerical fields
-            else:
-                if SIGNAL_SPECS.loc[field, "allowed_types"] is int_types:
-                    signal_fields[field][ch] = int(signal_fields[field][ch])
-                elif SIGNAL_SPECS.loc[field, "allowed_types"] is float_types:
-                    signal_fields[field][ch] = float(signal_fields[field][ch])
-                    # Special case: adc_gain of 0 means 200
-                    if (
-                        field == "adc_gain"
-                        and signal_fields["adc_gain"][ch] == 0
-                    ):
-                        signal_fields["adc_gain"][ch] = 200.0
+    for ch, (gain, baseline, adc_zero) in enumerate(
+        zip(columns["adc_gain"], columns["baseline"], columns["adc_zero"])
+    ):
+        # Special case: adc_gain of 0 means 200
+        if gain and signal_fields["adc_gain"][ch] == 0:
+            signal_fields["adc_gain"][ch] = 200.0
+        # Special case: missing baseline defaults to ADCzero if present
+        if not baseline and adc_zero:
+            signal_fields["baseline"][ch] = int(adc_zero)
 
     return signal_fields
 
@@ -1157,25 +1147,17 @@ def _read_segment_lines(segment_lines):
         The fields for the given segment line.
 
     """
-    # Dictionary for segment fields
-    segment_fields = {}
-
-    # Each dictionary field is a list
-    for field in SEGMENT_SPECS.index:
-        segment_fields[field] = [None] * len(segment_lines)
-
-    # Read string fields from signal line
-    for i in range(len(segment_lines)):
-        match = rx_segment.match(segment_lines[i])
-        if match is None:
-            raise HeaderSyntaxError("invalid syntax in segment line")
-        (
-            segment_fields["seg_name"][i],
-            segment_fields["seg_len"][i],
-        ) = match.groups()
+    # Read string fields from segment lines
+    matches = [rx_segment.match(line) for line in segment_lines]
+    if None in matches:
+        raise HeaderSyntaxError("invalid syntax in segment line")
+    fields = [match.groups() for match in matches]
 
+    # Dictionary for segment fields
+    segment_fields = {
+        "seg_name": [seg_name for seg_name, _ in fields],
         # Typecast strings for numerical field
-        if field == "seg_len":
-            segment_fields["seg_len"][i] = int(segment_fields["seg_len"][i])
+        "seg_len": [int(seg_len) for _, seg_len in fields],
+    }
 
     return segment_fields
@@ -0,0 +1,519 @@
+import collections
+import hashlib
+import json
+import logging
+import os
+import re
+import tempfile
+import threading
+import time
+
+from wfdb.io import _url
+
+
+# Size of the blocks in which remote files are cached, in bytes
+CACHE_BLOCK_SIZE = 1 << 20
+
+# Logger for this module.
+_LOGGER = logging.getLogger(__name__)
+
+# Pattern that matches the names of the subdirectories of the cache
+# directory holding each file
+_ENTRY_DIR_PATTERN = re.compile(r"[0-9a-f]{64}")
+
+# Statistics returned by `remote_cache_info`
+RemoteCacheInfo = collections.namedtuple(
+    "RemoteCacheInfo",
+    ["hits", "misses", "cache_dir", "max_bytes", "n_bytes", "n_blocks"],
+)
+
+
+class RemoteCache(object):
+    """
+    A persistent cache of the contents of remote files, stored in a
+    local directory which may be shared by several processes.
+
+    Files are cached in blocks of `CACHE_BLOCK_SIZE` bytes, so that
+    reading part of a large file only downloads and stores the blocks
+    that contain it. The ETag, Last-Modified time, and size of each file
+    are recorded with its blocks, and compared with those reported by the
+    server when the file is next used, after `max_age` seconds. The
+    blocks of a file that has changed are discarded. Blocks are written
+    to temporary files which are then renamed, so that other processes
+    never see partially written blocks, and the least recently used
+    blocks are removed when the cache exceeds `max_bytes`.
+
+    Parameters
+    ----------
+    cache_dir : str
+        The directory in which to store the cached files.
+    max_bytes : int
+        The size budget of the cached blocks, in bytes.
+    max_age : float
+        The number of seconds for which the cached blocks of a file are
+        used without checking whether it has changed on the server.
+
+    """
+
+    def __init__(self, cache_dir, max_bytes, max_age):
+        os.makedirs(cache_dir, exist_ok=True)
+        self.cache_dir = cache_dir
+        self.max_bytes = max_bytes
+        self.max_age = max_age
+        self.hits = 0
+        self.misses = 0
+        self._lock = threading.Lock()
+        # The metadata of the files used by this process, by URL
+        self._entries = {}
+        # The size of the cached blocks, or None until it is measured
+        self._n_bytes = None
+
+    def _entry_dir(self, url):
+        """
+        Return the directory of the cached blocks of a remote file.
+
+        """
+        url_hash = hashlib.sha256(url.encode()).hexdigest()
+        return os.path.join(self.cache_dir, url_hash[:2], url_hash)
+
+    def _block_path(self, entry, index):
+        """
+        Return the path of a cached block of a remote file.
+
+        """
+        return os.path.join(
+            self._entry_dir(entry["url"]), "%s.%d" % (entry["version"], index)
+        )
+
+    def _make_entry(self, url, xfer):
+        """
+        Create the metadata of a remote file from a response.
+
+        Parameters
+        ----------
+        url : str
+            The URL of the file.
+        xfer : RangeTransfer
+            A response for the file.
+
+        Returns
+        -------
+        entry : dict
+            The URL, ETag, Last-Modified time, size, version (identifying
+            these properties), and time of validation of the file.
+
+        """
+        validators = [xfer.etag, xfer.last_modified, xfer.file_size]
+        return {
+            "url": url,
+            "etag": xfer.etag,
+            "last_modified": xfer.last_modified,
+            "size": xfer.file_size,
+            "version": hashlib.sha256(
+                json.dumps(validators).encode()
+            ).hexdigest()[:16],
+            "checked": time.time(),
+        }
+
+    def _write_atomic(self, path, data):
+        """
+        Write a file, such that it is either complete or absent if read
+        by another process.
+
+        """
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        fd, temp_path = tempfile.mkstemp(
+            prefix=".tmp-", dir=os.path.dirname(path)
+        )
+        try:
+            with os.fdopen(fd, "wb") as f:
+                f.write(data)
+            os.replace(temp_path, path)
+        except BaseException:
+            try:
+                os.remove(temp_path)
+            except OSError:
+                pass
+            raise
+
+    def _save_entry(self, entry):
+        """
+        Record the metadata of a remote file, in this process and in
+        the cache directory.
+
+        """
+        with self._lock:
+            self._entries[entry["url"]] = entry
+        try:
+            self._write_atomic(
+                os.path.join(self._entry_dir(entry["url"]), "meta.json"),
+                json.dumps(entry).encode(),
+            )
+        except OSError as exc:
+            _LOGGER.warning("Could not write to remote cache: %s", exc)
+
+    def _load_entry(self, url):
+        """
+        Return the metadata of a remote file, or None if it is not
+        cached.
+
+        """
+        with self._lock:
+            entry = self._entries.get(url)
+        if entry is not None:
+            return entry
+        try:
+            with open(
+                os.path.join(self._entry_dir(url), "meta.json"), "rb"
+            ) as f:
+                entry = json.load(f)
+        except (OSError, ValueError):
+            return None
+        if not isinstance(entry, dict) or entry.get("url") != url:
+            return None
+        with self._lock:
+            self._entries[url] = entry
+        return entry
+
+    def _validate(self, url):
+        """
+        Return the metadata of a remote file, after checking that it
+        has not changed on the server if it was last checked more than
+        `max_age` seconds ago. Return None if the file is not cached.
+
+        """
+        entry = self._load_entry(url)
+        if entry is not None and time.time() - entry["checked"] > self.max_age:
+            with _url.RangeTransfer(url, 0, 0) as xfer:
+                new_entry = self._make_entry(url, xfer)
+            if new_entry["version"] != entry["version"]:
+                self._discard_blocks(entry)
+            self._save_entry(new_entry)
+            entry = new_entry
+        return entry
+
+    def _discard_blocks(self, entry):
+        """
+        Remove the cached blocks of an outdated version of a file.
+
+        """
+        entry_dir = self._entry_dir(entry["url"])
+        try:
+            file_names = os.listdir(entry_dir)
+        except OSError:
+            return
+        for file_name in file_names:
+            if file_name.startswith(entry["version"] + "."):
+                try:
+                    os.remove(os.path.join(entry_dir, file_name))
+                except OSError:
+                    pass
+
+    def _read_block(self, entry, index):
+        """
+        Read a cached block of a remote file, or return None if it is
+        not cached.
+
+        """
+        path = self._block_path(entry, index)
+        try:
+            with open(path, "rb") as f:
+                data = f.read()
+            # Mark the block as recently used
+            os.utime(path)
+        except OSError:
+            return None
+        # Only the last block of the file may be shorter
+        if len(data) != CACHE_BLOCK_SIZE and (
+            entry["size"] is None
+            or index * CACHE_BLOCK_SIZE + len(data) != entry["size"]
+        ):
+            return None
+        return data
+
+    def _store_block(self, entry, index, data):
+        """
+        Write a block of a remote file to the cache, and evict the least
+        recently used blocks if it exceeds its budget.
+
+        """
+        try:
+            self._write_atomic(self._block_path(entry, index), data)
+        except OSError as exc:
+            _LOGGER.warning("Could not write to remote cache: %s", exc)
+            return
+
+        with self._lock:
+            if self._n_bytes is None:
+                self._n_bytes = sum(size for _, size, _ in self._scan())
+            else:
+                self._n_bytes += len(data)
+            over_budget = self._n_bytes > self.max_bytes
+        if over_budget:
+            self._evict()
+
+    def _scan(self):
+        """
+        List the modification time, size, and path of each cached block.
+
+        """
+        blocks = []
+        for entry_dir in self._scan_entry_dirs():
+            try:
+                dir_entries = list(os.scandir(entry_dir))
+            except OSError:
+                continue
+            for dir_entry in dir_entries:
+                if dir_entry.name == "meta.json" or dir_entry.name.startswith(
+                    ".tmp-"
+                ):
+                    continue
+                try:
+                    stat = dir_entry.stat()
+                except OSError:
+                    continue
+                blocks.append((stat.st_mtime, stat.st_size, dir_entry.path))
+        return blocks
+
+    def _scan_entry_dirs(self):
+        """
+        List the directories of the cached files.
+
+        """
+        entry_dirs = []
+        try:
+            prefixes = os.listdir(self.cache_dir)
+        except OSError:
+            return entry_dirs
+        for prefix in prefixes:
+            prefix_dir = os.path.join(self.cache_dir, prefix)
+            if len(prefix) != 2 or not os.path.isdir(prefix_dir):
+                continue
+            for name in os.listdir(prefix_dir):
+                if _ENTRY_DIR_PATTERN.fullmatch(name) and name[:2] == prefix:
+                    entry_dirs.append(os.path.join(prefix_dir, name))
+        return entry_dirs
+
+    def _evict(self):
+        """
+        Remove the least recently used blocks, until the cache is 10%
+        below its budget (so that it is not scanned on every write).
+
+        """
+        blocks = sorted(self._scan())
+        n_bytes = sum(size for _, size, _ in blocks)
+        for _, size, path in blocks:
+            if n_bytes <= self.max_bytes * 0.9:
+                break
+            try:
+                os.remove(path)
+            except OSError:
+                pass
+            n_bytes -= size
+        with self._lock:
+            self._n_bytes = n_bytes
+
+    def _fetch(self, url, entry, first, stop):
+        """
+        Download a run of blocks of a remote file, and store them in the
+        cache.
+
+        Parameters
+        ----------
+        url : str
+            The URL of the file.
+        entry : dict
+            The metadata of the file, or None if it is not cached.
+        first : int
+            The index of the first block to download.
+        stop : int
+            The index of the block after the last to download, or None
+            to download all blocks up to the end of the file.
+
+        Returns
+        -------
+        entry : dict
+            The updated metadata of the file.
+        blocks : dict
+            The contents of the downloaded blocks, by index.
+
+        """
+        end = None if stop is None else stop * CACHE_BLOCK_SIZE
+        blocks = {}
+        with _url.RangeTransfer(url, first * CACHE_BLOCK_SIZE, end) as xfer:
+            new_entry = self._make_entry(url, xfer)
+            if entry is None or new_entry["version"] != entry["version"]:
+                if entry is not None:
+                    self._discard_blocks(entry)
+                self._save_entry(new_entry)
+                entry = new_entry
+
+            # The response starts at the requested block, or at the start
+            # of the file if the server does not support ranges
+            pos = None
+            data = bytearray()
+            for chunk_start, chunk_data in xfer.iter_chunks():
+                if pos is None:
+                    pos = chunk_start
+                data += chunk_data
+                while len(data) >= CACHE_BLOCK_SIZE:
+                    block = bytes(data[:CACHE_BLOCK_SIZE])
+                    del data[:CACHE_BLOCK_SIZE]
+                    blocks[pos // CACHE_BLOCK_SIZE] = block
+                    self._store_block(entry, pos // CACHE_BLOCK_SIZE, block)
+                    pos += CACHE_BLOCK_SIZE
+
+            # Store the last, partial block of the file
+            if data and (xfer.is_complete or pos + len(data) == xfer.file_size):
+                if entry["size"] is None:
+                    entry = dict(entry, size=pos + len(data))
+                    self._save_entry(entry)
+                blocks[pos // CACHE_BLOCK_SIZE] = bytes(data)
+                self._store_block(entry, pos // CACHE_BLOCK_SIZE, bytes(data))
+
+        with self._lock:
+            self.misses += len(blocks)
+        return entry, blocks
+
+    def iter_blocks(self, url, start, end):
+        """
+        Read the blocks of a remote file containing a range of bytes,
+        downloading those that are not cached.
+
+        Parameters
+        ----------
+        url : str
+            The URL of the file.
+        start : int
+            Starting byte offset of the desired range.
+        end : int or None
+            Ending byte offset of the desired range, or None to read all
+            data up to the end of the file.
+
+        Yields
+        ------
+        block_start : int
+            Byte offset of the start of the block within the file.
+        data : bytes
+            Contents of the block.
+
+        Raises
+        ------
+        NetFileError
+            If the file changed on the server after some of its blocks
+            were yielded, so that the range would mix two versions.
+
+        """
+        entry = self._validate(url)
+        version = None if entry is None else entry["version"]
+        yielded = False
+        # Blocks downloaded along with an earlier one
+        fetched = {}
+        index = start // CACHE_BLOCK_SIZE
+        while end is None or index * CACHE_BLOCK_SIZE < end:
+            if entry is not None and entry["size"] is not None:
+                if index * CACHE_BLOCK_SIZE >= entry["size"]:
+                    return
+
+            data = fetched.pop(index, None)
+            if data is None and entry is not None:
+                data = self._read_block(entry, index)
+                if data is not None:
+                    with self._lock:
+                        self.hits += 1
+            if data is None:
+                stop = self._missing_stop(entry, index, end)
+                entry, fetched = self._fetch(url, entry, index, stop)
+                # The blocks yielded so far are of an older version
+                if yielded and entry["version"] != version:
+                    raise _url.NetFileError(
+                        "Remote file changed while being read", url=url
+                    )
+                version = entry["version"]
+                data = fetched.pop(index, None)
+                if data is None:
+                    return
+
+            yield index * CACHE_BLOCK_SIZE, data
+            yielded = True
+            if len(data) < CACHE_BLOCK_SIZE:
+                return
+            index += 1
+
+    def _missing_stop(self, entry, index, end):
+        """
+        Return the index of the first cached block after a missing one,
+        within a range, or None if they are all missing up to the end
+        of the file.
+
+        """
+        if end is None and entry is not None:
+            end = entry["size"]
+        if end is None:
+            return None
+        stop = -(-end // CACHE_BLOCK_SIZE)
+        if entry is None:
+            return stop
+        for next_index in range(index + 1, stop):
+            if os.path.exists(self._block_path(entry, next_index)):
+                return next_index
+        return stop
+
+    def file_size(self, url):
+        """
+        Return the size of a remote file, or None if it is unknown.
+
+        """
+        entry = self._validate(url)
+        if entry is None or entry["size"] is None:
+            with _url.RangeTransfer(url, 0, 0) as xfer:
+                new_entry = self._make_entry(url, xfer)
+            if entry is None or new_entry["version"] != entry["version"]:
+                if entry is not None:
+                    self._discard_blocks(entry)
+                self._save_entry(new_entry)
+            entry = new_entry
+        return entry["size"]
+
+    def info(self):
+        """
+        Return the statistics of the cache.
+
+        """
+        blocks = self._scan()
+        n_bytes = sum(size for _, size, _ in blocks)
+        with self._lock:
+            self._n_bytes = n_bytes
+            return RemoteCacheInfo(
+                hits=self.hits,
+                misses=self.misses,
+                cache_dir=self.cache_dir,
+                max_bytes=self.max_bytes,
+                n_bytes=n_bytes,
+                n_blocks=len(blocks),
+            )
+
+    def clear(self):
+        """
+        Remove all of the cached files, and reset the statistics.
+
+        """
+        for entry_dir in self._scan_entry_dirs():
+            try:
+                file_names = os.listdir(entry_dir)
+            except OSError:
+                continue
+            for file_name in file_names:
+                try:
+                    os.remove(os.path.join(entry_dir, file_name))
+                except OSError:
+                    pass
+            try:
+                os.rmdir(entry_dir)
+            except OSError:
+                pass
+        with self._lock:
+            self._entries.clear()
+            self._n_bytes = 0
+            self.hits = 0
+            self.misses = 0
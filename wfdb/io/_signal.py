@@ -1,6 +1,12 @@
+import abc
+import collections
 import math
+import multiprocessing.dummy
+import operator
 import os
+import posixpath
 import sys
+import threading
 
 import numpy as np
 
@@ -10,14 +16,41 @@
 MAX_I32 = 2147483647
 MIN_I32 = -2147483648
 
+# Number of frames decoded and converted at a time when signals are
+# read into an output array, bounding the size of temporary arrays
+CHUNK_SIZE = 65536
+
+# Number of samples decoded from a FLAC stream per call to soundfile,
+# which fails for larger blocks due to a bug in libsndfile
+FLAC_CHUNK_SIZE = 1024 * 1024
+
+# Default number of frames in each block of the decoded signal cache
+CACHE_BLOCK_FRAMES = 16384
+
+# Number of frames between the checkpoints of a format 8 index
+FMT8_INDEX_INTERVAL = 16384
+# Suffix appended to the name of a format 8 dat file to name its index
+FMT8_INDEX_EXT = ".idx"
+# Maximum number of loaded format 8 indexes kept in memory
+FMT8_INDEX_CACHE_SIZE = 64
+
 # Formats in which all samples align with integer (power-of-two) boundaries
 ALIGNED_FMTS = ["8", "16", "32", "61", "80", "160"]
 # Formats in which not all samples align with integer boundaries
 UNALIGNED_FMTS = ["212", "310", "311", "24"]
+# Formats which pack several samples into each block of bytes, mapped
+# to the number of samples and bytes per block
+PACKED_FMTS = {"212": (2, 3), "310": (3, 4), "311": (3, 4)}
 # Formats in which samples are encoded in a variable number of bits
 COMPRESSED_FMTS = ["508", "516", "524"]
 # Formats which are stored in offset binary form
 OFFSET_FMTS = ["80", "160"]
+# Formats whose samples can be memory-mapped directly from the dat file
+MMAP_FMTS = ["16", "32", "61", "80", "160"]
+# Formats whose digital to physical conversion can be tabulated, since
+# they have at most 4096 possible sample values. Format 8 stores 8-bit
+# differences, but its absolute sample values span 32 bits.
+LUT_FMTS = ["80", "212", "310", "311", "508"]
 # All WFDB dat formats - https://www.physionet.org/physiotools/wag/signal-5.htm
 DAT_FMTS = ALIGNED_FMTS + UNALIGNED_FMTS + COMPRESSED_FMTS
 
@@ -587,7 +620,7 @@ def adc_inplace(p_signal, adc_gain, baseline, d_nan):
                     d_nans,
                 )
 
-    def dac(self, expanded=False, return_res=64, inplace=False):
+    def dac(self, expanded=False, return_res=64, inplace=False, lut=False):
         """
         Performs the digital to analogue conversion of the signal stored
         in `d_signal` if expanded is False, or `e_d_signal` if expanded
@@ -616,6 +649,14 @@ def dac(self, expanded=False, return_res=64, inplace=False):
             attribute to None (True), or to return the converted
             signal as a separate variable without changing the original
             digital signal attribute (False).
+        lut : bool, optional
+            Whether to look up the physical value of each sample in a
+            precomputed table of every digital value of its channel,
+            which is faster for multi-channel or half precision signals
+            with at most 12 bits of resolution (formats 80, 212, 310,
+            311, and 508). The results are identical. Other formats,
+            and samples outside of the range of their format, are
+            converted arithmetically.
 
         Returns
         -------
@@ -643,60 +684,60 @@ def dac(self, expanded=False, return_res=64, inplace=False):
         else:
             floatdtype = "float16"
 
-        # Do inplace conversion and set relevant variables.
-        if inplace:
-            if expanded:
-                for ch in range(self.n_sig):
-                    # NAN locations for the channel
-                    ch_nanlocs = self.e_d_signal[ch] == d_nans[ch]
-                    self.e_d_signal[ch] = self.e_d_signal[ch].astype(
-                        floatdtype, copy=False
-                    )
-                    np.subtract(
+        # The signals are converted in chunks, so that the only full
+        # size array allocated is the physical signal itself.
+        if expanded:
+            p_signal = []
+            for ch in range(self.n_sig):
+                ch_p_signal = np.empty(
+                    self.e_d_signal[ch].shape, dtype=floatdtype
+                )
+                if lut:
+                    _dac_lut(
                         self.e_d_signal[ch],
+                        self.fmt[ch],
+                        self.adc_gain[ch],
                         self.baseline[ch],
-                        self.e_d_signal[ch],
+                        ch_p_signal,
                     )
-                    np.divide(
+                else:
+                    _dac(
                         self.e_d_signal[ch],
+                        d_nans[ch],
                         self.adc_gain[ch],
-                        self.e_d_signal[ch],
+                        self.baseline[ch],
+                        ch_p_signal,
                     )
-                    self.e_d_signal[ch][ch_nanlocs] = np.nan
-                self.e_p_signal = self.e_d_signal
+                p_signal.append(ch_p_signal)
+        else:
+            p_signal = np.empty(self.d_signal.shape, dtype=floatdtype)
+            if lut:
+                _dac_lut(
+                    self.d_signal,
+                    self.fmt,
+                    self.adc_gain,
+                    self.baseline,
+                    p_signal,
+                )
+            else:
+                _dac(
+                    self.d_signal,
+                    d_nans,
+                    self.adc_gain,
+                    self.baseline,
+                    p_signal,
+                )
+
+        # Do inplace conversion and set relevant variables.
+        if inplace:
+            if expanded:
+                self.e_p_signal = p_signal
                 self.e_d_signal = None
             else:
-                nanlocs = self.d_signal == d_nans
-                # Do float conversion immediately to avoid potential under/overflow
-                # of efficient int dtype
-                self.d_signal = self.d_signal.astype(floatdtype, copy=False)
-                np.subtract(self.d_signal, self.baseline, self.d_signal)
-                np.divide(self.d_signal, self.adc_gain, self.d_signal)
-                self.d_signal[nanlocs] = np.nan
-                self.p_signal = self.d_signal
+                self.p_signal = p_signal
                 self.d_signal = None
-
         # Return the variable
         else:
-            if expanded:
-                p_signal = []
-                for ch in range(self.n_sig):
-                    # NAN locations for the channel
-                    ch_nanlocs = self.e_d_signal[ch] == d_nans[ch]
-                    ch_p_signal = self.e_d_signal[ch].astype(
-                        floatdtype, copy=False
-                    )
-                    np.subtract(ch_p_signal, self.baseline[ch], ch_p_signal)
-                    np.divide(ch_p_signal, self.adc_gain[ch], ch_p_signal)
-                    ch_p_signal[ch_nanlocs] = np.nan
-                    p_signal.append(ch_p_signal)
-            else:
-                nanlocs = self.d_signal == d_nans
-                p_signal = self.d_signal.astype(floatdtype, copy=False)
-                np.subtract(p_signal, self.baseline, p_signal)
-                np.divide(p_signal, self.adc_gain, p_signal)
-                p_signal[nanlocs] = np.nan
-
             return p_signal
 
     def calc_adc_params(self):
@@ -1025,10 +1066,6 @@ def smooth_frames(self, sigtype="physical"):
 
         signal = np.empty((sig_len, n_sig), dtype=output_dtype)
 
-        # Large input arrays will be processed in chunks to avoid the need
-        # to allocate a single huge temporary array.
-        CHUNK_SIZE = 65536
-
         for ch in range(n_sig):
             if spf[ch] == 1:
                 signal[:, ch] = expanded_signal[ch]
@@ -1049,6 +1086,160 @@ def smooth_frames(self, sigtype="physical"):
 # ------------------- Reading Signals -------------------#
 
 
+SignalCacheInfo = collections.namedtuple(
+    "SignalCacheInfo", ["hits", "misses", "max_bytes", "n_bytes", "n_blocks"]
+)
+
+
+class _BlockCache(object):
+    """
+    Size-bounded, least recently used cache of decoded blocks of dat
+    file frames, shared by the threads of the process.
+
+    Parameters
+    ----------
+    max_bytes : int
+        The total size of the cached samples, beyond which the least
+        recently used blocks are evicted. The cache is disabled if 0.
+    block_frames : int
+        The number of frames in each block.
+
+    """
+
+    def __init__(self, max_bytes=0, block_frames=CACHE_BLOCK_FRAMES):
+        self.max_bytes = max_bytes
+        self.block_frames = block_frames
+        self.hits = 0
+        self.misses = 0
+        self.n_bytes = 0
+        self._blocks = collections.OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key):
+        with self._lock:
+            block = self._blocks.get(key)
+            if block is None:
+                self.misses += 1
+            else:
+                self.hits += 1
+                self._blocks.move_to_end(key)
+            return block
+
+    def put(self, key, block):
+        n_bytes = sum(signal.nbytes for signal in block)
+        with self._lock:
+            if key in self._blocks or n_bytes > self.max_bytes:
+                return
+            self._blocks[key] = block
+            self.n_bytes += n_bytes
+            while self.n_bytes > self.max_bytes:
+                _, evicted = self._blocks.popitem(last=False)
+                self.n_bytes -= sum(signal.nbytes for signal in evicted)
+
+    def clear(self):
+        with self._lock:
+            self._blocks.clear()
+            self.n_bytes = 0
+            self.hits = 0
+            self.misses = 0
+
+    def info(self):
+        with self._lock:
+            return SignalCacheInfo(
+                self.hits,
+                self.misses,
+                self.max_bytes,
+                self.n_bytes,
+                len(self._blocks),
+            )
+
+
+_signal_cache = _BlockCache()
+
+
+def set_signal_cache(max_bytes, block_frames=CACHE_BLOCK_FRAMES):
+    """
+    Configure the process-wide cache of decoded signal samples.
+
+    When enabled, the dat files of records read with `rdrecord`,
+    `iter_record`, or lazily, are decoded in blocks of frames, which
+    are kept in memory and reused by later reads of overlapping ranges,
+    as long as the dat file is not modified. Blocks are keyed by the
+    path, modification time, and layout of their dat file, or by the
+    PhysioNet directory for remote files. Format 8 files are not cached.
+
+    Parameters
+    ----------
+    max_bytes : int
+        The memory budget of the cache, in bytes of decoded samples.
+        The least recently used blocks are evicted to stay within it.
+        The cache is disabled if 0, which is the default.
+    block_frames : int, optional
+        The number of frames in each cached block. A read decodes the
+        whole blocks it overlaps, so smaller blocks favor reads of
+        small, scattered windows.
+
+    Returns
+    -------
+    N/A
+
+    Examples
+    --------
+    >>> wfdb.set_signal_cache(512 * 1024**2)
+    >>> for start in range(0, 600000, 1000):
+    ...     record = wfdb.rdrecord('sample-data/100', sampfrom=start,
+                                   sampto=start + 3600)
+    >>> wfdb.signal_cache_info()
+
+    """
+    if not hasattr(max_bytes, "__index__") or max_bytes < 0:
+        raise ValueError("max_bytes must be a non-negative integer")
+    if not hasattr(block_frames, "__index__") or block_frames < 1:
+        raise ValueError("block_frames must be a positive integer")
+
+    with _signal_cache._lock:
+        _signal_cache.max_bytes = max_bytes
+        _signal_cache.block_frames = block_frames
+    _signal_cache.clear()
+
+
+def signal_cache_info():
+    """
+    Return the statistics of the process-wide decoded signal cache.
+
+    Parameters
+    ----------
+    N/A
+
+    Returns
+    -------
+    info : SignalCacheInfo
+        Named tuple of the number of blocks found in (`hits`) and
+        missing from (`misses`) the cache since it was last cleared, its
+        budget (`max_bytes`), and the size (`n_bytes`) and number
+        (`n_blocks`) of the cached blocks.
+
+    """
+    return _signal_cache.info()
+
+
+def clear_signal_cache():
+    """
+    Empty the process-wide decoded signal cache, and reset its
+    statistics.
+
+    Parameters
+    ----------
+    N/A
+
+    Returns
+    -------
+    N/A
+
+    """
+    _signal_cache.clear()
+
+
 def _rd_segment(
     file_name,
     dir_name,
@@ -1067,6 +1258,12 @@ def _rd_segment(
     no_file=False,
     sig_data=None,
     return_res=64,
+    file_handles=None,
+    n_workers=1,
+    out=None,
+    adc_gain=None,
+    baseline=None,
+    fmt8_index=True,
 ):
     """
     Read the digital samples from a single segment record's associated
@@ -1116,12 +1313,40 @@ def _rd_segment(
         32, 16, and 8, where the value represents the numpy int or float
         dtype. Note that the value cannot be 8 when physical is True
         since there is no float8 format.
+    file_handles : dict, optional
+        Open dat files to reuse across calls. Files which are not yet in
+        the dictionary are opened and added to it, and must be closed by
+        the caller. By default, each dat file is opened and closed on
+        every call.
+    n_workers : int, optional
+        The number of threads used to read and decode the dat files
+        concurrently. By default, the files are read one at a time.
+        Compressed (FLAC) files are also split into pieces decoded by
+        `n_workers // len(dat files)` threads each.
+    out : ndarray, optional
+        A (read_len x len(channels)) array into which the signals are
+        written, smoothed to one sample per frame, as each dat file is
+        decoded. May be a view of a larger array. Local dat files,
+        other than those of format 8, are decoded `CHUNK_SIZE` frames
+        at a time.
+    adc_gain : list, optional
+        The ADC gain of each signal of the dat file. If given along with
+        `baseline` and `out`, the signals are converted to physical
+        units as they are written into `out`.
+    baseline : list, optional
+        The digital baseline of each signal of the dat file.
+    fmt8_index : bool, optional
+        Whether format 8 signals read from `sampfrom` > 0 are
+        reconstructed from the index of their dat file, if it has one,
+        as in `_rd_dat_signals`.
 
     Returns
     -------
     signals : list
         The signals read from the dat file(s). Each signal is returned as a
-        one-dimensional numpy array.
+        one-dimensional numpy array. If `out` is given, a tuple of two
+        lists is returned instead, giving the first smoothed digital
+        sample and the checksum of each signal written into `out`.
 
     Notes
     -----
@@ -1193,10 +1418,42 @@ def _rd_segment(
     # Return each sample in signals with multiple samples/frame, without smoothing.
     # Return a list of numpy arrays for each signal.
     signals = [None] * len(channels)
+    # The first digital sample and checksum of each signal written into
+    # the output array
+    out_init_value = [None] * len(channels)
+    out_checksum = [0] * len(channels)
+
+    # Reuse the dat files across the chunks written into the output
+    # array, closing them afterwards if they were opened here.
+    handles = file_handles
+    if out is not None and file_handles is None:
+        handles = {}
+
+    # Workers left over from reading the files concurrently decode the
+    # pieces of each compressed file concurrently.
+    file_n_workers = max(1, n_workers // max(len(w_file_name), 1))
+
+    def rd_dat_frames(fn, start, stop):
+        # Decoded blocks of the file may be cached
+        if _signal_cache.max_bytes and not no_file and w_fmt[fn] != "8":
+            return _rd_cached_dat_signals(
+                file_name=fn,
+                dir_name=dir_name,
+                pn_dir=pn_dir,
+                fmt=w_fmt[fn],
+                n_sig=len(datchannel[fn]),
+                sig_len=sig_len,
+                byte_offset=w_byte_offset[fn],
+                samps_per_frame=w_samps_per_frame[fn],
+                skew=w_skew[fn],
+                sampfrom=start,
+                sampto=stop,
+                file_handles=handles,
+                n_workers=file_n_workers,
+            )
 
-    for fn in w_file_name:
         # Get the list of all signals contained in the dat file
-        datsignals = _rd_dat_signals(
+        return _rd_dat_signals(
             file_name=fn,
             dir_name=dir_name,
             pn_dir=pn_dir,
@@ -1207,19 +1464,274 @@ def _rd_segment(
             samps_per_frame=w_samps_per_frame[fn],
             skew=w_skew[fn],
             init_value=w_init_value[fn],
-            sampfrom=sampfrom,
-            sampto=sampto,
+            sampfrom=start,
+            sampto=stop,
             no_file=no_file,
             sig_data=sig_data,
+            file_handles=handles,
+            channels=r_w_channel[fn],
+            fmt8_index=fmt8_index,
+            n_workers=file_n_workers,
         )
 
-        # Copy over the wanted signals
-        for cn in range(len(out_dat_channel[fn])):
-            signals[out_dat_channel[fn][cn]] = datsignals[r_w_channel[fn][cn]]
+    def rd_dat_file(fn):
+        if out is None:
+            datsignals = rd_dat_frames(fn, sampfrom, sampto)
+            # Copy over the wanted signals
+            for cn in range(len(out_dat_channel[fn])):
+                signals[out_dat_channel[fn][cn]] = datsignals[
+                    r_w_channel[fn][cn]
+                ]
+            return
 
+        # Format 8 samples depend on all of the preceding samples, so
+        # those files are decoded in one go, as are remote files to
+        # avoid extra requests.
+        if no_file or pn_dir is not None or w_fmt[fn] == "8":
+            chunk_frames = max(sampto - sampfrom, 1)
+        # Compressed files are decoded by file_n_workers threads, each
+        # taking a CHUNK_SIZE piece of every chunk.
+        elif w_fmt[fn] in COMPRESSED_FMTS:
+            chunk_frames = CHUNK_SIZE * file_n_workers
+        else:
+            chunk_frames = CHUNK_SIZE
+
+        for start in range(sampfrom, sampto, chunk_frames):
+            stop = min(start + chunk_frames, sampto)
+            datsignals = rd_dat_frames(fn, start, stop)
+            # Smooth and convert the wanted signals into the output
+            for cn in range(len(out_dat_channel[fn])):
+                out_ch = out_dat_channel[fn][cn]
+                ch = channels[out_ch]
+                init_value, checksum = _smooth_to_output(
+                    datsignals[r_w_channel[fn][cn]],
+                    samps_per_frame[ch],
+                    out[start - sampfrom : stop - sampfrom, out_ch],
+                    fmt[ch],
+                    None if adc_gain is None else adc_gain[ch],
+                    None if baseline is None else baseline[ch],
+                )
+                if out_init_value[out_ch] is None:
+                    out_init_value[out_ch] = init_value
+                out_checksum[out_ch] = (out_checksum[out_ch] + checksum) % 65536
+
+    # Each dat file is decoded into its own slots of the output list, so
+    # the files can be read by concurrent threads.
+    try:
+        if n_workers > 1 and len(w_file_name) > 1:
+            with multiprocessing.dummy.Pool(
+                processes=min(n_workers, len(w_file_name))
+            ) as pool:
+                pool.map(download._with_plan(rd_dat_file), w_file_name)
+        else:
+            for fn in w_file_name:
+                rd_dat_file(fn)
+    finally:
+        if handles is not file_handles:
+            for fp in handles.values():
+                fp.close()
+
+    if out is not None:
+        return out_init_value, out_checksum
     return signals
 
 
+def _smooth_to_output(
+    signal, samps_per_frame, out, fmt, adc_gain=None, baseline=None
+):
+    """
+    Write the digital samples of a signal, smoothed to one sample per
+    frame, into a 1d output array, optionally converting them to
+    physical units. The frames are processed in chunks, so that no
+    full size temporary array is allocated.
+
+    The smoothing and conversion are equivalent to those performed by
+    `SignalMixin.smooth_frames` and `SignalMixin.dac`.
+
+    Parameters
+    ----------
+    signal : ndarray
+        The expanded digital samples of the signal.
+    samps_per_frame : int
+        The samples/frame of the signal.
+    out : ndarray
+        The 1d output array, which may be a strided view.
+    fmt : str
+        The WFDB dat format of the signal.
+    adc_gain : float, optional
+        The ADC gain of the signal. If given along with `baseline`, the
+        samples are converted to physical units.
+    baseline : int, optional
+        The digital baseline of the signal.
+
+    Returns
+    -------
+    init_value : int
+        The first smoothed digital sample, or None if there are no
+        samples.
+    checksum : int
+        The 16-bit checksum of the smoothed digital samples.
+
+    """
+    frames = signal.reshape(-1, samps_per_frame)
+    init_value = None
+    checksum = 0
+
+    for chunk_start in range(0, len(out), CHUNK_SIZE):
+        chunk_end = chunk_start + CHUNK_SIZE
+        if samps_per_frame > 1:
+            chunk = np.sum(frames[chunk_start:chunk_end], axis=1, dtype="int64")
+            chunk = (chunk / samps_per_frame).astype("int64")
+        else:
+            chunk = frames[chunk_start:chunk_end, 0]
+
+        if init_value is None:
+            init_value = int(chunk[0])
+        checksum = (checksum + int(np.sum(chunk, dtype="int64"))) % 65536
+
+        if adc_gain is None or baseline is None:
+            out[chunk_start:chunk_end] = chunk
+        # The vectorized arithmetic is faster than table lookups for a
+        # single channel, except in half precision.
+        elif out.dtype == np.float16:
+            _dac_lut(chunk, fmt, adc_gain, baseline, out[chunk_start:chunk_end])
+        else:
+            _dac(
+                chunk,
+                _digi_nan(fmt),
+                adc_gain,
+                baseline,
+                out[chunk_start:chunk_end],
+            )
+
+    return init_value, checksum
+
+
+def _dac(d_signal, d_nans, adc_gain, baseline, out):
+    """
+    Convert digital samples to physical units, writing them into an
+    output array. The samples are converted in chunks, so that the
+    digital NAN locations never need to be stored for the whole signal.
+
+    Parameters
+    ----------
+    d_signal : ndarray
+        The 1d or 2d digital signal.
+    d_nans : int, list
+        The digital NAN value of the signal, or of each of its columns.
+        May be None for signals without a NAN value.
+    adc_gain : float, list
+        The ADC gain of the signal, or of each of its columns.
+    baseline : int, list
+        The digital baseline of the signal, or of each of its columns.
+    out : ndarray
+        The float output array, of the same shape as `d_signal`.
+
+    Returns
+    -------
+    N/A
+
+    """
+    # Operate with arrays rather than scalars, so that the arithmetic is
+    # done in double precision whatever the output dtype.
+    adc_gain = np.atleast_1d(adc_gain)
+    baseline = np.atleast_1d(baseline)
+
+    for chunk_start in range(0, len(d_signal), CHUNK_SIZE):
+        chunk_end = chunk_start + CHUNK_SIZE
+        chunk = d_signal[chunk_start:chunk_end]
+        p_chunk = out[chunk_start:chunk_end]
+        p_chunk[...] = chunk
+        np.subtract(p_chunk, baseline, p_chunk)
+        np.divide(p_chunk, adc_gain, p_chunk)
+        p_chunk[chunk == d_nans] = np.nan
+
+
+def _dac_lut(d_signal, fmt, adc_gain, baseline, out):
+    """
+    Convert digital samples to physical units, writing them into an
+    output array, by looking up the physical value of each sample in a
+    table of every possible digital value of its channel.
+
+    The tables are computed with `_dac`, so the results are identical
+    to its own. Signals with any channel whose format is not in
+    `LUT_FMTS`, and chunks containing samples outside of the range of
+    their format, are converted with `_dac` instead.
+
+    Parameters
+    ----------
+    d_signal : ndarray
+        The 1d or 2d digital signal.
+    fmt : str, list
+        The WFDB dat format of the signal, or of each of its columns.
+    adc_gain : float, list
+        The ADC gain of the signal, or of each of its columns.
+    baseline : int, list
+        The digital baseline of the signal, or of each of its columns.
+    out : ndarray
+        The float output array, of the same shape as `d_signal`.
+
+    Returns
+    -------
+    N/A
+
+    """
+    if d_signal.ndim == 1:
+        fmts, adc_gains, baselines = [fmt], [adc_gain], [baseline]
+    else:
+        fmts, adc_gains, baselines = fmt, adc_gain, baseline
+
+    if (
+        not fmts
+        or any(f not in LUT_FMTS for f in fmts)
+        or not np.issubdtype(d_signal.dtype, np.integer)
+    ):
+        _dac(d_signal, _digi_nan(fmt), adc_gain, baseline, out)
+        return
+
+    # One table per channel, laid out end to end
+    min_vals = np.array([SAMPLE_VALUE_RANGE[f][0] for f in fmts])
+    max_vals = np.array([SAMPLE_VALUE_RANGE[f][1] for f in fmts])
+    table_size = int(np.max(max_vals - min_vals)) + 1
+    tables = np.empty((len(fmts), table_size), dtype=out.dtype)
+    for ch in range(len(fmts)):
+        n_vals = max_vals[ch] - min_vals[ch] + 1
+        _dac(
+            np.arange(min_vals[ch], max_vals[ch] + 1),
+            INVALID_SAMPLE_VALUE[fmts[ch]],
+            adc_gains[ch],
+            baselines[ch],
+            tables[ch, :n_vals],
+        )
+    tables = tables.reshape(-1)
+    offsets = np.arange(len(fmts)) * table_size - min_vals
+
+    for chunk_start in range(0, len(d_signal), CHUNK_SIZE):
+        chunk_end = chunk_start + CHUNK_SIZE
+        chunk = d_signal[chunk_start:chunk_end]
+        # Check the range of all channels at once against the narrowest
+        # range, only checking each channel if that fails.
+        if (
+            np.min(chunk) < np.max(min_vals) or np.max(chunk) > np.min(max_vals)
+        ) and (
+            np.any(np.min(chunk, axis=0) < min_vals)
+            or np.any(np.max(chunk, axis=0) > max_vals)
+        ):
+            _dac(
+                chunk,
+                _digi_nan(fmt),
+                adc_gain,
+                baseline,
+                out[chunk_start:chunk_end],
+            )
+            continue
+        indices = chunk.astype(np.intp)
+        indices += offsets
+        # The indices are known to be valid, and unlike the default
+        # mode, clipping does not buffer the output.
+        np.take(tables, indices, out=out[chunk_start:chunk_end], mode="clip")
+
+
 def _rd_dat_signals(
     file_name,
     dir_name,
@@ -1235,9 +1747,13 @@ def _rd_dat_signals(
     sampto,
     no_file=False,
     sig_data=None,
+    file_handles=None,
+    channels=None,
+    fmt8_index=True,
+    n_workers=1,
 ):
     """
-    Read all signals from a WFDB dat file.
+    Read the signals of a WFDB dat file.
 
     Parameters
     ----------
@@ -1273,12 +1789,28 @@ def _rd_dat_signals(
     sig_data : ndarray, optional
         The signal data that would normally be imported using the associated
         .dat and .hea files. Should only be used when no_file is set to True.
+    file_handles : dict, optional
+        Open dat files to reuse across calls, as in `_rd_segment`.
+    channels : list, optional
+        The indices of the signals of the dat file to decode. Default is
+        all of them. For formats in `PACKED_FMTS`, only the samples of
+        these signals are unpacked.
+    fmt8_index : bool, optional
+        For format 8 dat files read from `sampfrom` > 0, whether to
+        reconstruct the samples from the nearest preceding checkpoint
+        of the local dat file's index, if it has one (see
+        `_wr_fmt8_index`). Otherwise, `init_value` is taken as the value
+        of the samples preceding `sampfrom`.
+    n_workers : int, optional
+        The number of threads used to decode a compressed (FLAC) signal
+        file, as in `_rd_compressed_file`.
 
     Returns
     -------
     signal : ndarray, list
         The signals read from the dat file(s). Each signal is returned as a
-        one-dimensional numpy array.
+        one-dimensional numpy array. Signals which are not in `channels`
+        may be None.
 
     Notes
     -----
@@ -1290,6 +1822,45 @@ def _rd_dat_signals(
     if no_file and sig_data is None:
         raise Exception("signal_dat empty: No signal data provided")
 
+    # Format 8 samples are sums of all of the preceding differences. If
+    # the dat file is indexed, read on from the last checkpoint before
+    # sampfrom, whose absolute values are known, instead of taking the
+    # initial value as the value preceding sampfrom.
+    if fmt == "8" and fmt8_index and sampfrom > 0 and not no_file:
+        index = _rd_fmt8_index(
+            file_name,
+            dir_name,
+            pn_dir,
+            byte_offset,
+            samps_per_frame,
+            init_value,
+        )
+        if index is not None:
+            interval, values = index
+            checkpoint = min(sampfrom // interval, len(values) - 1)
+            signal = _rd_dat_signals(
+                file_name=file_name,
+                dir_name=dir_name,
+                pn_dir=pn_dir,
+                fmt=fmt,
+                n_sig=n_sig,
+                sig_len=sig_len,
+                byte_offset=byte_offset,
+                samps_per_frame=samps_per_frame,
+                skew=skew,
+                init_value=values[checkpoint].tolist(),
+                sampfrom=checkpoint * interval,
+                sampto=sampto,
+                file_handles=file_handles,
+                fmt8_index=False,
+            )
+            # Drop the frames between the checkpoint and sampfrom
+            n_skip = sampfrom - checkpoint * interval
+            return [
+                ch_signal[n_skip * spf :]
+                for ch_signal, spf in zip(signal, samps_per_frame)
+            ]
+
     # Total number of samples per frame
     tsamps_per_frame = sum(samps_per_frame)
     # The signal length to read (per channel)
@@ -1334,10 +1905,18 @@ def _rd_dat_signals(
             samps_per_frame=samps_per_frame,
             start_frame=sampfrom,
             end_frame=sampto,
+            file_handles=file_handles,
+            n_workers=n_workers,
         )
     else:
         data_to_read = _rd_dat_file(
-            file_name, dir_name, pn_dir, fmt, start_byte, n_read_samples
+            file_name,
+            dir_name,
+            pn_dir,
+            fmt,
+            start_byte,
+            n_read_samples,
+            file_handles=file_handles,
         )
 
     if extra_flat_samples:
@@ -1368,6 +1947,36 @@ def _rd_dat_signals(
 
     # Finish processing the read data into proper samples if not already
 
+    # For packed fmts, only unpack the samples of the wanted signals, at
+    # their fixed positions within each frame.
+    if (
+        fmt in PACKED_FMTS
+        and channels is not None
+        and len(set(channels)) < n_sig
+    ):
+        n_frames = (
+            total_process_samples - block_floor_samples
+        ) // tsamps_per_frame
+        signal = [None] * n_sig
+        for ch in set(channels):
+            ch_start = sum(samps_per_frame[:ch])
+            ch_frames = np.empty((n_frames, samps_per_frame[ch]), dtype="int16")
+            for samp in range(samps_per_frame[ch]):
+                _unpack_samples(
+                    sig_data,
+                    fmt,
+                    block_floor_samples + ch_start + samp,
+                    tsamps_per_frame,
+                    ch_frames[:, samp],
+                )
+            signal[ch] = ch_frames.reshape(-1)
+
+        signal = _skew_sig(
+            signal, skew, n_sig, read_len, fmt, nan_replace, samps_per_frame
+        )
+        _check_sig_dims(signal, read_len, n_sig, samps_per_frame)
+        return signal
+
     # For unaligned fmts, turn the uint8 blocks into actual samples
     if fmt in UNALIGNED_FMTS:
         sig_data = _blocks_to_samples(sig_data, total_process_samples, fmt)
@@ -1383,14 +1992,15 @@ def _rd_dat_signals(
             sig_data = (sig_data.astype("int32") - 32768).astype("int16")
 
     # For format 8, convert sample differences to absolute samples.  Note
-    # that if sampfrom is not 0, the results will be wrong, since we can't
-    # know the starting value without reading the entire record from the
-    # beginning - an inherent limitation of the format, and the use of
-    # format 8 is discouraged for this reason!  However, the following is
-    # consistent with the behavior of the WFDB library: the initial value
-    # specified by the header file is used as the starting sample value,
-    # regardless of where in the record we begin reading.  Therefore, the
-    # following should give the same results as rdsamp.
+    # that if sampfrom is not 0, and the dat file has no index, the
+    # results will be wrong, since we can't know the starting value
+    # without reading the entire record from the beginning - an inherent
+    # limitation of the format, and the use of format 8 is discouraged
+    # for this reason!  However, the following is consistent with the
+    # behavior of the WFDB library: the initial value specified by the
+    # header file is used as the starting sample value, regardless of
+    # where in the record we begin reading.  Therefore, the following
+    # should give the same results as rdsamp.
     if fmt == "8":
         dif_frames = sig_data.reshape(-1, tsamps_per_frame)
         abs_frames = np.empty(dif_frames.shape, dtype="int32")
@@ -1432,6 +2042,140 @@ def _rd_dat_signals(
     return signal
 
 
+def _rd_cached_dat_signals(
+    file_name,
+    dir_name,
+    pn_dir,
+    fmt,
+    n_sig,
+    sig_len,
+    byte_offset,
+    samps_per_frame,
+    skew,
+    sampfrom,
+    sampto,
+    file_handles=None,
+    n_workers=1,
+):
+    """
+    Read the signals of a WFDB dat file through the decoded signal
+    cache. Gives the same result as `_rd_dat_signals`, from the cached
+    blocks of frames the range overlaps, decoding and caching the
+    missing blocks. Not for format 8 dat files.
+
+    Parameters
+    ----------
+    file_name : str
+        The name of the dat file.
+    dir_name : str
+        The full directory where the dat file(s) are located, if the dat
+        file(s) are local.
+    pn_dir : str
+        The PhysioNet directory where the dat file(s) are located, if
+        the dat file(s) are remote.
+    fmt : str
+        The format of the dat file.
+    n_sig : int
+        The number of signals contained in the dat file.
+    sig_len : int
+        The signal length (per channel) of the dat file.
+    byte_offset : int
+        The byte offset of the dat file.
+    samps_per_frame : list
+        The samples/frame for each signal of the dat file.
+    skew : list
+        The skew for the signals of the dat file.
+    sampfrom : int
+        The starting sample number to be read from the signals.
+    sampto : int
+        The final sample number to be read from the signals.
+    file_handles : dict, optional
+        Open dat files to reuse across calls, as in `_rd_segment`.
+    n_workers : int, optional
+        The number of threads used to decode a compressed (FLAC) signal
+        file, as in `_rd_compressed_file`.
+
+    Returns
+    -------
+    signal : list
+        The signals read from the dat file. Each signal is returned as a
+        one-dimensional numpy array, which does not share memory with
+        the cache.
+
+    """
+    block_frames = _signal_cache.block_frames
+    if pn_dir is None:
+        file_path = os.path.abspath(os.path.join(dir_name, file_name))
+        file_id = (file_path, os.stat(file_path).st_mtime_ns)
+    else:
+        # PhysioNet files are versioned by their directory
+        file_id = (posixpath.join(pn_dir, file_name), None)
+    key = file_id + (
+        fmt,
+        n_sig,
+        sig_len,
+        byte_offset,
+        tuple(samps_per_frame),
+        block_frames,
+    )
+
+    # The frames of the dat file spanned by the skewed signals, padded
+    # with zeros beyond its end, as read by _rd_dat_signals
+    read_len = sampto - sampfrom
+    stop = min(sampto + max(skew), sig_len)
+    n_extra_frames = sampto + max(skew) - stop
+    nan_replace = [max(0, sampto + s - sig_len) for s in skew]
+
+    parts = [[] for _ in range(n_sig)]
+    for block_num in range(sampfrom // block_frames, -(-stop // block_frames)):
+        block_start = block_num * block_frames
+        block = _signal_cache.get(key + (block_num,))
+        if block is None:
+            block = _rd_dat_signals(
+                file_name=file_name,
+                dir_name=dir_name,
+                pn_dir=pn_dir,
+                fmt=fmt,
+                n_sig=n_sig,
+                sig_len=sig_len,
+                byte_offset=byte_offset,
+                samps_per_frame=samps_per_frame,
+                skew=[0] * n_sig,
+                init_value=[0] * n_sig,
+                sampfrom=block_start,
+                sampto=min(block_start + block_frames, sig_len),
+                file_handles=file_handles,
+                n_workers=n_workers,
+            )
+            for signal in block:
+                signal.flags.writeable = False
+            block = tuple(block)
+            _signal_cache.put(key + (block_num,), block)
+
+        lo = max(sampfrom, block_start) - block_start
+        hi = min(stop, block_start + block_frames) - block_start
+        for ch in range(n_sig):
+            spf = samps_per_frame[ch]
+            parts[ch].append(block[ch][lo * spf : hi * spf])
+
+    signal = []
+    for ch in range(n_sig):
+        if n_extra_frames:
+            parts[ch].append(
+                np.zeros(
+                    n_extra_frames * samps_per_frame[ch],
+                    dtype=parts[ch][0].dtype,
+                )
+            )
+        signal.append(np.concatenate(parts[ch]))
+
+    signal = _skew_sig(
+        signal, skew, n_sig, read_len, fmt, nan_replace, samps_per_frame
+    )
+    _check_sig_dims(signal, read_len, n_sig, samps_per_frame)
+    return signal
+
+
 def _dat_read_params(
     fmt, sig_len, byte_offset, skew, tsamps_per_frame, sampfrom, sampto
 ):
@@ -1577,33 +2321,109 @@ def _required_byte_num(mode, fmt, n_samp):
     return int(n_bytes)
 
 
-def _rd_dat_file(file_name, dir_name, pn_dir, fmt, start_byte, n_samp):
+def _dat_byte_ranges(
+    file_name,
+    fmt,
+    sig_len,
+    byte_offset,
+    samps_per_frame,
+    skew,
+    sampfrom,
+    sampto,
+    channels,
+):
     """
-    Read data from a dat file, either local or remote, into a 1d numpy
-    array.
-
-    This is the lowest level dat reading function (along with
-    `_stream_dat` which this function may call), and is called by
-    `_rd_dat_signals`.
+    Determine the byte ranges of the dat files read by `_rd_segment` for
+    some of the signals of a segment.
 
     Parameters
     ----------
-    file_name : str
-        The name of the dat file.
-    dir_name : str
-        The full directory where the dat file(s) are located, if the dat
-        file(s) are local.
-    pn_dir : str
-        The PhysioNet directory where the dat file(s) are located, if
-        the dat file(s) are remote.
-    fmt : str
-        The format of the dat file.
+    file_name : list
+        The name of the dat file of each signal of the segment.
+    fmt : list
+        The format of each signal of the segment.
+    sig_len : int
+        The signal length (per channel) of the segment.
+    byte_offset : list
+        The byte offset of the dat file of each signal.
+    samps_per_frame : list
+        The samples/frame of each signal.
+    skew : list
+        The skew of each signal.
+    sampfrom : int
+        The starting sample number to be read from the signals.
+    sampto : int
+        The final sample number to be read from the signals.
+    channels : list
+        The indices of the signals to read.
+
+    Returns
+    -------
+    byte_ranges : list
+        The (file_name, start_byte, end_byte) of each dat file to be
+        read. Compressed files, whose byte positions are unknown, are
+        left out.
+
+    """
+    byte_ranges = []
+    file_names, datchannel = describe_list_indices(file_name)
+    for fn in file_names:
+        first = datchannel[fn][0]
+        if fmt[first] in COMPRESSED_FMTS or not any(
+            c in channels for c in datchannel[fn]
+        ):
+            continue
+        start_byte, n_read_samples = _dat_read_params(
+            fmt[first],
+            sig_len,
+            byte_offset[first] or 0,
+            [skew[c] or 0 for c in datchannel[fn]],
+            sum(samps_per_frame[c] or 1 for c in datchannel[fn]),
+            sampfrom,
+            sampto,
+        )[:2]
+        byte_ranges.append(
+            (
+                fn,
+                start_byte,
+                start_byte
+                + _required_byte_num("read", fmt[first], n_read_samples),
+            )
+        )
+    return byte_ranges
+
+
+def _rd_dat_file(
+    file_name, dir_name, pn_dir, fmt, start_byte, n_samp, file_handles=None
+):
+    """
+    Read data from a dat file, either local or remote, into a 1d numpy
+    array.
+
+    This is the lowest level dat reading function (along with
+    `_stream_dat` which this function may call), and is called by
+    `_rd_dat_signals`.
+
+    Parameters
+    ----------
+    file_name : str
+        The name of the dat file.
+    dir_name : str
+        The full directory where the dat file(s) are located, if the dat
+        file(s) are local.
+    pn_dir : str
+        The PhysioNet directory where the dat file(s) are located, if
+        the dat file(s) are remote.
+    fmt : str
+        The format of the dat file.
     start_byte : int
         The starting byte number to read from.
     n_samp : int
         The total number of samples to read. Does NOT need to create
         whole blocks for special format. Any number of samples should be
         readable.
+    file_handles : dict, optional
+        Open dat files to reuse across calls, as in `_rd_segment`.
 
     Returns
     -------
@@ -1635,8 +2455,35 @@ def _rd_dat_file(file_name, dir_name, pn_dir, fmt, start_byte, n_samp):
         element_count = n_samp
         byte_count = n_samp * BYTES_PER_SAMPLE[fmt]
 
+    # Remote dat file range fetched ahead by a range plan
+    if pn_dir is not None and file_handles is not None:
+        sig_data = download._stream_dat(
+            file_name,
+            pn_dir,
+            byte_count,
+            start_byte,
+            np.dtype(DATA_LOAD_TYPES[fmt]),
+            planned_only=True,
+        )
+        if sig_data is not None:
+            return sig_data
+
+    # Reused dat file, either local or remote
+    if file_handles is not None:
+        key = (dir_name, pn_dir, file_name)
+        fp = file_handles.get(key)
+        if fp is None:
+            if pn_dir is None:
+                fp = open(os.path.join(dir_name, file_name), "rb")
+            else:
+                fp = _coreio._open_file(pn_dir, file_name, "rb")
+            file_handles[key] = fp
+        fp.seek(start_byte)
+        sig_data = np.empty(element_count, dtype=DATA_LOAD_TYPES[fmt])
+        n_bytes = fp.readinto(sig_data.view("u1"))
+        sig_data = sig_data[: n_bytes // sig_data.itemsize]
     # Local dat file
-    if pn_dir is None:
+    elif pn_dir is None:
         with open(os.path.join(dir_name, file_name), "rb") as fp:
             fp.seek(start_byte)
             sig_data = np.fromfile(
@@ -1652,102 +2499,216 @@ def _rd_dat_file(file_name, dir_name, pn_dir, fmt, start_byte, n_samp):
     return sig_data
 
 
-def _blocks_to_samples(sig_data, n_samp, fmt):
+def _wr_fmt8_index(
+    file_name,
+    dir_name,
+    sig_len,
+    byte_offset,
+    samps_per_frame,
+    init_value,
+    interval=FMT8_INDEX_INTERVAL,
+):
     """
-    Convert uint8 blocks into signal samples for unaligned dat formats.
+    Write the checkpoint index of a local format 8 dat file.
+
+    The index holds the absolute value of each signal preceding every
+    `interval`th frame of the dat file, so that a range of frames can
+    be reconstructed from the nearest preceding checkpoint rather than
+    from the start of the file. It is computed in a single pass over the
+    dat file, `CHUNK_SIZE` frames at a time, and written next to it,
+    with `FMT8_INDEX_EXT` appended to its name, along with the size and
+    modification time of the dat file.
 
     Parameters
     ----------
-    sig_data : ndarray
-        The uint8 data blocks.
-    n_samp : int
-        The number of samples contained in the bytes.
-    fmt : list
-        The formats of the dat files.
+    file_name : str
+        The name of the dat file.
+    dir_name : str
+        The full directory where the dat file is located.
+    sig_len : int
+        The signal length (per channel) of the dat file.
+    byte_offset : int
+        The byte offset of the dat file.
+    samps_per_frame : list
+        The samples/frame for each signal of the dat file.
+    init_value : list
+        The initial value for each signal of the dat file.
+    interval : int, optional
+        The number of frames between checkpoints.
 
     Returns
     -------
-    sig : ndarray
-        The numpy array of digital samples.
+    N/A
 
     """
-    if fmt == "212":
-        # Easier to process when dealing with whole blocks
-        if n_samp % 2:
-            n_samp += 1
-            added_samps = 1
-            sig_data = np.append(sig_data, np.zeros(1, dtype="uint8"))
-        else:
-            added_samps = 0
+    tsamps_per_frame = sum(samps_per_frame)
+    # The first sample of each signal within a frame
+    ch_starts = np.cumsum([0] + samps_per_frame[:-1])
+    dat_path = os.path.join(dir_name, file_name)
+
+    # Taken before reading, so that the index of a file modified while
+    # it is read does not match it.
+    dat_stat = os.stat(dat_path)
+    values = np.empty(
+        (math.ceil(sig_len / interval), len(init_value)), dtype="int64"
+    )
+    # The absolute value of the last sample of each signal read
+    last_value = np.array(init_value, dtype="int64")
+    with open(dat_path, "rb") as fp:
+        fp.seek(byte_offset)
+        for start in range(0, sig_len, CHUNK_SIZE):
+            n_frames = min(CHUNK_SIZE, sig_len - start)
+            dif_frames = np.fromfile(
+                fp, dtype="<i1", count=n_frames * tsamps_per_frame
+            )
+            if len(dif_frames) < n_frames * tsamps_per_frame:
+                raise ValueError(
+                    "dat file %s is shorter than the signal length" % file_name
+                )
+            # Sum of the differences of each signal within each frame
+            dif_sums = np.add.reduceat(
+                dif_frames.reshape(n_frames, tsamps_per_frame),
+                ch_starts,
+                axis=1,
+                dtype="int64",
+            )
+            # The values preceding each frame of the chunk
+            frame_values = np.cumsum(dif_sums, axis=0)
+            frame_values -= dif_sums
+            frame_values += last_value
+
+            first = -start % interval
+            checkpoints = frame_values[first::interval]
+            first_checkpoint = (start + first) // interval
+            values[
+                first_checkpoint : first_checkpoint + len(checkpoints)
+            ] = checkpoints
+            last_value += dif_sums.sum(axis=0)
+
+    with open(dat_path + FMT8_INDEX_EXT, "wb") as fp:
+        np.savez(
+            fp,
+            interval=interval,
+            values=values,
+            byte_offset=byte_offset,
+            samps_per_frame=samps_per_frame,
+            init_value=init_value,
+            file_size=dat_stat.st_size,
+            file_mtime_ns=dat_stat.st_mtime_ns,
+        )
 
-        sig_data = sig_data.astype("int16")
-        sig = np.zeros(n_samp, dtype="int16")
 
-        # One sample pair is stored in one byte triplet.
+# The loaded format 8 indexes, keyed by the path and modification time
+# and size of the index and its dat file
+_fmt8_indexes = collections.OrderedDict()
+_fmt8_indexes_lock = threading.Lock()
 
-        # Even numbered samples
-        sig[0::2] = sig_data[0::3] + 256 * np.bitwise_and(sig_data[1::3], 0x0F)
-        # Odd numbered samples (len(sig) always > 1 due to processing of
-        # whole blocks)
-        sig[1::2] = sig_data[2::3] + 256 * np.bitwise_and(
-            sig_data[1::3] >> 4, 0x0F
-        )
 
-        # Remove trailing sample read within the byte block if
-        # originally odd sampled
-        if added_samps:
-            sig = sig[:-added_samps]
+def _rd_fmt8_index(
+    file_name, dir_name, pn_dir, byte_offset, samps_per_frame, init_value
+):
+    """
+    Read the checkpoint index of a local format 8 dat file, written by
+    `_wr_fmt8_index`.
 
-        # Loaded values as un_signed. Convert to 2's complement form:
-        # values > 2^11-1 are negative.
-        sig[sig > 2047] -= 4096
+    Parameters
+    ----------
+    file_name : str
+        The name of the dat file.
+    dir_name : str
+        The full directory where the dat file is located, if the dat
+        file is local.
+    pn_dir : str
+        The PhysioNet directory where the dat file is located, if the
+        dat file is remote.
+    byte_offset : int
+        The byte offset of the dat file.
+    samps_per_frame : list
+        The samples/frame for each signal of the dat file.
+    init_value : list
+        The initial value for each signal of the dat file.
 
-    elif fmt == "310":
-        sig_data = sig_data.astype("int16")
-        sig = np.zeros(n_samp, dtype="int16")
+    Returns
+    -------
+    index : tuple, None
+        The number of frames between checkpoints, and the (n_checkpoints
+        x n_sig) array of the values of each signal preceding each
+        checkpoint. None if the dat file is remote, or has no index, or
+        if the index does not match the dat file and its header fields.
 
-        # One sample triplet is stored in one byte quartet
-        # First sample is 7 msb of first byte and 3 lsb of second byte.
-        sig[0::3] = (sig_data[0::4] >> 1)[
-            0 : len(sig[0::3])
-        ] + 128 * np.bitwise_and(sig_data[1::4], 0x07)[0 : len(sig[0::3])]
-        # Second signal is 7 msb of third byte and 3 lsb of forth byte
-        sig[1::3] = (sig_data[2::4] >> 1)[
-            0 : len(sig[1::3])
-        ] + 128 * np.bitwise_and(sig_data[3::4], 0x07)[0 : len(sig[1::3])]
-        # Third signal is 5 msb of second byte and 5 msb of forth byte
-        sig[2::3] = (
-            np.bitwise_and((sig_data[1::4] >> 3), 0x1F)[0 : len(sig[2::3])]
-            + 32 * np.bitwise_and(sig_data[3::4] >> 3, 0x1F)[0 : len(sig[2::3])]
-        )
+    Notes
+    -----
+    Loaded indexes are kept in memory, and loaded again if the index or
+    the dat file is modified. An index does not match a dat file
+    rewritten within the resolution of the file system's modification
+    times.
 
-        # Loaded values as un_signed. Convert to 2's complement form:
-        # values > 2^9-1 are negative.
-        sig[sig > 511] -= 1024
+    """
+    if pn_dir is not None:
+        return None
+    dat_path = os.path.join(dir_name, file_name)
+    try:
+        index_stat = os.stat(dat_path + FMT8_INDEX_EXT)
+        dat_stat = os.stat(dat_path)
+    except FileNotFoundError:
+        return None
+
+    key = (
+        dat_path,
+        index_stat.st_mtime_ns,
+        index_stat.st_size,
+        dat_stat.st_mtime_ns,
+        dat_stat.st_size,
+    )
+    with _fmt8_indexes_lock:
+        index = _fmt8_indexes.get(key)
+        if index is not None:
+            _fmt8_indexes.move_to_end(key)
+    if index is None:
+        with np.load(dat_path + FMT8_INDEX_EXT) as npz:
+            index = {name: npz[name] for name in npz.files}
+        with _fmt8_indexes_lock:
+            _fmt8_indexes[key] = index
+            while len(_fmt8_indexes) > FMT8_INDEX_CACHE_SIZE:
+                _fmt8_indexes.popitem(last=False)
+
+    # Indexes written without the modification time of their dat file
+    # cannot be checked against it.
+    if (
+        "file_mtime_ns" not in index
+        or int(index["file_mtime_ns"]) != dat_stat.st_mtime_ns
+        or int(index["file_size"]) != dat_stat.st_size
+        or int(index["byte_offset"]) != byte_offset
+        or index["samps_per_frame"].tolist() != list(samps_per_frame)
+        or index["init_value"].tolist() != list(init_value)
+        or not len(index["values"])
+    ):
+        return None
+    return int(index["interval"]), index["values"]
 
-    elif fmt == "311":
-        sig_data = sig_data.astype("int16")
-        sig = np.zeros(n_samp, dtype="int16")
 
-        # One sample triplet is stored in one byte quartet
-        # First sample is first byte and 2 lsb of second byte.
-        sig[0::3] = (
-            sig_data[0::4][0 : len(sig[0::3])]
-            + 256 * np.bitwise_and(sig_data[1::4], 0x03)[0 : len(sig[0::3])]
-        )
-        # Second sample is 6 msb of second byte and 4 lsb of third byte
-        sig[1::3] = (sig_data[1::4] >> 2)[
-            0 : len(sig[1::3])
-        ] + 64 * np.bitwise_and(sig_data[2::4], 0x0F)[0 : len(sig[1::3])]
-        # Third sample is 4 msb of third byte and 6 msb of forth byte
-        sig[2::3] = (sig_data[2::4] >> 4)[
-            0 : len(sig[2::3])
-        ] + 16 * np.bitwise_and(sig_data[3::4], 0x7F)[0 : len(sig[2::3])]
-
-        # Loaded values as un_signed. Convert to 2's complement form.
-        # Values > 2^9-1 are negative.
-        sig[sig > 511] -= 1024
+def _blocks_to_samples(sig_data, n_samp, fmt):
+    """
+    Convert uint8 blocks into signal samples for unaligned dat formats.
 
+    Parameters
+    ----------
+    sig_data : ndarray
+        The uint8 data blocks.
+    n_samp : int
+        The number of samples contained in the bytes.
+    fmt : list
+        The formats of the dat files.
+
+    Returns
+    -------
+    sig : ndarray
+        The numpy array of digital samples.
+
+    """
+    if fmt in PACKED_FMTS:
+        sig = np.empty(n_samp, dtype="int16")
+        _unpack_samples(sig_data, fmt, 0, 1, sig)
     elif fmt == "24":
         # The following is equivalent to:
         #   sig = (sig_data[2::3].view('int8').astype('int32') * 65536
@@ -1770,6 +2731,249 @@ def _blocks_to_samples(sig_data, n_samp, fmt):
     return sig
 
 
+def _unpack_samples(sig_data, fmt, start, step, out):
+    """
+    Decode every `step`th sample of the uint8 blocks of a packed dat
+    format, starting from sample `start`, without unpacking the samples
+    in between.
+
+    Parameters
+    ----------
+    sig_data : ndarray
+        The uint8 data blocks.
+    fmt : str
+        The format of the dat file. Must be in `PACKED_FMTS`.
+    start : int
+        The index of the first sample to decode, counting from the start
+        of `sig_data`.
+    step : int
+        The spacing between the samples to decode.
+    out : ndarray
+        The int16 array into which the samples are decoded. Its length
+        is the number of samples to decode.
+
+    Returns
+    -------
+    N/A
+
+    Notes
+    -----
+    The samples to decode occupy the same position of every block
+    within each of `block_samps / gcd(step, block_samps)` interleaved
+    sequences, whose bytes are selected by striding over `sig_data`.
+    Reading one signal of a multiplexed file thus only touches the
+    bytes of that signal.
+
+    """
+    block_samps, block_bytes = PACKED_FMTS[fmt]
+    sig_data = np.ascontiguousarray(sig_data)
+    n_seq = block_samps // math.gcd(step, block_samps)
+    # Byte spacing between successive samples of each sequence
+    byte_step = n_seq * step // block_samps * block_bytes
+
+    for seq in range(min(n_seq, len(out))):
+        first = start + seq * step
+        pos = first % block_samps
+        first_byte = first // block_samps * block_bytes
+        seq_out = out[seq::n_seq]
+        n = len(seq_out)
+
+        def col(b):
+            # Byte `b` of the blocks holding the samples
+            return sig_data[first_byte + b :: byte_step][:n]
+
+        if fmt == "212":
+            # One sample pair is stored in one byte triplet. The 12 bits
+            # of each sample are placed in the top of an int16, and are
+            # shifted back down at the end, which extends the sign.
+            if pos == 0:
+                # The first sample is the 4 lsb of the second byte
+                # followed by the first byte, i.e. the low 12 bits of
+                # the first two bytes read as a little-endian integer.
+                pairs = np.ndarray(
+                    (n,),
+                    dtype="<i2",
+                    buffer=sig_data,
+                    offset=first_byte,
+                    strides=(byte_step,),
+                )
+                np.left_shift(pairs, 4, out=seq_out)
+            else:
+                # The second sample is the 4 msb of the second byte
+                # followed by the third byte.
+                np.left_shift(col(2), 4, out=seq_out, dtype="int16")
+                msb = np.bitwise_and(col(1), 0xF0, dtype="int16")
+                msb <<= 8
+                seq_out |= msb
+
+        # One sample triplet is stored in one byte quartet
+        elif fmt == "310":
+            if pos < 2:
+                # The first (second) sample is the 7 msb of the first
+                # (third) byte and the 3 lsb of the second (fourth) byte
+                np.bitwise_and(
+                    col(2 * pos + 1), 0x07, out=seq_out, dtype="int16"
+                )
+                seq_out <<= 7
+                seq_out |= col(2 * pos) >> 1
+            else:
+                # The third sample is the 5 msb of the second byte and
+                # the 5 msb of the fourth byte
+                np.right_shift(col(3), 3, out=seq_out, dtype="int16")
+                seq_out <<= 5
+                seq_out |= col(1) >> 3
+        else:
+            if pos == 0:
+                # The first sample is the first byte and the 2 lsb of
+                # the second byte
+                np.bitwise_and(col(1), 0x03, out=seq_out, dtype="int16")
+                seq_out <<= 8
+                seq_out |= col(0)
+            elif pos == 1:
+                # The second sample is the 6 msb of the second byte and
+                # the 4 lsb of the third byte
+                np.bitwise_and(col(2), 0x0F, out=seq_out, dtype="int16")
+                seq_out <<= 6
+                seq_out |= col(1) >> 2
+            else:
+                # The third sample is the 4 msb of the third byte and
+                # the 7 lsb of the fourth byte
+                np.bitwise_and(col(3), 0x7F, out=seq_out, dtype="int16")
+                seq_out <<= 4
+                seq_out |= col(2) >> 4
+
+    if fmt == "212":
+        out >>= 4
+    else:
+        # Loaded values as unsigned. Convert to 2's complement form:
+        # values > 2^9-1 are negative.
+        out[out > 511] -= 1024
+
+
+class _FlacStream(object):
+    """
+    A FLAC signal file, opened for decoding with soundfile.
+
+    Parameters
+    ----------
+    file_name : str
+        The name of the signal file.
+    dir_name : str
+        The full directory where the signal file is located, if local.
+        This argument is ignored if `pn_dir` is not None.
+    pn_dir : str or None
+        The PhysioNet database directory where the signal file is located.
+    fmt : str
+        The format code of the signal file.
+    n_sig : int
+        The number of signals in the file.
+
+    Attributes
+    ----------
+    format_bits : int
+        The resolution of the samples of the FLAC stream.
+    read_dtype : str
+        The numpy dtype in which the samples are decoded.
+
+    """
+
+    def __init__(self, file_name, dir_name, pn_dir, fmt, n_sig):
+        import soundfile
+
+        if pn_dir is None:
+            file_name = os.path.join(dir_name, file_name)
+
+        self._fp = _coreio._open_file(pn_dir, file_name, "rb")
+        try:
+            signature = self._fp.read(4)
+            if signature != b"fLaC":
+                raise ValueError(f"{self._fp.name} is not a FLAC file")
+            self._fp.seek(0)
+            self._sf = soundfile.SoundFile(self._fp)
+        except BaseException:
+            self._fp.close()
+            raise
+
+        try:
+            self._check_stream(fmt, n_sig)
+        except BaseException:
+            self.close()
+            raise
+
+    def _check_stream(self, fmt, n_sig):
+        # Determine the actual resolution of the FLAC stream and the
+        # data type will use when reading it.  Note that soundfile
+        # doesn't support int8.
+        if self._sf.subtype == "PCM_S8":
+            self.format_bits = 8
+            self.read_dtype = "int16"
+        elif self._sf.subtype == "PCM_16":
+            self.format_bits = 16
+            self.read_dtype = "int16"
+        elif self._sf.subtype == "PCM_24":
+            self.format_bits = 24
+            self.read_dtype = "int32"
+        else:
+            raise ValueError(
+                f"unknown subtype in {self._fp.name} ({self._sf.subtype})"
+            )
+
+        max_bits = int(fmt) - 500
+        if self.format_bits > max_bits:
+            raise ValueError(
+                f"wrong resolution in {self._fp.name} "
+                f"({self.format_bits}, expected <= {max_bits})"
+            )
+
+        if self._sf.channels != n_sig:
+            raise ValueError(
+                f"wrong number of channels in {self._fp.name} "
+                f"({self._sf.channels}, expected {n_sig})"
+            )
+
+    def read(self, start, out):
+        """
+        Decode consecutive samples of every signal of the stream.
+
+        Parameters
+        ----------
+        start : int
+            The sample number of the stream to start decoding from.
+        out : ndarray
+            The (n_samp x n_sig) array of `read_dtype` into which the
+            samples are decoded.
+
+        Returns
+        -------
+        n_read : int
+            The number of samples decoded, which is less than `len(out)`
+            if the stream ends first.
+
+        """
+        # Reading on from the end of the previous read needs no seek
+        if self._sf.tell() != start:
+            self._sf.seek(start)
+
+        # We could do this:
+        #  self._sf.read(out=out)
+        # However, sf.read fails for huge blocks (over 2**24 total
+        # samples) due to a bug in libsndfile:
+        # https://github.com/libsndfile/libsndfile/issues/431
+        # So read the data in chunks instead.
+        n_read = 0
+        while n_read < len(out):
+            chunk = out[n_read : n_read + FLAC_CHUNK_SIZE]
+            samples_read = self._sf.read(out=chunk).shape[0]
+            n_read += samples_read
+            if samples_read != len(chunk):
+                break
+        return n_read
+
+    def close(self):
+        self._sf.close()
+        self._fp.close()
+
+
 def _rd_compressed_file(
     file_name,
     dir_name,
@@ -1780,6 +2984,8 @@ def _rd_compressed_file(
     samps_per_frame,
     start_frame,
     end_frame,
+    file_handles=None,
+    n_workers=1,
 ):
     """
     Read data from a compressed file into a 1D numpy array.
@@ -1806,6 +3012,15 @@ def _rd_compressed_file(
         The starting frame number to read.
     end_frame : int
         The ending frame number to read.
+    file_handles : dict, optional
+        Open signal files to reuse across calls, as in `_rd_segment`.
+        Reusing a file avoids setting up its FLAC decoder again, and
+        consecutive reads continue decoding without seeking.
+    n_workers : int, optional
+        The number of threads used to decode the samples. The samples
+        are split into disjoint pieces, of at least `CHUNK_SIZE` samples
+        each, which are decoded concurrently from separately opened
+        streams of the file.
 
     Returns
     -------
@@ -1822,86 +3037,78 @@ def _rd_compressed_file(
     better to reorganize _rd_dat_signals to make the reshaping unnecessary.
 
     """
-    import soundfile
-
     if any(spf != samps_per_frame[0] for spf in samps_per_frame):
         raise ValueError(
             "All channels in a FLAC signal file must have the same "
             "sampling rate and samples per frame"
         )
 
-    if pn_dir is None:
-        file_name = os.path.join(dir_name, file_name)
-
-    with _coreio._open_file(pn_dir, file_name, "rb") as fp:
-        signature = fp.read(4)
-        if signature != b"fLaC":
-            raise ValueError(f"{fp.name} is not a FLAC file")
-        fp.seek(0)
-
-        with soundfile.SoundFile(fp) as sf:
-            # Determine the actual resolution of the FLAC stream and the
-            # data type will use when reading it.  Note that soundfile
-            # doesn't support int8.
-            if sf.subtype == "PCM_S8":
-                format_bits = 8
-                read_dtype = "int16"
-            elif sf.subtype == "PCM_16":
-                format_bits = 16
-                read_dtype = "int16"
-            elif sf.subtype == "PCM_24":
-                format_bits = 24
-                read_dtype = "int32"
-            else:
-                raise ValueError(f"unknown subtype in {fp.name} ({sf.subtype})")
+    start_samp = start_frame * samps_per_frame[0] + sample_offset
+    n_samp = (end_frame - start_frame) * samps_per_frame[0]
+    n_pieces = max(1, min(n_workers, n_samp // CHUNK_SIZE))
+    piece_len = max(1, math.ceil(n_samp / n_pieces))
+
+    # Each piece is decoded from its own stream. Streams which are
+    # reused are kept open by the caller, the others are closed here.
+    streams = []
+    owned_streams = []
+
+    def get_stream(piece):
+        key = (dir_name, pn_dir, file_name)
+        if piece:
+            key += (piece,)
+        if file_handles is not None and key in file_handles:
+            return file_handles[key]
+        stream = _FlacStream(file_name, dir_name, pn_dir, fmt, n_sig)
+        if file_handles is not None:
+            file_handles[key] = stream
+        else:
+            owned_streams.append(stream)
+        return stream
 
-            max_bits = int(fmt) - 500
-            if format_bits > max_bits:
-                raise ValueError(
-                    f"wrong resolution in {fp.name} "
-                    f"({format_bits}, expected <= {max_bits})"
-                )
+    try:
+        streams.append(get_stream(0))
+        sig_data = np.empty((n_samp, n_sig), dtype=streams[0].read_dtype)
 
-            if sf.channels != n_sig:
-                raise ValueError(
-                    f"wrong number of channels in {fp.name} "
-                    f"({sf.channels}, expected {n_sig})"
-                )
+        pieces = [
+            sig_data[piece_start : piece_start + piece_len]
+            for piece_start in range(0, n_samp, piece_len)
+        ]
+
+        def rd_piece(piece):
+            stream = streams[0] if piece == 0 else get_stream(piece)
+            return stream.read(start_samp + piece * piece_len, pieces[piece])
 
-            # Read the samples.
-            start_samp = start_frame * samps_per_frame[0]
-            end_samp = end_frame * samps_per_frame[0]
-            sf.seek(start_samp + sample_offset)
-
-            # We could do this:
-            #  sig_data = sf.read(end_samp - start_samp, dtype=read_dtype)
-            # However, sf.read fails for huge blocks (over 2**24 total
-            # samples) due to a bug in libsndfile:
-            # https://github.com/libsndfile/libsndfile/issues/431
-            # So read the data in chunks instead.
-            n_samp = end_samp - start_samp
-            sig_data = np.empty((n_samp, n_sig), dtype=read_dtype)
-            CHUNK_SIZE = 1024 * 1024
-            for chunk_start in range(0, n_samp, CHUNK_SIZE):
-                chunk_end = chunk_start + CHUNK_SIZE
-                chunk_data = sf.read(out=sig_data[chunk_start:chunk_end])
-                samples_read = chunk_data.shape[0]
-                if samples_read != CHUNK_SIZE:
-                    sig_data = sig_data[: chunk_start + samples_read]
-                    break
-
-            # If we read an 8-bit stream as int16 or a 24-bit stream as
-            # int32, soundfile shifts each sample left by 8 bits.  We
-            # want to undo this shift (and, in the case of 8-bit data,
-            # convert to an int8 array.)
-            if format_bits == 8:
-                # np.right_shift(sig_data, 8, dtype='int8') doesn't work.
-                # This seems wrong, but the numpy documentation is unclear.
-                sig_data2 = np.empty(sig_data.shape, dtype="int8")
-                sig_data = np.right_shift(sig_data, 8, out=sig_data2)
-            elif format_bits == 24:
-                # Shift 32-bit array in-place.
-                np.right_shift(sig_data, 8, out=sig_data)
+        if len(pieces) > 1:
+            with multiprocessing.dummy.Pool(processes=len(pieces)) as pool:
+                n_reads = pool.map(rd_piece, range(len(pieces)))
+        else:
+            n_reads = [rd_piece(piece) for piece in range(len(pieces))]
+        format_bits = streams[0].format_bits
+    finally:
+        for stream in owned_streams:
+            stream.close()
+
+    # Keep the samples up to the end of the stream
+    n_read = 0
+    for piece, samples_read in zip(pieces, n_reads):
+        n_read += samples_read
+        if samples_read != len(piece):
+            break
+    sig_data = sig_data[:n_read]
+
+    # If we read an 8-bit stream as int16 or a 24-bit stream as
+    # int32, soundfile shifts each sample left by 8 bits.  We
+    # want to undo this shift (and, in the case of 8-bit data,
+    # convert to an int8 array.)
+    if format_bits == 8:
+        # np.right_shift(sig_data, 8, dtype='int8') doesn't work.
+        # This seems wrong, but the numpy documentation is unclear.
+        sig_data2 = np.empty(sig_data.shape, dtype="int8")
+        sig_data = np.right_shift(sig_data, 8, out=sig_data2)
+    elif format_bits == 24:
+        # Shift 32-bit array in-place.
+        np.right_shift(sig_data, 8, out=sig_data)
 
     # Suppose we have 3 channels and 2 samples per frame.  The array
     # returned by sf.read looks like this:
@@ -1950,8 +3157,9 @@ def _skew_sig(
 
     Parameters
     ----------
-    sig : ndarray
-        The original signal.
+    sig : ndarray, list
+        The original signal. Elements of a list which are None, for
+        signals that were not decoded, are skipped.
     skew : list
         List of samples to skew for each signal.
     n_sig : int
@@ -1979,19 +3187,22 @@ def _skew_sig(
     if max(skew) > 0:
         # Expanded frame samples. List of arrays.
         if isinstance(sig, list):
+            # Signals which were not decoded are left as None
+            decoded = [ch for ch in range(n_sig) if sig[ch] is not None]
+
             # Shift the channel samples
-            for ch in range(n_sig):
+            for ch in decoded:
                 if skew[ch] > 0:
                     sig[ch][: read_len * samps_per_frame[ch]] = sig[ch][
                         skew[ch] * samps_per_frame[ch] :
                     ]
 
             # Shave off the extra signal length at the end
-            for ch in range(n_sig):
+            for ch in decoded:
                 sig[ch] = sig[ch][: read_len * samps_per_frame[ch]]
 
             # Insert nans where skewed signal overran dat file
-            for ch in range(n_sig):
+            for ch in decoded:
                 if nan_replace[ch] > 0:
                     sig[ch][-nan_replace[ch] :] = _digi_nan(fmt)
         # Uniform array
@@ -2017,8 +3228,9 @@ def _check_sig_dims(sig, read_len, n_sig, samps_per_frame):
 
     Parameters
     ----------
-    sig : ndarray
-        The original signal.
+    sig : ndarray, list
+        The original signal. Elements of a list which are None, for
+        signals that were not decoded, are skipped.
     read_len : int
         The signal length to read per channel. Calculated
         by `sampto - sampfrom`.
@@ -2039,10 +3251,495 @@ def _check_sig_dims(sig, read_len, n_sig, samps_per_frame):
         if len(sig) != n_sig:
             raise ValueError("Samples were not loaded correctly")
         for ch in range(n_sig):
+            if sig[ch] is None:
+                continue
             if len(sig[ch]) != samps_per_frame[ch] * read_len:
                 raise ValueError("Samples were not loaded correctly")
 
 
+def _mmap_segment(
+    file_name,
+    dir_name,
+    fmt,
+    n_sig,
+    sig_len,
+    byte_offset,
+    samps_per_frame,
+    skew,
+    sampfrom,
+    sampto,
+    channels,
+    ignore_skew,
+):
+    """
+    Memory-map the stored samples of a single segment record's local
+    dat file(s), without reading or copying them.
+
+    Parameters
+    ----------
+    file_name : list
+        The names of the dat files to be mapped.
+    dir_name : str
+        The full directory where the dat file(s) are located.
+    fmt : list
+        The formats of the dat files. All must be in `MMAP_FMTS`.
+    n_sig : int
+        The number of signals contained in the dat file.
+    sig_len : int
+        The signal length (per channel) of the dat file.
+    byte_offset : list
+        The byte offset of the dat file.
+    samps_per_frame : list
+        The samples/frame for each signal of the dat file.
+    skew : list
+        The skew for the signals of the dat file.
+    sampfrom : int
+        The starting sample number to be read from the signals.
+    sampto : int
+        The final sample number to be read from the signals.
+    channels : list
+        List of integer indices specifying the channels to be mapped.
+    ignore_skew : bool
+        Whether to ignore the skew field and map all values contained in
+        the dat files unaligned (True).
+
+    Returns
+    -------
+    views : list
+        One read-only `np.memmap` view per wanted channel, holding the
+        stored (not offset-corrected) sample values of frames
+        `sampfrom` to `sampto`. Views are 1d for channels with one
+        sample per frame, and 2d (frames x samples/frame) otherwise.
+        A view is shorter than `sampto - sampfrom` if its skew runs past
+        the end of the dat file.
+
+    """
+    for f in set(fmt[c] for c in channels):
+        if f not in MMAP_FMTS:
+            raise ValueError(
+                "Memory-mapping is only supported for formats: %s"
+                % ", ".join(MMAP_FMTS)
+            )
+
+    samps_per_frame = [1 if s is None else s for s in samps_per_frame]
+    if ignore_skew:
+        skew = [0] * n_sig
+    else:
+        skew = [0 if s is None else s for s in skew]
+
+    file_name, datchannel = describe_list_indices(file_name)
+
+    views = [None] * len(channels)
+    for fn in file_name:
+        idc = [c for c in datchannel[fn] if c in channels]
+        if not idc:
+            continue
+        first_channel = datchannel[fn][0]
+        tsamps_per_frame = sum(samps_per_frame[c] for c in datchannel[fn])
+        frames = np.memmap(
+            os.path.join(dir_name, fn),
+            dtype=np.dtype(DATA_LOAD_TYPES[fmt[first_channel]]),
+            mode="r",
+            offset=byte_offset[first_channel] or 0,
+            shape=(sig_len, tsamps_per_frame),
+        )
+        for c in idc:
+            ch_start = sum(samps_per_frame[d] for d in datchannel[fn] if d < c)
+            ch_end = ch_start + samps_per_frame[c]
+            frame_start = min(sampfrom + skew[c], sig_len)
+            frame_end = min(sampto + skew[c], sig_len)
+            if samps_per_frame[c] == 1:
+                view = frames[frame_start:frame_end, ch_start]
+            else:
+                view = frames[frame_start:frame_end, ch_start:ch_end]
+            views[channels.index(c)] = view
+
+    return views
+
+
+class SignalProxy(abc.ABC):
+    """
+    Read-only, array-like (MxN) record signal whose samples are only
+    decoded when indexed.
+
+    Indexing with `[frames, channels]`, where each index may be an
+    integer, a slice, or a sequence of integers, returns a numpy array
+    holding only the requested samples, in digital or physical units.
+    Use `np.asarray` to load the entire signal at once.
+
+    Parameters
+    ----------
+    sig_len : int
+        The number of frames spanned by the signal.
+    fmt : list
+        The WFDB dat format of each channel.
+    adc_gain : list
+        The ADC gain of each channel.
+    baseline : list
+        The digital baseline of each channel.
+    physical : bool
+        Whether indexing returns physical (True) or digital (False)
+        values.
+    return_res : int, optional
+        The numpy array dtype of the returned values. Options are: 64,
+        32, 16, and 8, where the value represents the numpy int or float
+        dtype.
+
+    Notes
+    -----
+    Subclasses must implement `_read_digital`.
+
+    """
+
+    ndim = 2
+
+    def __init__(
+        self, sig_len, fmt, adc_gain, baseline, physical, return_res=64
+    ):
+        self.fmt = fmt
+        self.adc_gain = adc_gain
+        self.baseline = baseline
+        self.physical = physical
+        self.shape = (sig_len, len(fmt))
+
+        # Format 8 samples are accumulated into 32 bit integers
+        bit_res = max([32 if f == "8" else BIT_RES[f] for f in fmt] + [8])
+        self._digital_dtype = np.dtype(_np_dtype(bit_res, discrete=True))
+
+        if physical:
+            self.dtype = np.dtype("float" + str(return_res))
+        else:
+            # Do not allow changing integer dtype to lower value due to
+            # over/underflow
+            if self._digital_dtype.itemsize * 8 > return_res:
+                raise Exception(
+                    "Cannot convert digital samples to lower dtype. Risk of overflow/underflow."
+                )
+            self.dtype = np.dtype("int" + str(return_res))
+
+    @property
+    def size(self):
+        return self.shape[0] * self.shape[1]
+
+    def __len__(self):
+        return self.shape[0]
+
+    def __repr__(self):
+        return "%s(shape=%s, dtype=%s)" % (
+            type(self).__name__,
+            self.shape,
+            self.dtype,
+        )
+
+    def __array__(self, dtype=None):
+        signal = self[:, :]
+        if dtype is not None:
+            signal = signal.astype(dtype, copy=False)
+        return signal
+
+    def __getitem__(self, key):
+        if not isinstance(key, tuple):
+            key = (key,)
+        if len(key) > 2:
+            raise IndexError("too many indices for a 2-dimensional signal")
+        frame_key = key[0]
+        channel_key = key[1] if len(key) == 2 else slice(None)
+
+        channels = np.arange(self.shape[1])[channel_key]
+        squeeze_channel = channels.ndim == 0
+        channels = [int(c) for c in np.atleast_1d(channels)]
+
+        if isinstance(frame_key, slice):
+            frames = range(*frame_key.indices(self.shape[0]))
+            if not len(frames):
+                signal = np.empty((0, len(channels)), dtype=self.dtype)
+            else:
+                start = min(frames[0], frames[-1])
+                stop = max(frames[0], frames[-1]) + 1
+                signal = self._read(start, stop, channels)
+                signal = signal[frames[0] - start :: frames.step]
+        elif hasattr(frame_key, "__index__"):
+            frame = operator.index(frame_key)
+            if frame < 0:
+                frame += self.shape[0]
+            if not 0 <= frame < self.shape[0]:
+                raise IndexError(
+                    "frame index %d is out of bounds for signal of length %d"
+                    % (operator.index(frame_key), self.shape[0])
+                )
+            signal = self._read(frame, frame + 1, channels)[0]
+        else:
+            frames = np.asarray(frame_key)
+            if frames.dtype == bool:
+                if frames.shape != (self.shape[0],):
+                    raise IndexError("boolean frame index has wrong length")
+                frames = np.flatnonzero(frames)
+            elif frames.dtype.kind not in "iu":
+                raise IndexError("frame indices must be integers")
+            frames = np.where(frames < 0, frames + self.shape[0], frames)
+            if np.any((frames < 0) | (frames >= self.shape[0])):
+                raise IndexError("frame index is out of bounds")
+            if not frames.size:
+                signal = np.empty(
+                    frames.shape + (len(channels),), dtype=self.dtype
+                )
+            else:
+                start = int(frames.min())
+                signal = self._read(start, int(frames.max()) + 1, channels)
+                signal = signal[frames - start]
+
+        if squeeze_channel:
+            signal = signal[..., 0]
+        return signal
+
+    def _read(self, start, stop, channels):
+        """
+        Read frames `start` to `stop` of the specified channels, and
+        convert them to the proxy's output units and dtype.
+
+        """
+        digital = self._read_digital(start, stop, channels)
+        if not self.physical:
+            return digital.astype(self.dtype, copy=False)
+
+        signal = np.empty(digital.shape, dtype=self.dtype)
+        _dac_lut(
+            digital,
+            [self.fmt[c] for c in channels],
+            [self.adc_gain[c] for c in channels],
+            [self.baseline[c] for c in channels],
+            signal,
+        )
+        return signal
+
+    @abc.abstractmethod
+    def _read_digital(self, start, stop, channels):
+        """
+        Return the smoothed digital samples of frames `start` to `stop`
+        of the specified channels, as a 2d array.
+
+        """
+
+
+class MappedSignal(SignalProxy):
+    """
+    Record signal backed by memory-mapped dat files.
+
+    Only the pages of the dat files spanned by an indexed slice are
+    read, and the digital to physical conversion is applied to that
+    slice alone.
+
+    Parameters
+    ----------
+    views : list
+        The memory-mapped stored samples of each channel, as returned by
+        `_mmap_segment`.
+    sig_len : int
+        The number of frames spanned by the signal.
+    fmt : list
+        The WFDB dat format of each channel.
+    adc_gain : list
+        The ADC gain of each channel.
+    baseline : list
+        The digital baseline of each channel.
+    physical : bool
+        Whether indexing returns physical (True) or digital (False)
+        values.
+    return_res : int, optional
+        The numpy array dtype of the returned values.
+
+    Attributes
+    ----------
+    views : list
+        Zero-copy `np.memmap` views of the samples of each channel, as
+        stored in the dat file. For formats 80 and 160 these are offset
+        binary values.
+
+    """
+
+    def __init__(
+        self, views, sig_len, fmt, adc_gain, baseline, physical, return_res=64
+    ):
+        super(MappedSignal, self).__init__(
+            sig_len, fmt, adc_gain, baseline, physical, return_res
+        )
+        self.views = views
+
+    def _read_digital(self, start, stop, channels):
+        digital = np.empty(
+            (stop - start, len(channels)), dtype=self._digital_dtype
+        )
+        for i, ch in enumerate(channels):
+            fmt = self.fmt[ch]
+            samples = self.views[ch][start:stop]
+            n_valid = len(samples)
+
+            if fmt == "80":
+                samples = samples.astype("int16") - 128
+            elif fmt == "160":
+                samples = samples.astype("int32") - 32768
+
+            if samples.ndim == 2:
+                samples = (
+                    np.sum(samples, axis=1, dtype="int64") / samples.shape[1]
+                )
+            digital[:n_valid, i] = samples
+            # Skewed samples beyond the end of the dat file
+            digital[n_valid:, i] = _digi_nan(fmt)
+
+        return digital
+
+
+class LazySignal(SignalProxy):
+    """
+    Record signal which is read from its dat files on demand.
+
+    Each indexing operation calls `_rd_segment` for the frames and
+    channels it spans, so only those samples are read, decoded, and
+    converted.
+
+    Parameters
+    ----------
+    file_name : list
+        The names of the dat files of each signal of the record.
+    dir_name : str
+        The full directory where the dat file(s) are located, if the dat
+        file(s) are local.
+    pn_dir : str
+        The PhysioNet directory where the dat file(s) are located, if
+        the dat file(s) are remote.
+    fmt : list
+        The formats of each signal of the record.
+    n_sig : int
+        The number of signals of the record.
+    sig_len : int
+        The signal length (per channel) of the record.
+    byte_offset : list
+        The byte offset of the dat file of each signal.
+    samps_per_frame : list
+        The samples/frame of each signal.
+    skew : list
+        The skew of each signal.
+    init_value : list
+        The initial value of each signal.
+    adc_gain : list
+        The ADC gain of each signal.
+    baseline : list
+        The digital baseline of each signal.
+    sampfrom : int
+        The first frame of the record spanned by the proxy.
+    sampto : int
+        The frame of the record at which the proxy ends.
+    channels : list
+        The signals of the record spanned by the proxy.
+    ignore_skew : bool
+        Whether to ignore the skew field of the signals.
+    physical : bool
+        Whether indexing returns physical (True) or digital (False)
+        values.
+    return_res : int, optional
+        The numpy array dtype of the returned values.
+
+    """
+
+    def __init__(
+        self,
+        file_name,
+        dir_name,
+        pn_dir,
+        fmt,
+        n_sig,
+        sig_len,
+        byte_offset,
+        samps_per_frame,
+        skew,
+        init_value,
+        adc_gain,
+        baseline,
+        sampfrom,
+        sampto,
+        channels,
+        ignore_skew,
+        physical,
+        return_res=64,
+    ):
+        super(LazySignal, self).__init__(
+            sampto - sampfrom,
+            [fmt[c] for c in channels],
+            [adc_gain[c] for c in channels],
+            [baseline[c] for c in channels],
+            physical,
+            return_res,
+        )
+        self._segment = {
+            "file_name": file_name,
+            "dir_name": dir_name,
+            "pn_dir": pn_dir,
+            "fmt": fmt,
+            "n_sig": n_sig,
+            "sig_len": sig_len,
+            "byte_offset": byte_offset,
+            "samps_per_frame": samps_per_frame,
+            "skew": skew,
+            "init_value": init_value,
+            "ignore_skew": ignore_skew,
+        }
+        self.sampfrom = sampfrom
+        self.channels = channels
+
+        # Format 8 signals whose dat files are indexed can be read from
+        # anywhere. The others can only be reconstructed by reading from
+        # the start of the proxied range.
+        self._fmt8_unindexed = []
+        for c in channels:
+            if fmt[c] != "8":
+                continue
+            file_channels = [
+                ch for ch in range(n_sig) if file_name[ch] == file_name[c]
+            ]
+            index = _rd_fmt8_index(
+                file_name[c],
+                dir_name,
+                pn_dir,
+                byte_offset[c] or 0,
+                [samps_per_frame[ch] or 1 for ch in file_channels],
+                [init_value[ch] or 0 for ch in file_channels],
+            )
+            if index is None:
+                self._fmt8_unindexed.append(c)
+
+    def _read_digital(self, start, stop, channels):
+        read_start = start
+        if any(self.channels[c] in self._fmt8_unindexed for c in channels):
+            read_start = 0
+
+        record_channels = []
+        for c in channels:
+            if self.channels[c] not in record_channels:
+                record_channels.append(self.channels[c])
+
+        signals = _rd_segment(
+            sampfrom=self.sampfrom + read_start,
+            sampto=self.sampfrom + stop,
+            channels=record_channels,
+            **self._segment,
+        )
+
+        digital = np.empty(
+            (stop - start, len(channels)), dtype=self._digital_dtype
+        )
+        for i, c in enumerate(channels):
+            signal = signals[record_channels.index(self.channels[c])]
+            spf = len(signal) // (stop - read_start)
+            if spf > 1:
+                signal = (
+                    np.sum(signal.reshape(-1, spf), axis=1, dtype="int64") / spf
+                )
+            digital[:, i] = signal[start - read_start :]
+
+        return digital
+
+
 # ------------------- /Reading Signals -------------------#
 
 
@@ -2253,8 +3950,9 @@ def wr_dat_file(
     write_dir="",
 ):
     """
-    Write a dat file. All bytes are written one at a time to avoid
-    endianness issues.
+    Write a dat file. The samples are encoded in little-endian byte order
+    `CHUNK_SIZE` frames at a time, so that no temporary array the size of
+    the whole signal is allocated, and the input signals are not modified.
 
     Parameters
     ----------
@@ -2284,7 +3982,6 @@ def wr_dat_file(
     """
     file_path = os.path.join(write_dir, file_name)
 
-    # Combine list of arrays into single array
     if expanded:
         n_sig = len(e_d_signal)
         if len(samps_per_frame) != n_sig:
@@ -2294,129 +3991,33 @@ def wr_dat_file(
         for sig, spf in zip(e_d_signal, samps_per_frame):
             if len(sig) != sig_len * spf:
                 raise ValueError("mismatch in lengths of expanded signals")
-
-        # Effectively create MxN signal, with extra frame samples acting
-        # like extra channels
-        d_signal = np.zeros((sig_len, sum(samps_per_frame)), dtype="int64")
-        # Counter for channel number
-        expand_ch = 0
-        for ch in range(n_sig):
-            spf = samps_per_frame[ch]
-            for framenum in range(spf):
-                d_signal[:, expand_ch] = e_d_signal[ch][framenum::spf]
-                expand_ch = expand_ch + 1
     else:
-        # Create a copy to prevent overwrite
-        d_signal = d_signal.copy()
-
         # Non-expanded format always has 1 sample per frame
-        n_sig = d_signal.shape[1]
+        sig_len, n_sig = d_signal.shape
         samps_per_frame = [1] * n_sig
-
-    # Total number of samples per frame (equal to number of signals if
-    # expanded=False, but may be greater for expanded=True)
-    tsamps_per_frame = d_signal.shape[1]
-
-    if fmt == "80":
-        # convert to 8 bit offset binary form
-        d_signal = d_signal + 128
-        # Concatenate into 1D
-        d_signal = d_signal.reshape(-1)
-        # Convert to un_signed 8 bit dtype to write
-        b_write = d_signal.astype("uint8")
-
-    elif fmt == "212":
-        # Each sample is represented by a 12 bit two's complement
-        # amplitude. The first sample is obtained from the 12 least
-        # significant bits of the first byte pair (stored least
-        # significant byte first). The second sample is formed from the
-        # 4 remaining bits of the first byte pair (which are the 4 high
-        # bits of the 12-bit sample) and the next byte (which contains
-        # the remaining 8 bits of the second sample). The process is
-        # repeated for each successive pair of samples.
-
-        # convert to 12 bit two's complement
-        d_signal[d_signal < 0] = d_signal[d_signal < 0] + 4096
-
-        # Concatenate into 1D
-        d_signal = d_signal.reshape(-1)
-
-        n_samp = len(d_signal)
-        # use this for byte processing
-        processn_samp = n_samp
-
-        # Odd numbered number of samples. Fill in extra blank for
-        # following byte calculation.
-        if processn_samp % 2:
-            d_signal = np.concatenate([d_signal, np.array([0])])
-            processn_samp += 1
-
-        # The individual bytes to write
-        b_write = np.zeros([int(1.5 * processn_samp)], dtype="uint8")
-
-        # Fill in the byte triplets
-
-        # Triplet 1 from lowest 8 bits of sample 1
-        b_write[0::3] = d_signal[0::2] & 255
-        # Triplet 2 from highest 4 bits of samples 1 (lower) and 2 (upper)
-        b_write[1::3] = ((d_signal[0::2] & 3840) >> 8) + (
-            (d_signal[1::2] & 3840) >> 4
-        )
-        # Triplet 3 from lowest 8 bits of sample 2
-        b_write[2::3] = d_signal[1::2] & 255
-
-        # If we added an extra sample for byte calculation, remove the last byte (don't write)
-        if n_samp % 2:
-            b_write = b_write[:-1]
-
-    elif fmt == "16":
-        # convert to 16 bit two's complement
-        d_signal[d_signal < 0] = d_signal[d_signal < 0] + 65536
-        # Split samples into separate bytes using binary masks
-        b1 = d_signal & [255] * tsamps_per_frame
-        b2 = (d_signal & [65280] * tsamps_per_frame) >> 8
-        # Interweave the bytes so that the same samples' bytes are consecutive
-        b1 = b1.reshape((-1, 1))
-        b2 = b2.reshape((-1, 1))
-        b_write = np.concatenate((b1, b2), axis=1)
-        b_write = b_write.reshape((1, -1))[0]
-        # Convert to un_signed 8 bit dtype to write
-        b_write = b_write.astype("uint8")
-    elif fmt == "24":
-        # convert to 24 bit two's complement
-        d_signal[d_signal < 0] = d_signal[d_signal < 0] + 16777216
-        # Split samples into separate bytes using binary masks
-        b1 = d_signal & [255] * tsamps_per_frame
-        b2 = (d_signal & [65280] * tsamps_per_frame) >> 8
-        b3 = (d_signal & [16711680] * tsamps_per_frame) >> 16
-        # Interweave the bytes so that the same samples' bytes are consecutive
-        b1 = b1.reshape((-1, 1))
-        b2 = b2.reshape((-1, 1))
-        b3 = b3.reshape((-1, 1))
-        b_write = np.concatenate((b1, b2, b3), axis=1)
-        b_write = b_write.reshape((1, -1))[0]
-        # Convert to un_signed 8 bit dtype to write
-        b_write = b_write.astype("uint8")
-
-    elif fmt == "32":
-        # convert to 32 bit two's complement
-        d_signal[d_signal < 0] = d_signal[d_signal < 0] + 4294967296
-        # Split samples into separate bytes using binary masks
-        b1 = d_signal & [255] * tsamps_per_frame
-        b2 = (d_signal & [65280] * tsamps_per_frame) >> 8
-        b3 = (d_signal & [16711680] * tsamps_per_frame) >> 16
-        b4 = (d_signal & [4278190080] * tsamps_per_frame) >> 24
-        # Interweave the bytes so that the same samples' bytes are consecutive
-        b1 = b1.reshape((-1, 1))
-        b2 = b2.reshape((-1, 1))
-        b3 = b3.reshape((-1, 1))
-        b4 = b4.reshape((-1, 1))
-        b_write = np.concatenate((b1, b2, b3, b4), axis=1)
-        b_write = b_write.reshape((1, -1))[0]
-        # Convert to un_signed 8 bit dtype to write
-        b_write = b_write.astype("uint8")
-
-    elif fmt in ("508", "516", "524"):
+        e_d_signal = None
+
+    def frame_chunks():
+        # Blocks of the frames of the signals, with the extra samples of
+        # each frame acting like extra channels
+        for start in range(0, sig_len, CHUNK_SIZE):
+            stop = min(start + CHUNK_SIZE, sig_len)
+            if e_d_signal is None:
+                yield d_signal[start:stop]
+                continue
+            frames = np.empty(
+                (stop - start, sum(samps_per_frame)),
+                dtype=np.result_type(*e_d_signal),
+            )
+            expand_ch = 0
+            for sig, spf in zip(e_d_signal, samps_per_frame):
+                frames[:, expand_ch : expand_ch + spf] = sig[
+                    start * spf : stop * spf
+                ].reshape(-1, spf)
+                expand_ch += spf
+            yield frames
+
+    if fmt in ("508", "516", "524"):
         import soundfile
 
         if any(spf != samps_per_frame[0] for spf in samps_per_frame):
@@ -2429,23 +4030,12 @@ def wr_dat_file(
                 "A single FLAC signal file cannot contain more than 8 channels"
             )
 
-        d_signal = d_signal.reshape(-1, n_sig, samps_per_frame[0])
-        d_signal = d_signal.transpose(0, 2, 1)
-        d_signal = d_signal.reshape(-1, n_sig)
-
         if fmt == "508":
-            d_signal = d_signal.astype("int16")
-            np.left_shift(d_signal, 8, out=d_signal)
             subtype = "PCM_S8"
         elif fmt == "516":
-            d_signal = d_signal.astype("int16")
             subtype = "PCM_16"
-        elif fmt == "524":
-            d_signal = d_signal.astype("int32")
-            np.left_shift(d_signal, 8, out=d_signal)
-            subtype = "PCM_24"
         else:
-            raise ValueError(f"unknown format ({fmt})")
+            subtype = "PCM_24"
 
         sf = soundfile.SoundFile(
             file_path,
@@ -2456,29 +4046,102 @@ def wr_dat_file(
             format="FLAC",
         )
         with sf:
-            sf.write(d_signal)
-            return
+            for frames in frame_chunks():
+                frames = frames.reshape(-1, n_sig, samps_per_frame[0])
+                frames = frames.transpose(0, 2, 1).reshape(-1, n_sig)
+                if fmt == "508":
+                    frames = frames.astype("int16")
+                    np.left_shift(frames, 8, out=frames)
+                elif fmt == "516":
+                    frames = frames.astype("int16")
+                else:
+                    frames = frames.astype("int32")
+                    np.left_shift(frames, 8, out=frames)
+                sf.write(frames)
+        return
 
-    else:
+    if fmt not in ("80", "212", "16", "24", "32"):
         raise ValueError(
             "This library currently only supports writing the "
             "following formats: 80, 16, 24, 32, 508, 516, 524"
         )
 
-    # Byte offset in the file
-    if byte_offset is not None and byte_offset > 0:
-        print(
-            "Writing file "
-            + file_name
-            + " with "
-            + str(byte_offset)
-            + " empty leading bytes"
-        )
-        b_write = np.append(np.zeros(byte_offset, dtype="uint8"), b_write)
-
-    # Write the bytes to the file
     with open(file_path, "wb") as f:
-        b_write.tofile(f)
+        # Byte offset in the file
+        if byte_offset is not None and byte_offset > 0:
+            print(
+                "Writing file "
+                + file_name
+                + " with "
+                + str(byte_offset)
+                + " empty leading bytes"
+            )
+            f.write(bytes(byte_offset))
+
+        for frames in frame_chunks():
+            _encode_samples(frames.reshape(-1), fmt).tofile(f)
+
+
+def _encode_samples(samples, fmt):
+    """
+    Encode digital samples into the bytes of a dat file.
+
+    Parameters
+    ----------
+    samples : ndarray
+        The 1d array of samples to encode, in the order in which they
+        are stored. Samples are truncated to the bit resolution of the
+        format.
+    fmt : str
+        The WFDB fmt of the dat file. One of: 80, 212, 16, 24, 32.
+
+    Returns
+    -------
+    b_write : ndarray
+        The encoded bytes, or the samples in a little-endian dtype whose
+        memory holds them.
+
+    """
+    if fmt == "80":
+        # Convert to 8 bit offset binary form: the two's complement byte
+        # with the sign bit flipped
+        b_write = samples.astype("uint8")
+        np.bitwise_xor(b_write, 128, out=b_write)
+    elif fmt == "16":
+        b_write = samples.astype("<i2")
+    elif fmt == "32":
+        b_write = samples.astype("<i4")
+    elif fmt == "24":
+        # The three low bytes of each little-endian 32 bit sample, copied
+        # one byte position at a time, which numpy does faster than
+        # copying the (n x 3) block of bytes at once.
+        words = samples.astype("<i4").view("uint8").reshape(-1, 4)
+        b_write = np.empty((len(words), 3), dtype="uint8")
+        for byte_num in range(3):
+            b_write[:, byte_num] = words[:, byte_num]
+        b_write = b_write.reshape(-1)
+    elif fmt == "212":
+        # Each pair of 12 bit two's complement samples is stored in 3
+        # bytes: the 8 low bits of the first sample, then its 4 high bits
+        # (lower nibble) and the 4 high bits of the second sample (upper
+        # nibble), then the 8 low bits of the second sample.
+        n_samp = len(samples)
+        if n_samp % 2:
+            samples = np.append(samples, np.zeros(1, dtype=samples.dtype))
+        pairs = samples.reshape(-1, 2)
+        first = pairs[:, 0]
+        second = pairs[:, 1]
+        b_write = np.empty((len(pairs), 3), dtype="uint8")
+        # Assignment truncates the samples to their low bytes
+        b_write[:, 0] = first
+        b_write[:, 2] = second
+        high_bits = (first >> 8) & 0x0F
+        high_bits |= (second >> 4) & 0xF0
+        b_write[:, 1] = high_bits
+        # Without the extra byte of an odd number of samples
+        b_write = b_write.reshape(-1)[: (3 * n_samp + 1) // 2]
+
+    return b_write
 
 
 def describe_list_indices(full_list):
@@ -1,9 +1,12 @@
 import io
+import itertools
 import logging
+import multiprocessing.dummy
 import os
 import platform
 import re
 import threading
+import time
 import urllib.parse
 import urllib.request
 
@@ -17,6 +20,10 @@
 # Default buffer size for remote files.
 DEFAULT_BUFFER_SIZE = 32768
 
+# Maximum size of the data read ahead of sequential reads of remote
+# files.
+MAX_PREFETCH_SIZE = 16 * 1024**2
+
 # Logger for this module.
 _LOGGER = logging.getLogger(__name__)
 
@@ -25,6 +32,48 @@
     r"bytes (?:(\d+)-(\d+)|\*)/(?:(\d+)|\*)", re.ASCII | re.IGNORECASE
 )
 
+
+class TransferOptions(object):
+    """
+    Options of the transfers of remote files.
+
+    Attributes
+    ----------
+    max_connections : int
+        The maximum number of concurrent connections to each host.
+    part_size : int
+        The size in bytes of the parts in which large ranges of a remote
+        file are requested concurrently.
+    max_retries : int
+        The maximum number of times a request is retried after a
+        connection error or a transient error status (429, 500, 502,
+        503, or 504).
+    backoff_factor : float
+        The number of seconds to wait before the first retry, doubled
+        for each following retry.
+
+    """
+
+    max_connections: int
+    part_size: int
+    max_retries: int
+    backoff_factor: float
+
+
+# The options of remote transfers, set with `set_transfer_options`
+transfer_options = TransferOptions()
+transfer_options.max_connections = 2
+transfer_options.part_size = 8 * 1024**2
+transfer_options.max_retries = 3
+transfer_options.backoff_factor = 0.5
+
+# HTTP status codes of transient errors, for which requests are retried
+_RETRY_STATUS_CODES = (429, 500, 502, 503, 504)
+
+# Persistent cache of remote files (a `_remote_cache.RemoteCache`), or
+# None if it is disabled.
+_REMOTE_CACHE = None
+
 # Global session object.
 _SESSION = None
 _SESSION_PID = None
@@ -47,6 +96,7 @@ def _get_session():
     """
     import requests
     import requests.adapters
+    from urllib3.util.retry import Retry
 
     global _SESSION
     global _SESSION_PID
@@ -65,10 +115,19 @@ def _get_session():
                     ),
                 ]
             )
+            # Connections to each host are limited to max_connections,
+            # and requests wait for a free connection in the pool
+            retry = Retry(
+                total=transfer_options.max_retries,
+                backoff_factor=transfer_options.backoff_factor,
+                status_forcelist=_RETRY_STATUS_CODES,
+                raise_on_status=False,
+            )
             for protocol in ("http", "https"):
                 adapter = requests.adapters.HTTPAdapter(
-                    pool_maxsize=2,
+                    pool_maxsize=transfer_options.max_connections,
                     pool_block=True,
+                    max_retries=retry,
                 )
                 _SESSION.mount("%s://" % protocol, adapter)
 
@@ -80,6 +139,28 @@ def _get_session():
     return _SESSION
 
 
+def _reset_session():
+    """
+    Close and discard the session object, so that the next request
+    creates one with the current transfer options.
+
+    Parameters
+    ----------
+    N/A
+
+    Returns
+    -------
+    N/A
+
+    """
+    global _SESSION
+
+    with _SESSION_LOCK:
+        if _SESSION is not None:
+            _SESSION.close()
+        _SESSION = None
+
+
 class NetFileError(OSError):
     """An error occurred while reading a remote file."""
 
@@ -125,6 +206,11 @@ class RangeTransfer:
     file_size : int or None
         Total size of the remote file.  This may be None if the length
         is unknown.
+    etag : str or None
+        The ETag of the remote file, if given by the server.
+    last_modified : str or None
+        The Last-Modified time of the remote file, if given by the
+        server.
 
     Notes
     -----
@@ -192,9 +278,12 @@ def _parse_headers(self, method, response):
         - is_complete is set to true if the response is complete
         - _current_pos is set to the starting position
         - _expected_end_pos is set to the expected end position
+        - etag and last_modified are set to the validators of the file
 
         """
         self.response_url = response.url
+        self.etag = response.headers.get("ETag")
+        self.last_modified = response.headers.get("Last-Modified")
         self.file_size = None
         self.is_complete = False
         self._current_pos = 0
@@ -347,15 +436,26 @@ def content(self):
         start : int
             Byte offset within the remote file corresponding to the
             start of the response.
-        data : bytes
+        data : bytes or bytearray
             Contents of the response.
 
         """
         start = self._current_pos
-        chunks = []
+        if self._expected_end_pos is None:
+            chunks = []
+            for _, chunk_data in self.iter_chunks():
+                chunks.append(chunk_data)
+            return start, b"".join(chunks)
+
+        # The chunks are copied into a buffer of the expected size, so
+        # that they are not all held until they are joined.
+        data = bytearray(self._expected_end_pos - start)
+        count = 0
         for _, chunk_data in self.iter_chunks():
-            chunks.append(chunk_data)
-        return start, b"".join(chunks)
+            data[count : count + len(chunk_data)] = chunk_data
+            count += len(chunk_data)
+        del data[count:]
+        return start, data
 
 
 class NetFile(io.BufferedIOBase):
@@ -374,18 +474,37 @@ class NetFile(io.BufferedIOBase):
         specifies the minimum size of the internal buffer.  If
         buffering = -1, the default buffer size is used.
 
+    Notes
+    -----
+    Unless buffering is 0 or -2, when a read starts where the previous
+    one ended, the following range of the file is requested in a
+    background thread, so that it is transferred while the data already
+    read is processed. The size of this range starts at the size of the
+    reads, and doubles with each consecutive sequential read, up to
+    `MAX_PREFETCH_SIZE`.
+
+    If the persistent cache of remote files is enabled (see
+    `wfdb.io.set_remote_cache`) when the file is opened, data is read
+    from the cache in whole blocks, downloading the missing ones, and the
+    last block read is kept in the internal buffer.
+
     """
 
     def __init__(self, url, buffering=-1):
         self.url = url
         self.name = url
         self.buffering = buffering
+        self._cache = _REMOTE_CACHE
         self._pos = 0
         self._file_size = None
         self._buffer = b""
         self._buffer_start = 0
         self._buffer_end = 0
         self._current_url = self.url
+        # End of the last read, and size of the next range read ahead
+        self._last_end = None
+        self._prefetch_size = 0
+        self._prefetch = None
 
     def _read_buffered_range(self, start, end):
         """
@@ -419,6 +538,121 @@ def _read_range(self, start, end):
         the individual chunks are unspecified.  The total size may be
         less than requested if the end of the file is reached.
 
+        If the range starts where the previous one ended, the following
+        range is then read ahead in a background thread, and kept in the
+        internal buffer when it is next read.
+
+        Parameters
+        ----------
+        start : int
+            Starting byte offset of the desired range.
+        end : int or None
+            Ending byte offset of the desired range, or None to read
+            all data up to the end of the file.
+
+        Yields
+        ------
+        data : memoryview
+            A memoryview containing a chunk of the desired range.
+
+        """
+        # Reads are sequential if they start where the previous one
+        # ended.  The size of the range read ahead starts at the size of
+        # the read, and doubles each time it is used.
+        if start != self._last_end:
+            self._prefetch = None
+            self._prefetch_size = 0
+        elif not self._prefetch_size:
+            self._prefetch_size = DEFAULT_BUFFER_SIZE
+        pos = start
+
+        # Use the range read ahead once the read goes past the buffer.
+        prefetch = self._prefetch
+        if prefetch is not None:
+            if self._buffer_start <= start < self._buffer_end:
+                ahead = self._buffer_end
+            else:
+                ahead = start
+            if prefetch.start != ahead:
+                self._prefetch = None
+            elif end is None or end > ahead:
+                self._prefetch = None
+                if pos < ahead:
+                    yield self._read_buffered_range(pos, ahead)
+                    pos = ahead
+                data = prefetch.result()
+                if data:
+                    self._buffer = data
+                    self._buffer_start = ahead
+                    self._buffer_end = ahead + len(data)
+                    self._prefetch_size = min(
+                        2 * self._prefetch_size, MAX_PREFETCH_SIZE
+                    )
+
+        for data in self._transfer_range(pos, end):
+            pos += len(data)
+            yield data
+        self._last_end = pos
+
+        # Read ahead of the buffer, unless the end of the file was
+        # reached.
+        if self._buffer_start <= pos < self._buffer_end:
+            ahead = self._buffer_end
+        else:
+            ahead = pos
+        if (
+            self._prefetch_size
+            and self._prefetch is None
+            and self.buffering not in (0, BUFFER_WHOLE_FILE)
+            and end is not None
+            and pos == end
+            and (self._file_size is None or ahead < self._file_size)
+        ):
+            self._prefetch_size = min(
+                max(self._prefetch_size, pos - start), MAX_PREFETCH_SIZE
+            )
+            self._prefetch = _Prefetch(
+                self._fetch_range, ahead, ahead + self._prefetch_size
+            )
+
+    def _fetch_range(self, start, end):
+        """
+        Read a range of bytes from the remote file with a single request
+        (or from the persistent cache), without using the internal
+        buffer.
+
+        Parameters
+        ----------
+        start : int
+            Starting byte offset of the desired range.
+        end : int
+            Ending byte offset of the desired range.
+
+        Returns
+        -------
+        data : bytes
+            Contents of the range. The size may be less than requested
+            if the end of the file is reached.
+
+        """
+        if self._cache is None:
+            return _read_part(self._current_url, start, end)
+        return b"".join(
+            memoryview(block)[max(start - block_start, 0) : end - block_start]
+            for block_start, block in self._cache.iter_blocks(
+                self.url, start, end
+            )
+        )
+
+    def _transfer_range(self, start, end):
+        """
+        Read a range of bytes from the internal buffer or the remote
+        file, without reading ahead.
+
+        The result is returned as a sequence of chunks; the sizes of
+        the individual chunks are unspecified.  The total size may be
+        less than requested if the end of the file is reached.
+
         Parameters
         ----------
         start : int
@@ -447,6 +681,21 @@ def _read_range(self, start, end):
         if self._file_size is not None and start >= self._file_size:
             return
 
+        if self._cache is not None:
+            for block_start, block in self._cache.iter_blocks(
+                self.url, start, end
+            ):
+                self._buffer = block
+                self._buffer_start = block_start
+                self._buffer_end = block_start + len(block)
+                if end is None:
+                    range_end = self._buffer_end
+                else:
+                    range_end = min(end, self._buffer_end)
+                yield self._read_buffered_range(start, range_end)
+                start = range_end
+            return
+
         buffer_store = False
 
         if self.buffering == BUFFER_WHOLE_FILE:
@@ -470,6 +719,12 @@ def _read_range(self, start, end):
             if req_end < req_start + buffer_size:
                 req_end = req_start + buffer_size
                 buffer_store = True
+            elif (
+                transfer_options.max_connections > 1
+                and end - start > transfer_options.part_size
+            ):
+                yield from self._read_parts(start, end)
+                return
 
         with RangeTransfer(self._current_url, req_start, req_end) as xfer:
             # Update current file URL.
@@ -509,6 +764,65 @@ def _read_range(self, start, end):
             if self.buffering != 0:
                 self._file_size = xfer.file_size
 
+    def _read_parts(self, start, end):
+        """
+        Read a large range of bytes from the remote file, as parts of
+        `transfer_options.part_size` bytes requested concurrently over
+        several connections.
+
+        Parameters
+        ----------
+        start : int
+            Starting byte offset of the desired range.
+        end : int
+            Ending byte offset of the desired range.
+
+        Yields
+        ------
+        data : memoryview
+            A memoryview containing a chunk of the desired range.
+
+        """
+        part_size = transfer_options.part_size
+
+        # The first part shows whether the server supports ranges, and
+        # the size of the file.
+        with RangeTransfer(self._current_url, start, start + part_size) as xfer:
+            self._current_url = xfer.response_url
+            (data_start, data) = xfer.content()
+            if self.buffering != 0:
+                self._file_size = xfer.file_size
+
+        if xfer.is_complete:
+            # The server sent the entire file; save it in the buffer.
+            if self.buffering != 0:
+                self._buffer = data
+                self._buffer_start = data_start
+                self._buffer_end = data_start + len(data)
+            yield memoryview(data)[start - data_start : end - data_start]
+            return
+
+        yield memoryview(data)
+        if len(data) < part_size:
+            return
+        if xfer.file_size is not None:
+            end = min(end, xfer.file_size)
+        parts = [
+            (part_start, min(part_start + part_size, end))
+            for part_start in range(start + part_size, end, part_size)
+        ]
+        if not parts:
+            return
+
+        url = self._current_url
+        with multiprocessing.dummy.Pool(
+            processes=min(transfer_options.max_connections, len(parts))
+        ) as pool:
+            for data in pool.imap(lambda part: _read_part(url, *part), parts):
+                yield memoryview(data)
+                if len(data) < part_size:
+                    return
+
     def _get_size(self):
         """
         Determine the size of the remote file.
@@ -524,7 +838,9 @@ def _get_size(self):
 
         """
         size = self._file_size
-        if size is None:
+        if size is None and self._cache is not None:
+            size = self._file_size = self._cache.file_size(self.url)
+        elif size is None:
             if self.buffering == BUFFER_WHOLE_FILE:
                 for _ in self._read_range(0, None):
                     pass
@@ -701,6 +1017,22 @@ def seek(self, offset, whence=os.SEEK_SET):
         self._pos = pos
         return pos
 
+    def close(self):
+        """
+        Close the file, discarding any data being read ahead.
+
+        Parameters
+        ----------
+        N/A
+
+        Returns
+        -------
+        N/A
+
+        """
+        self._prefetch = None
+        super().close()
+
     def tell(self):
         """
         Retrieve the current file position.
@@ -718,6 +1050,101 @@ def tell(self):
         return self._pos
 
 
+class _Prefetch(object):
+    """
+    A range of bytes of a remote file, read in a background thread.
+
+    Parameters
+    ----------
+    fetch : callable
+        Function reading a range of bytes, given the starting and ending
+        byte offsets.
+    start : int
+        Starting byte offset of the range.
+    end : int
+        Ending byte offset of the range.
+
+    """
+
+    def __init__(self, fetch, start, end):
+        self.start = start
+        self.end = end
+        self._data = None
+        self._thread = threading.Thread(
+            target=self._run, args=(fetch,), daemon=True
+        )
+        self._thread.start()
+
+    def _run(self, fetch):
+        try:
+            self._data = fetch(self.start, self.end)
+        except Exception as exc:
+            # The range is read again when it is needed, so errors
+            # are reported then.
+            _LOGGER.info(
+                "Read-ahead of %s-%s failed: %s", self.start, self.end, exc
+            )
+
+    def result(self):
+        """
+        Wait for the range to be read.
+
+        Parameters
+        ----------
+        N/A
+
+        Returns
+        -------
+        data : bytes or None
+            Contents of the range, or None if it could not be read.
+
+        """
+        self._thread.join()
+        return self._data
+
+
+def _read_part(url, start, end):
+    """
+    Read a range of bytes from a remote file, retrying with exponential
+    backoff if the transfer is interrupted.
+
+    Parameters
+    ----------
+    url : str
+        URL of the remote file.
+    start : int
+        Starting byte offset of the desired range.
+    end : int
+        Ending byte offset of the desired range.
+
+    Returns
+    -------
+    data : bytes
+        Contents of the range. The size may be less than requested if
+        the end of the file is reached.
+
+    """
+    import requests
+
+    for attempt in itertools.count():
+        try:
+            with RangeTransfer(url, start, end) as xfer:
+                (data_start, data) = xfer.content()
+            break
+        except (
+            requests.exceptions.ConnectionError,
+            requests.exceptions.ChunkedEncodingError,
+            requests.exceptions.Timeout,
+        ):
+            if attempt >= transfer_options.max_retries:
+                raise
+            time.sleep(transfer_options.backoff_factor * 2**attempt)
+
+    if data and (xfer.is_complete or data_start != start):
+        raise NetFileError("Server did not return the requested range", url=url)
+    return data
+
+
 def openurl(
     url,
     mode="r",
@@ -1,17 +1,31 @@
+import collections
+import functools
 import json
 import multiprocessing.dummy
 import os
 import posixpath
+import threading
 
 import numpy as np
 
-from wfdb.io import _url
+from wfdb.io import _remote_cache, _url
 
 
 # The PhysioNet index url
 PN_INDEX_URL = "https://physionet.org/files/"
 PN_CONTENT_URL = "https://physionet.org/content/"
 
+# The maximum number of bytes between two ranges of a remote file which
+# are fetched with a single request by a `_RangePlan`
+COALESCE_GAP = 64 * 1024
+
+# The maximum number of bytes of the fetched ranges held by a
+# `_RangePlan` before they are read
+PLAN_MAX_BYTES = 64 * 1024**2
+
+# The size in bytes of the chunks in which remote files are downloaded
+DOWNLOAD_CHUNK_SIZE = 8 * 1024**2
+
 
 class Config(object):
     """
@@ -50,6 +64,153 @@ def set_db_index_url(db_index_url=PN_INDEX_URL):
     config.db_index_url = db_index_url
 
 
+def set_transfer_options(
+    max_connections=2,
+    part_size=8 * 1024**2,
+    max_retries=3,
+    backoff_factor=0.5,
+):
+    """
+    Set the options of the transfers of remote files. Calling this
+    function without arguments restores the default options.
+
+    Parameters
+    ----------
+    max_connections : int, optional
+        The maximum number of concurrent connections to each host, used
+        to download files with `dl_files` and `dl_database`, to request
+        the parts of large ranges of remote files concurrently, and to
+        request the segment headers and dat files of multi-segment
+        records read with `rdrecord` concurrently.
+        Please keep the default when downloading from PhysioNet, to
+        avoid overloading the server.
+    part_size : int, optional
+        The size in bytes of the parts in which ranges of remote files
+        larger than it are requested.
+    max_retries : int, optional
+        The maximum number of times a request is retried after a
+        connection error or a transient error status (429, 500, 502,
+        503, or 504).
+    backoff_factor : float, optional
+        The number of seconds to wait before the first retry, doubled
+        for each following retry.
+
+    Returns
+    -------
+    N/A
+
+    Examples
+    --------
+    >>> wfdb.set_db_index_url('https://mirror.example.org/files/')
+    >>> wfdb.set_transfer_options(max_connections=8)
+
+    """
+    if not hasattr(max_connections, "__index__") or max_connections < 1:
+        raise ValueError("max_connections must be a positive integer")
+    if not hasattr(part_size, "__index__") or part_size < 1:
+        raise ValueError("part_size must be a positive integer")
+    if not hasattr(max_retries, "__index__") or max_retries < 0:
+        raise ValueError("max_retries must be a non-negative integer")
+    if backoff_factor < 0:
+        raise ValueError("backoff_factor must be non-negative")
+
+    _url.transfer_options.max_connections = max_connections
+    _url.transfer_options.part_size = part_size
+    _url.transfer_options.max_retries = max_retries
+    _url.transfer_options.backoff_factor = backoff_factor
+    _url._reset_session()
+
+
+def set_remote_cache(cache_dir, max_bytes=10 * 1024**3, max_age=3600):
+    """
+    Configure the persistent cache of remote files.
+
+    When enabled, remote headers, annotations, and dat files (read with
+    `pn_dir`) are stored in a local directory as they are downloaded,
+    in blocks of 1 MiB, so that later reads of the same parts of the
+    same files, by this or any other process using the directory, do
+    not download them again. The cached copy of a file is checked
+    against the ETag, Last-Modified time, and size reported by the
+    server when it is used, at most once every `max_age` seconds, and
+    discarded if the file has changed.
+
+    Parameters
+    ----------
+    cache_dir : str
+        The directory in which to store the cached files, which is
+        created if it does not exist. The cache is disabled if None.
+    max_bytes : int, optional
+        The size budget of the cached files, in bytes. The least
+        recently used blocks are removed to stay within it.
+    max_age : float, optional
+        The number of seconds for which a cached file is used without
+        checking whether it has changed on the server.
+
+    Returns
+    -------
+    N/A
+
+    Examples
+    --------
+    >>> wfdb.set_remote_cache(os.path.expanduser('~/.cache/wfdb'))
+    >>> record = wfdb.rdrecord('100', pn_dir='mitdb', sampto=3600)
+    >>> wfdb.remote_cache_info()
+
+    """
+    if cache_dir is None:
+        _url._REMOTE_CACHE = None
+        return
+    if not hasattr(max_bytes, "__index__") or max_bytes < 0:
+        raise ValueError("max_bytes must be a non-negative integer")
+    if max_age < 0:
+        raise ValueError("max_age must be non-negative")
+    _url._REMOTE_CACHE = _remote_cache.RemoteCache(
+        cache_dir, max_bytes, max_age
+    )
+
+
+def remote_cache_info():
+    """
+    Return the statistics of the persistent cache of remote files.
+
+    Parameters
+    ----------
+    N/A
+
+    Returns
+    -------
+    info : RemoteCacheInfo or None
+        Named tuple of the number of blocks found in (`hits`) and
+        downloaded into (`misses`) the cache by this process since it
+        was configured or cleared, its directory (`cache_dir`) and
+        budget (`max_bytes`), and the size (`n_bytes`) and number
+        (`n_blocks`) of the cached blocks. None if the cache is
+        disabled.
+
+    """
+    if _url._REMOTE_CACHE is None:
+        return None
+    return _url._REMOTE_CACHE.info()
+
+
+def clear_remote_cache():
+    """
+    Remove all of the files stored in the persistent cache of remote
+    files, and reset its statistics.
+
+    Parameters
+    ----------
+    N/A
+
+    Returns
+    -------
+    N/A
+
+    """
+    if _url._REMOTE_CACHE is not None:
+        _url._REMOTE_CACHE.clear()
+
+
 def _remote_file_size(url=None, file_name=None, pn_dir=None):
     """
     Get the remote file size in bytes.
@@ -82,6 +243,417 @@ def _remote_file_size(url=None, file_name=None, pn_dir=None):
     return remote_file_size
 
 
+class _RangePlan(object):
+    """
+    The ranges of remote files needed by a read, fetched concurrently
+    ahead of the requests which would otherwise read them one at a
+    time.
+
+    Ranges are added to the plan with `add` and fetched with `fetch`.
+    The ranges of each file are coalesced with their neighbours if they
+    overlap or are at most `COALESCE_GAP` bytes apart, so that each group
+    is fetched with a single request, and the groups are fetched by
+    `_url.transfer_options.max_connections` threads. At most
+    `PLAN_MAX_BYTES` bytes of fetched ranges are held at a time: the
+    following ranges are fetched as the earlier ones are released, or
+    as soon as they are read.
+
+    The plan is used by the thread which enters it as a context
+    manager, and by the worker threads of its read which run functions
+    wrapped with `_with_plan`: their calls to `_stream_header` and
+    `_stream_dat` take the content of any fetched range containing what
+    they read, waiting for it if needed. A fetched range of a file is
+    released once each of the ranges coalesced into it has been read,
+    while whole files, such as headers, are fetched at once and kept
+    until the plan is closed.
+
+    Attributes
+    ----------
+    N/A
+
+    """
+
+    def __init__(self):
+        # The ranges of each URL added since the last fetch
+        self._ranges = {}
+        # The [start, end, result, n_reads] of the fetched ranges of each
+        # URL, where result is None until the range is submitted, and
+        # n_reads is the number of reads left before it is released
+        self._fetched = {}
+        # The (url, range) of the ranges waiting to be submitted, in
+        # order
+        self._queue = collections.deque()
+        # The number of bytes of the submitted ranges not yet released
+        self._n_bytes = 0
+        self._lock = threading.Lock()
+        self._pool = None
+        self._closed = False
+        self._previous = None
+
+    def add(self, url, start=0, end=None):
+        """
+        Add a range of a remote file to the plan.
+
+        Parameters
+        ----------
+        url : str
+            The URL of the remote file.
+        start : int, optional
+            The first byte of the range.
+        end : int, optional
+            The byte at which the range ends, or None for the whole file.
+
+        Returns
+        -------
+        N/A
+
+        """
+        if end is None:
+            start = 0
+        self._ranges.setdefault(url, []).append((start, end))
+
+    def fetch(self):
+        """
+        Start fetching the ranges added since the last fetch, and make
+        them available to the reads of remote files.
+
+        Parameters
+        ----------
+        N/A
+
+        Returns
+        -------
+        N/A
+
+        """
+        ranges = [
+            (url, start, end, n_reads)
+            for url, url_ranges in self._ranges.items()
+            for start, end, n_reads in _coalesce_ranges(url_ranges)
+        ]
+        self._ranges = {}
+        if not ranges:
+            return
+
+        with self._lock:
+            if self._closed:
+                return
+            if self._pool is None:
+                self._pool = multiprocessing.dummy.Pool(
+                    processes=_url.transfer_options.max_connections
+                )
+            for url, start, end, n_reads in ranges:
+                fetched = [start, end, None, n_reads]
+                self._fetched.setdefault(url, []).append(fetched)
+                if end is None:
+                    self._submit(url, fetched)
+                else:
+                    self._queue.append((url, fetched))
+            self._submit_queued()
+
+    def _submit(self, url, fetched):
+        """
+        Start fetching a range. The plan's lock must be held.
+
+        """
+        start, end = fetched[:2]
+        fetched[2] = self._pool.apply_async(_fetch_range, (url, start, end))
+        if end is not None:
+            self._n_bytes += end - start
+
+    def _submit_queued(self):
+        """
+        Start fetching the queued ranges, while fewer than
+        `PLAN_MAX_BYTES` bytes of ranges are held. The plan's lock must
+        be held.
+
+        """
+        while self._queue and self._n_bytes < PLAN_MAX_BYTES:
+            url, fetched = self._queue.popleft()
+            if fetched[2] is None:
+                self._submit(url, fetched)
+
+    def read(self, url, start=0, end=None):
+        """
+        Read a range of a remote file from the fetched ranges.
+
+        Parameters
+        ----------
+        url : str
+            The URL of the remote file.
+        start : int, optional
+            The first byte of the range.
+        end : int, optional
+            The byte at which the range ends, or None for the whole file.
+
+        Returns
+        -------
+        content : bytes-like object
+            The content of the range, or None if it is not contained in
+            a fetched range, or the plan is closed.
+
+        """
+        with self._lock:
+            if self._closed:
+                return None
+            for fetched in self._fetched.get(url, []):
+                f_start, f_end = fetched[:2]
+                if f_end is None or (
+                    end is not None and f_start <= start and end <= f_end
+                ):
+                    break
+            else:
+                return None
+            # A range read before its turn is fetched at once
+            if fetched[2] is None:
+                self._submit(url, fetched)
+            result = fetched[2]
+            if f_end is not None:
+                fetched[3] -= 1
+                if not fetched[3]:
+                    self._fetched[url].remove(fetched)
+                    self._n_bytes -= f_end - f_start
+                    self._submit_queued()
+
+        content = result.get()
+        if end is None:
+            return content
+        return memoryview(content)[start - f_start : end - f_start]
+
+    def close(self):
+        """
+        Stop fetching ranges, and release the fetched ranges. The ranges
+        being fetched are waited for, so that any read waiting for them
+        gets their content.
+
+        Parameters
+        ----------
+        N/A
+
+        Returns
+        -------
+        N/A
+
+        """
+        with self._lock:
+            self._closed = True
+            self._queue.clear()
+            self._fetched = {}
+            pool = self._pool
+            self._pool = None
+        if pool is not None:
+            pool.close()
+            pool.join()
+
+    def __enter__(self):
+        self._previous = getattr(_read_plans, "plan", None)
+        _read_plans.plan = self
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        _read_plans.plan = self._previous
+        self.close()
+
+
+# The range plan of the read done by each thread, whose fetched ranges
+# are used by its reads of remote files
+_read_plans = threading.local()
+
+
+def _with_plan(func):
+    """
+    Wrap a function to be run by the worker threads of a read, so that
+    its reads of remote files use the range plan of the calling thread,
+    if any.
+
+    Parameters
+    ----------
+    func : callable
+        The function to wrap.
+
+    Returns
+    -------
+    func : callable
+        The wrapped function.
+
+    """
+    plan = getattr(_read_plans, "plan", None)
+    if plan is None:
+        return func
+
+    @functools.wraps(func)
+    def wrapper(*args, **kwargs):
+        previous = getattr(_read_plans, "plan", None)
+        _read_plans.plan = plan
+        try:
+            return func(*args, **kwargs)
+        finally:
+            _read_plans.plan = previous
+
+    return wrapper
+
+
+def _coalesce_ranges(ranges):
+    """
+    Coalesce the ranges of a remote file which overlap or are at most
+    `COALESCE_GAP` bytes apart.
+
+    Parameters
+    ----------
+    ranges : list
+        The (start, end) byte pairs of the ranges, where an end of None
+        stands for the whole file.
+
+    Returns
+    -------
+    coalesced : list
+        The (start, end, n_ranges) of each coalesced range, in order,
+        giving the number of ranges coalesced into it.
+
+    """
+    coalesced = []
+    for start, end in sorted(
+        ranges, key=lambda r: (r[0], r[1] is None, r[1] or 0)
+    ):
+        if coalesced and (
+            coalesced[-1][1] is None or start <= coalesced[-1][1] + COALESCE_GAP
+        ):
+            last = coalesced[-1]
+            if last[1] is not None and (end is None or end > last[1]):
+                last[1] = end
+            last[2] += 1
+        else:
+            coalesced.append([start, end, 1])
+    return [tuple(c) for c in coalesced]
+
+
+def _fetch_range(url, start, end):
+    """
+    Read a range of a remote file.
+
+    Parameters
+    ----------
+    url : str
+        The URL of the remote file.
+    start : int
+        The first byte of the range.
+    end : int
+        The byte at which the range ends, or None for the whole file.
+
+    Returns
+    -------
+    content : bytes or ndarray
+        The content of the whole file, or the bytes of the range.
+
+    """
+    if end is None:
+        with _url.openurl(url, "rb") as f:
+            return f.read()
+    with _url.openurl(url, "rb", buffering=0) as f:
+        f.seek(start)
+        return _read_array(f, "u1", end - start)
+
+
+def _planned_read(url, start=0, end=None):
+    """
+    Read a range of a remote file from the fetched ranges of the range
+    plan of the current thread's read.
+
+    Parameters
+    ----------
+    url : str
+        The URL of the remote file.
+    start : int, optional
+        The first byte of the range.
+    end : int, optional
+        The byte at which the range ends, or None for the whole file.
+
+    Returns
+    -------
+    content : bytes-like object
+        The content of the range, or None if the plan has not fetched
+        it, or there is no plan.
+
+    """
+    plan = getattr(_read_plans, "plan", None)
+    if plan is None:
+        return None
+    return plan.read(url, start, end)
+
+
+def _read_array(f, dtype, n_bytes=None):
+    """
+    Read a binary file into a new numpy array, allocated once and filled
+    with `readinto`, without holding the bytes read in between.
+
+    Parameters
+    ----------
+    f : file-like object
+        The binary file, positioned at the first byte to read.
+    dtype : str
+        The numpy dtype to load the data into.
+    n_bytes : int, optional
+        The number of bytes to read. By default, the rest of the file is
+        read, whose size is determined once its first chunk is read.
+
+    Returns
+    -------
+    data : ndarray
+        The data read from the file. Trailing bytes which do not make up
+        a whole item are dropped.
+
+    """
+    dtype = np.dtype(dtype)
+    n_head = 0
+    if n_bytes is None:
+        # The size of a remote file is known after its first request,
+        # which reads the whole of a small file.
+        head = np.empty(_url.DEFAULT_BUFFER_SIZE, dtype="u1")
+        n_head = f.readinto(head)
+        if n_head < len(head):
+            n_head -= n_head % dtype.itemsize
+            return head[:n_head].view(dtype)
+        pos = f.tell()
+        n_bytes = f.seek(0, os.SEEK_END) - pos + n_head
+        f.seek(pos)
+
+    data = np.empty(n_bytes // dtype.itemsize, dtype=dtype)
+    buffer = data.view("u1")
+    if n_head:
+        buffer[:n_head] = head
+    count = n_head + f.readinto(buffer[n_head:])
+    return data[: count // dtype.itemsize]
+
+
+def _download_to_file(readfile, file_name, mode="wb"):
+    """
+    Write the rest of a remote file to a local file, one chunk at a
+    time. The local file is only opened once the first chunk has been
+    read.
+
+    Parameters
+    ----------
+    readfile : file-like object
+        The remote binary file, positioned at the first byte to write.
+    file_name : str
+        The name of the local file.
+    mode : str, optional
+        The mode in which to open the local file: 'wb' to overwrite it,
+        or 'ab' to append to it.
+
+    Returns
+    -------
+    N/A
+
+    """
+    buffer = memoryview(bytearray(DOWNLOAD_CHUNK_SIZE))
+    count = readfile.readinto(buffer)
+    with open(file_name, mode) as writefile:
+        while count:
+            writefile.write(buffer[:count])
+            count = readfile.readinto(buffer)
+
+
 def _stream_header(file_name: str, pn_dir: str) -> str:
     """
     Stream the text of a remote header file.
@@ -105,13 +677,17 @@ def _stream_header(file_name: str, pn_dir: str) -> str:
     url = posixpath.join(config.db_index_url, pn_dir, file_name)
 
     # Get the content of the remote file
-    with _url.openurl(url, "rb") as f:
-        content = f.read()
+    content = _planned_read(url)
+    if content is None:
+        with _url.openurl(url, "rb") as f:
+            content = f.read()
 
     return content.decode("iso-8859-1")
 
 
-def _stream_dat(file_name, pn_dir, byte_count, start_byte, dtype):
+def _stream_dat(
+    file_name, pn_dir, byte_count, start_byte, dtype, planned_only=False
+):
     """
     Stream data from a remote dat file into a 1d numpy array.
 
@@ -127,23 +703,33 @@ def _stream_dat(file_name, pn_dir, byte_count, start_byte, dtype):
         The starting byte number to read from.
     dtype : str
         The numpy dtype to load the data into.
+    planned_only : bool, optional
+        If True, the data is only read if it has been fetched by the
+        range plan of the current thread's read (see `_RangePlan`).
 
     Returns
     -------
     sig_data : ndarray
-        The data read from the dat file.
+        The data read from the dat file, or None if `planned_only` is
+        True and the data has not been fetched.
 
     """
     # Full url of dat file
     url = posixpath.join(config.db_index_url, pn_dir, file_name)
 
-    # Get the content
+    # Get the content, fetched ahead or read straight into the array
+    content = _planned_read(url, start_byte, start_byte + byte_count)
+    if content is not None:
+        dtype = np.dtype(dtype)
+        sig_data = np.empty(len(content) // dtype.itemsize, dtype=dtype)
+        sig_data.view("u1")[:] = content[: sig_data.nbytes]
+        return sig_data
+    if planned_only:
+        return None
+
     with _url.openurl(url, "rb", buffering=0) as f:
         f.seek(start_byte)
-        content = f.read(byte_count)
-
-    # Convert to numpy array
-    sig_data = np.fromstring(content, dtype=dtype)
+        sig_data = _read_array(f, dtype, byte_count)
 
     return sig_data
 
@@ -168,12 +754,9 @@ def _stream_annotation(file_name, pn_dir):
     # Full url of annotation file
     url = posixpath.join(config.db_index_url, pn_dir, file_name)
 
-    # Get the content
+    # Read the content into a numpy array
     with _url.openurl(url, "rb") as f:
-        content = f.read()
-
-    # Convert to numpy array
-    ann_data = np.fromstring(content, dtype=np.dtype("<u1"))
+        ann_data = _read_array(f, "<u1")
 
     return ann_data
 
@@ -438,8 +1021,7 @@ def dl_pn_file(inputs):
                         % local_file
                     )
                     f.seek(local_file_size, os.SEEK_SET)
-                    with open(local_file, "ba") as writefile:
-                        writefile.write(f.read())
+                    _download_to_file(f, local_file, mode="ab")
                     print("Done appending.")
                 # Local file is larger than it should be. Redownload.
                 elif local_file_size > remote_file_size:
@@ -455,7 +1037,7 @@ def dl_pn_file(inputs):
 
 def dl_full_file(url, save_file_name):
     """
-    Download a file. No checks are performed.
+    Download a file, one chunk at a time. No checks are performed.
 
     Parameters
     ----------
@@ -470,9 +1052,7 @@ def dl_full_file(url, save_file_name):
 
     """
     with _url.openurl(url, "rb") as readfile:
-        content = readfile.read()
-    with open(save_file_name, "wb") as writefile:
-        writefile.write(content)
+        _download_to_file(readfile, save_file_name)
 
     return
 
@@ -540,8 +1120,10 @@ def dl_files(db, dl_dir, files, keep_subdirs=True, overwrite=False):
 
     print("Downloading files...")
     # Create multiple processes to download files.
-    # Limit to 2 connections to avoid overloading the server
-    pool = multiprocessing.dummy.Pool(processes=2)
+    # Limit the connections to avoid overloading the server
+    pool = multiprocessing.dummy.Pool(
+        processes=_url.transfer_options.max_connections
+    )
     pool.map(dl_pn_file, dl_inputs)
     print("Finished downloading files")
 
@@ -1,8 +1,14 @@
+import collections
+import copy
 import datetime
+import multiprocessing
 import multiprocessing.dummy
 import posixpath
 import os
 import re
+import sys
+import threading
+import weakref
 
 import numpy as np
 import pandas as pd
@@ -695,20 +701,24 @@ class Record(BaseRecord, _header.HeaderMixin, _signal.SignalMixin):
 
     Attributes
     ----------
-    p_signal : ndarray, optional
+    p_signal : ndarray, iterable, optional
         An (MxN) 2d numpy array, where M is the signal length. Gives the
         physical signal values intended to be written. Either p_signal or
         d_signal must be set, but not both. If p_signal is set, this method will
         use it to perform analogue-digital conversion, writing the resultant
         digital values to the dat file(s). If fmt is set, gain and baseline must
         be set or unset together. If fmt is unset, gain and baseline must both
-        be unset.
-    d_signal : ndarray, optional
+        be unset. May also be a memory-mapped array, or an iterable of
+        2d arrays giving consecutive blocks of frames, which are converted
+        and written one block at a time (see Notes).
+    d_signal : ndarray, iterable, optional
         An (MxN) 2d numpy array, where M is the signal length. Gives the
         digital signal values intended to be directly written to the dat
         file(s). The dtype must be an integer type. Either p_signal or d_signal
         must be set, but not both. In addition, if d_signal is set, fmt, gain
-        and baseline must also all be set.
+        and baseline must also all be set. May also be a memory-mapped
+        array, or an iterable of 2d arrays giving consecutive blocks of
+        frames (see Notes).
     e_p_signal : ndarray, optional
         The expanded physical conversion of the signal. Either a 2d numpy
         array or a list of 1d numpy arrays.
@@ -919,7 +929,29 @@ def wrsamp(self, expanded=False, write_dir=""):
         -------
         N/A
 
+        Notes
+        -----
+        If `d_signal` is a `numpy.memmap` or an iterable of blocks of
+        frames, or if `d_signal` is unset and `p_signal` is one (converted
+        with the `adc_gain` and `baseline` fields), the signal is written
+        one block at a time, and the `sig_len`, `init_value`, and
+        `checksum` fields are set from the blocks written.
+
         """
+        if not expanded and self.n_sig:
+            if _is_signal_stream(self.d_signal):
+                signal, physical = self.d_signal, False
+            elif self.d_signal is None and _is_signal_stream(self.p_signal):
+                signal, physical = self.p_signal, True
+            else:
+                signal = None
+            if signal is not None:
+                header = _wr_signal_blocks(self, signal, physical, write_dir)
+                self.sig_len = header.sig_len
+                self.init_value = header.init_value
+                self.checksum = header.checksum
+                return
+
         # Update the checksum field (except for channels that did not have
         # a checksum to begin with, or where the checksum was already
         # valid.)
@@ -1000,6 +1032,107 @@ def _arrange_fields(self, channels, sampfrom, smooth_frames):
         # Adjust date and time if necessary
         self._adjust_datetime(sampfrom=sampfrom)
 
+    def _arrange_proxy_fields(self, signal, channels, sampfrom, physical):
+        """
+        Set an array-like signal proxy as the record's signal, and
+        arrange/edit object fields to reflect user channel and/or signal
+        range input.
+
+        Parameters
+        ----------
+        signal : SignalProxy
+            The (MxN) signal proxy of the channels and range read.
+        channels : list
+            List of channel numbers specified.
+        sampfrom : int
+            Starting sample number read.
+        physical : bool
+            Whether the proxy holds physical (True) or digital (False)
+            values.
+
+        Returns
+        -------
+        N/A
+
+        """
+        # Rearrange signal specification fields
+        for field in _header.SIGNAL_SPECS.index:
+            item = getattr(self, field)
+            setattr(self, field, [item[c] for c in channels])
+
+        # init_value to be updated if present unless the whole signal
+        # length was input. Computing the checksum would require reading
+        # the entire range, so it is dropped instead.
+        if self.sig_len != signal.shape[0]:
+            self.checksum = None
+            if self.init_value is not None:
+                ival = signal._read_digital(0, 1, list(range(len(channels))))
+                self.init_value = [int(i) for i in ival[0]]
+
+        self.n_sig = len(channels)
+        self.sig_len = signal.shape[0]
+
+        if physical:
+            self.p_signal = signal
+        else:
+            self.d_signal = signal
+
+        # Adjust date and time if necessary
+        self._adjust_datetime(sampfrom=sampfrom)
+
+    def _arrange_out_fields(
+        self, out, channels, sampfrom, physical, init_value, checksum
+    ):
+        """
+        Set an output array, into which the signal was read, as the
+        record's signal, and arrange/edit object fields to reflect user
+        channel and/or signal range input.
+
+        Parameters
+        ----------
+        out : ndarray
+            The (MxN) array holding the channels and range read.
+        channels : list
+            List of channel numbers specified.
+        sampfrom : int
+            Starting sample number read.
+        physical : bool
+            Whether the array holds physical (True) or digital (False)
+            values.
+        init_value : list
+            The first digital sample of each channel read.
+        checksum : list
+            The checksum of the digital samples of each channel read.
+
+        Returns
+        -------
+        N/A
+
+        """
+        # Rearrange signal specification fields
+        for field in _header.SIGNAL_SPECS.index:
+            item = getattr(self, field)
+            setattr(self, field, [item[c] for c in channels])
+
+        if physical:
+            self.p_signal = out
+        else:
+            self.d_signal = out
+
+        # Checksum and init_value to be updated if present unless the
+        # whole signal length was input
+        if self.sig_len != out.shape[0]:
+            if self.checksum is not None:
+                self.checksum = checksum
+            if self.init_value is not None:
+                self.init_value = init_value
+
+        self.n_sig = len(channels)
+        self.sig_len = out.shape[0]
+
+        # Adjust date and time if necessary
+        self._adjust_datetime(sampfrom=sampfrom)
+
     def to_dataframe(self) -> pd.DataFrame:
         """
         Create a dataframe containing the data from this record.
@@ -1288,7 +1421,9 @@ def _required_segments(self, sampfrom, sampto):
 
         return (seg_numbers, readsamps)
 
-    def _required_channels(self, seg_numbers, channels, dir_name, pn_dir):
+    def _required_channels(
+        self, seg_numbers, channels, dir_name, pn_dir, n_workers=1
+    ):
         """
         Get the channel numbers to be read from each specified segment,
         given the channel numbers specified for the entire record.
@@ -1308,6 +1443,9 @@ def _required_channels(self, seg_numbers, channels, dir_name, pn_dir):
             database directory from which to find the required record files.
             eg. For record '100' in 'http://physionet.org/content/mitdb'
             pn_dir='mitdb'.
+        n_workers : int, optional
+            The number of threads used to read the segment headers of
+            variable layout records concurrently.
 
         Returns
         -------
@@ -1327,23 +1465,310 @@ def _required_channels(self, seg_numbers, channels, dir_name, pn_dir):
             # The wanted signals
             w_sig_names = [l_sig_names[c] for c in channels]
 
-            # For each segment
-            for i in range(len(seg_numbers)):
+            def segment_channels(seg_num):
                 # Skip empty segments
-                if self.seg_name[seg_numbers[i]] == "~":
-                    required_channels.append([])
-                else:
-                    # Get the signal names of the current segment
-                    s_sig_names = rdheader(
-                        os.path.join(dir_name, self.seg_name[seg_numbers[i]]),
-                        pn_dir=pn_dir,
-                    ).sig_name
-                    required_channels.append(
-                        _get_wanted_channels(w_sig_names, s_sig_names)
+                if self.seg_name[seg_num] == "~":
+                    return []
+                # Get the signal names of the segment
+                s_sig_names = rdheader(
+                    os.path.join(dir_name, self.seg_name[seg_num]),
+                    pn_dir=pn_dir,
+                ).sig_name
+                return _get_wanted_channels(w_sig_names, s_sig_names)
+
+            # For each segment
+            if n_workers > 1 and len(seg_numbers) > 1:
+                with multiprocessing.dummy.Pool(
+                    processes=min(n_workers, len(seg_numbers))
+                ) as pool:
+                    required_channels = pool.map(
+                        download._with_plan(segment_channels), seg_numbers
                     )
+            else:
+                for seg_num in seg_numbers:
+                    required_channels.append(segment_channels(seg_num))
 
         return required_channels
 
+    def _plan_headers(self, plan, seg_numbers, pn_dir):
+        """
+        Fetch the remote segment headers needed to read the specified
+        segments concurrently, using a range plan.
+
+        Parameters
+        ----------
+        plan : _RangePlan
+            The range plan of the read.
+        seg_numbers : list
+            List of segment numbers to read.
+        pn_dir : str
+            The versioned PhysioNet directory of the record.
+
+        Returns
+        -------
+        N/A
+
+        """
+        seg_names = [self.seg_name[s] for s in seg_numbers]
+        if self.layout == "variable":
+            seg_names.insert(0, self.seg_name[0])
+        for seg_name in dict.fromkeys(seg_names):
+            if seg_name != "~":
+                plan.add(
+                    posixpath.join(
+                        download.config.db_index_url, pn_dir, seg_name + ".hea"
+                    )
+                )
+        plan.fetch()
+
+    def _plan_signals(
+        self, plan, seg_numbers, seg_ranges, seg_channels, dir_name, pn_dir
+    ):
+        """
+        Fetch the ranges of the remote dat files needed to read the
+        specified segments concurrently, using a range plan. The ranges
+        of dat files shared by several segments are coalesced.
+
+        Parameters
+        ----------
+        plan : _RangePlan
+            The range plan of the read, which has fetched the segment
+            headers.
+        seg_numbers : list
+            List of segment numbers to read.
+        seg_ranges : list
+            List of integer pairs, giving the sample ranges to read for
+            each segment number.
+        seg_channels : list
+            List of lists, containing channel indices to read for each
+            segment number.
+        dir_name : str
+            The local directory location of the header file.
+        pn_dir : str
+            The versioned PhysioNet directory of the record.
+
+        Returns
+        -------
+        N/A
+
+        """
+        # Cached signals are read in blocks of their own
+        if _signal._signal_cache.max_bytes:
+            return
+        for seg_num, seg_range, channels in zip(
+            seg_numbers, seg_ranges, seg_channels
+        ):
+            if self.seg_name[seg_num] == "~" or not channels:
+                continue
+            segment = rdheader(
+                os.path.join(dir_name, self.seg_name[seg_num]), pn_dir=pn_dir
+            )
+            if not segment.n_sig or segment.sig_len is None:
+                continue
+            for file_name, start_byte, end_byte in _signal._dat_byte_ranges(
+                file_name=segment.file_name,
+                fmt=segment.fmt,
+                sig_len=segment.sig_len,
+                byte_offset=segment.byte_offset,
+                samps_per_frame=segment.samps_per_frame,
+                skew=segment.skew,
+                sampfrom=seg_range[0],
+                sampto=seg_range[1],
+                channels=channels,
+            ):
+                plan.add(
+                    posixpath.join(
+                        download.config.db_index_url, pn_dir, file_name
+                    ),
+                    start_byte,
+                    end_byte,
+                )
+        plan.fetch()
+
+    def _rd_segments(
+        self,
+        seg_numbers,
+        seg_ranges,
+        seg_channels,
+        channels,
+        dir_name,
+        pn_dir,
+        physical,
+        smooth_frames,
+        return_res,
+        n_workers=1,
+        combine=False,
+        out=None,
+    ):
+        """
+        Read the desired samples of the required segments into the
+        `segments` field, optionally using concurrent threads.
+
+        If `combine` is True, the signal of each segment is copied into
+        its slice of a single preallocated signal spanning all segments
+        as soon as the segment is read, and is then released from the
+        segment's Record object, so that the signals of all segments
+        are never held in memory at once. The smoothed segments of
+        fixed layout records are decoded directly into their slices.
+
+        Parameters
+        ----------
+        seg_numbers : list
+            List of segment numbers to read.
+        seg_ranges : list
+            List of integer pairs, giving the sample ranges to read for
+            each segment number.
+        seg_channels : list
+            List of lists, containing channel indices to read for each
+            segment number.
+        channels : list
+            The channel indices to read for the whole record.
+        dir_name : str
+            The local directory location of the header file. This parameter
+            is ignored if `pn_dir` is set.
+        pn_dir : str
+            Option used to stream data from Physionet.
+        physical : bool
+            Whether to read the physical or digital signals.
+        smooth_frames : bool
+            Whether to read uniform (True) or expanded (False) signals.
+        return_res : int
+            The numpy array dtype of the read signals.
+        n_workers : int, optional
+            The number of segments to read concurrently.
+        combine : bool, optional
+            Whether to combine the segment signals as they are read.
+        out : ndarray, optional
+            The array to use as the combined signal of smoothed frames,
+            instead of allocating one.
+
+        Returns
+        -------
+        combined : tuple, optional
+            If `combine` is True, a tuple of the combined signal, the
+            signal names of its channels (or None for fixed layout
+            records), and a list of `(start, end, channels)` tuples
+            giving the frames and channels of the combined signal copied
+            from each segment, for use by `_combined_to_single`.
+
+        """
+        if physical:
+            sig_attr = "p_signal" if smooth_frames else "e_p_signal"
+        else:
+            sig_attr = "d_signal" if smooth_frames else "e_d_signal"
+        dtype = _signal._np_dtype(return_res, discrete=not physical)
+
+        if self.layout == "fixed":
+            sig_names = None
+        else:
+            sig_names = [self.segments[0].sig_name[c] for c in channels]
+
+        # Frames of the combined signal spanned by each segment
+        seg_ends = list(np.cumsum([r[1] - r[0] for r in seg_ranges]))
+        seg_starts = [0] + seg_ends[:-1]
+        if combine:
+            if out is not None:
+                combined_signal = out
+            elif smooth_frames:
+                combined_signal = np.empty(
+                    (sum(r[1] - r[0] for r in seg_ranges), len(channels)),
+                    dtype=dtype,
+                )
+            else:
+                # Allocated once the samples/frame of each channel is
+                # known
+                combined_signal = [None] * len(channels)
+        pieces = [(start, end, []) for start, end in zip(seg_starts, seg_ends)]
+
+        # Avoid nesting thread pools
+        if n_workers > 1 and len(seg_numbers) > 1:
+            seg_n_workers = 1
+        else:
+            seg_n_workers = n_workers
+
+        # Fixed layout segments contain the channels of the combined
+        # signal in order, so they can be read straight into it.
+        direct = combine and smooth_frames and sig_names is None
+
+        def rd_segment(i):
+            seg_num = seg_numbers[i]
+            # Empty segment or segment with no relevant channels
+            if self.seg_name[seg_num] == "~" or len(seg_channels[i]) == 0:
+                return i, None
+            if direct:
+                seg_out = combined_signal[seg_starts[i] : seg_ends[i]]
+            else:
+                seg_out = None
+            return i, rdrecord(
+                os.path.join(dir_name, self.seg_name[seg_num]),
+                sampfrom=seg_ranges[i][0],
+                sampto=seg_ranges[i][1],
+                channels=seg_channels[i],
+                physical=physical,
+                pn_dir=pn_dir,
+                smooth_frames=smooth_frames,
+                return_res=return_res,
+                n_workers=seg_n_workers,
+                out=seg_out,
+            )
+
+        if n_workers > 1 and len(seg_numbers) > 1:
+            pool = multiprocessing.dummy.Pool(
+                processes=min(n_workers, len(seg_numbers))
+            )
+            results = pool.imap_unordered(
+                download._with_plan(rd_segment), range(len(seg_numbers))
+            )
+        else:
+            pool = None
+            results = map(rd_segment, range(len(seg_numbers)))
+
+        try:
+            for i, seg in results:
+                self.segments[seg_numbers[i]] = seg
+                if seg is None or not combine:
+                    continue
+
+                # The segment channel to copy over for each channel of
+                # the combined signal
+                if sig_names is None:
+                    segment_channels = list(range(len(channels)))
+                else:
+                    segment_channels = _get_wanted_channels(
+                        sig_names, seg.sig_name, pad=True
+                    )
+                if out is not None and not physical:
+                    _check_out_dtype(
+                        out,
+                        [seg.fmt[c] for c in segment_channels if c is not None],
+                    )
+                signals = getattr(seg, sig_attr)
+                start, end, copied_channels = pieces[i]
+                for ch, seg_ch in enumerate(segment_channels):
+                    if seg_ch is None:
+                        continue
+                    if smooth_frames:
+                        if not direct:
+                            combined_signal[start:end, ch] = signals[:, seg_ch]
+                    else:
+                        spf = seg.samps_per_frame[seg_ch]
+                        if combined_signal[ch] is None:
+                            combined_signal[ch] = np.empty(
+                                seg_ends[-1] * spf, dtype=dtype
+                            )
+                        combined_signal[ch][start * spf : end * spf] = signals[
+                            seg_ch
+                        ]
+                    copied_channels.append(ch)
+                # Release the segment's signal
+                setattr(seg, sig_attr, None)
+        finally:
+            if pool is not None:
+                pool.terminate()
+
+        if combine:
+            return combined_signal, sig_names, pieces
+
     def _arrange_fields(
         self, seg_numbers, seg_ranges, channels, sampfrom=0, force_channels=True
     ):
@@ -1472,95 +1897,7 @@ def multi_to_single(self, physical, return_res=64, expanded=False):
 
         """
         # The fields to transfer to the new object
-        fields = self.__dict__.copy()
-
-        # Remove multirecord fields
-        for attr in ["segments", "seg_name", "seg_len", "n_seg"]:
-            del fields[attr]
-
-        # Figure out single segment fields to set for the new Record
-        if self.layout == "fixed":
-            # Get the fields from the first segment
-            for attr in [
-                "fmt",
-                "adc_gain",
-                "baseline",
-                "units",
-                "sig_name",
-                "samps_per_frame",
-            ]:
-                fields[attr] = getattr(self.segments[0], attr)
-        else:
-            # For variable layout records, inspect the segments for the
-            # attribute values.
-
-            # Coincidentally, if physical=False, figure out if this
-            # conversion can be performed. All signals of the same name
-            # must have the same fmt, gain, baseline, and units for all
-            # segments.
-
-            # For either physical or digital conversion, all signals
-            # of the same name must have the same samps_per_frame,
-            # which must match the value in the layout header.
-
-            # The layout header should be updated at this point to
-            # reflect channels. We can depend on it for sig_name and
-            # samps_per_frame, but not for fmt, adc_gain, units, and
-            # baseline.
-
-            # These signal names will be the key
-            signal_names = self.segments[0].sig_name
-            n_sig = len(signal_names)
-
-            # This will be the field dictionary to copy over.
-            reference_fields = {
-                "fmt": n_sig * [None],
-                "adc_gain": n_sig * [None],
-                "baseline": n_sig * [None],
-                "units": n_sig * [None],
-                "samps_per_frame": self.segments[0].samps_per_frame,
-            }
-
-            # For physical signals, mismatched fields will not be copied
-            # over. For digital, mismatches will cause an exception.
-            mismatched_fields = []
-            for seg in self.segments[1:]:
-                if seg is None:
-                    continue
-                # For each signal, check fmt, adc_gain, baseline, and
-                # units of each signal
-                for seg_ch in range(seg.n_sig):
-                    sig_name = seg.sig_name[seg_ch]
-                    # The overall channel
-                    ch = signal_names.index(sig_name)
-
-                    for field in reference_fields:
-                        item_ch = getattr(seg, field)[seg_ch]
-                        if reference_fields[field][ch] is None:
-                            reference_fields[field][ch] = item_ch
-                        # mismatch case
-                        elif reference_fields[field][ch] != item_ch:
-                            if field == "samps_per_frame":
-                                expected = reference_fields[field][ch]
-                                raise ValueError(
-                                    f"Incorrect samples per frame "
-                                    f"({item_ch} != {expected}) "
-                                    f"for signal {signal_names[ch]} "
-                                    f"in segment {seg.record_name} "
-                                    f"of {self.record_name}"
-                                )
-                            elif physical:
-                                mismatched_fields.append(field)
-                            else:
-                                raise Exception(
-                                    "This variable layout multi-segment record cannot be converted to single segment, in digital format."
-                                )
-            # Remove mismatched signal fields for physical signals
-            for field in set(mismatched_fields):
-                del reference_fields[field]
-            # At this point, the fields should be set for all channels
-            fields.update(reference_fields)
-            fields["sig_name"] = signal_names
+        fields = self._single_segment_fields(physical)
 
         # Figure out signal attribute to set, and its dtype.
         if physical:
@@ -1634,11 +1971,223 @@ def multi_to_single(self, physical, return_res=64, expanded=False):
                                 end = end_samps[i]
                                 combined_signal[start:end, ch] = signal
 
-        # Create the single segment Record object and set attributes
-        record = Record()
-        for field in fields:
-            setattr(record, field, fields[field])
-        setattr(record, sig_attr, combined_signal)
+        return self._single_segment_record(
+            fields, sig_attr, combined_signal, physical, expanded
+        )
+
+    def _combined_to_single(self, combined, physical, return_res=64):
+        """
+        Create a Record object from the MultiRecord object, whose segment
+        signals were combined while being read by `_rd_segments`.
+        Equivalent to `multi_to_single`, without copying the segment
+        signals again.
+
+        Parameters
+        ----------
+        combined : tuple
+            The combined signal, its signal names, and the pieces copied
+            from each segment, as returned by `_rd_segments`.
+        physical : bool
+            Whether the combined signal is physical or digital.
+        return_res : int, optional
+            The numpy array dtype of the combined signal.
+
+        Returns
+        -------
+        record : WFDB Record
+            The single segment record created.
+
+        """
+        combined_signal, sig_names, pieces = combined
+        expanded = isinstance(combined_signal, list)
+
+        # The fields to transfer to the new object
+        fields = self._single_segment_fields(physical)
+
+        if physical:
+            sig_attr = "e_p_signal" if expanded else "p_signal"
+            dtype = _signal._np_dtype(return_res, discrete=False)
+            nan_vals = self.n_sig * [np.nan]
+        else:
+            sig_attr = "e_d_signal" if expanded else "d_signal"
+            dtype = _signal._np_dtype(return_res, discrete=True)
+            nan_vals = _signal._digi_nan(fields["fmt"])
+
+        # Drop channels which were not contained in any segment read
+        if sig_names is not None and sig_names != fields["sig_name"]:
+            keep = [sig_names.index(name) for name in fields["sig_name"]]
+            if expanded:
+                combined_signal = [combined_signal[ch] for ch in keep]
+            else:
+                combined_signal = combined_signal[:, keep]
+            pieces = [
+                (start, end, [keep.index(ch) for ch in chs if ch in keep])
+                for start, end, chs in pieces
+            ]
+
+        # Fill the samples not contained in any segment with NaN
+        samps_per_frame = fields["samps_per_frame"]
+        for ch in range(self.n_sig):
+            if expanded and combined_signal[ch] is None:
+                combined_signal[ch] = np.empty(
+                    self.sig_len * samps_per_frame[ch], dtype=dtype
+                )
+            for start, end, chs in pieces:
+                if ch in chs:
+                    continue
+                if expanded:
+                    spf = samps_per_frame[ch]
+                    combined_signal[ch][start * spf : end * spf] = nan_vals[ch]
+                else:
+                    combined_signal[start:end, ch] = nan_vals[ch]
+
+        return self._single_segment_record(
+            fields, sig_attr, combined_signal, physical, expanded
+        )
+
+    def _single_segment_fields(self, physical):
+        """
+        Figure out the fields of the single segment Record object
+        converted from the MultiRecord object. Helper to
+        `multi_to_single`.
+
+        Parameters
+        ----------
+        physical : bool
+            Whether the physical or digital signal is to be converted.
+
+        Returns
+        -------
+        fields : dict
+            The fields of the single segment Record object.
+
+        """
+        # The fields to transfer to the new object
+        fields = self.__dict__.copy()
+
+        # Remove multirecord fields
+        for attr in ["segments", "seg_name", "seg_len", "n_seg"]:
+            del fields[attr]
+
+        # Figure out single segment fields to set for the new Record
+        if self.layout == "fixed":
+            # Get the fields from the first segment
+            for attr in [
+                "fmt",
+                "adc_gain",
+                "baseline",
+                "units",
+                "sig_name",
+                "samps_per_frame",
+            ]:
+                fields[attr] = getattr(self.segments[0], attr)
+        else:
+            # For variable layout records, inspect the segments for the
+            # attribute values.
+
+            # Coincidentally, if physical=False, figure out if this
+            # conversion can be performed. All signals of the same name
+            # must have the same fmt, gain, baseline, and units for all
+            # segments.
+
+            # For either physical or digital conversion, all signals
+            # of the same name must have the same samps_per_frame,
+            # which must match the value in the layout header.
+
+            # The layout header should be updated at this point to
+            # reflect channels. We can depend on it for sig_name and
+            # samps_per_frame, but not for fmt, adc_gain, units, and
+            # baseline.
+
+            # These signal names will be the key
+            signal_names = self.segments[0].sig_name
+            n_sig = len(signal_names)
+
+            # This will be the field dictionary to copy over.
+            reference_fields = {
+                "fmt": n_sig * [None],
+                "adc_gain": n_sig * [None],
+                "baseline": n_sig * [None],
+                "units": n_sig * [None],
+                "samps_per_frame": self.segments[0].samps_per_frame,
+            }
+
+            # For physical signals, mismatched fields will not be copied
+            # over. For digital, mismatches will cause an exception.
+            mismatched_fields = []
+            for seg in self.segments[1:]:
+                if seg is None:
+                    continue
+                # For each signal, check fmt, adc_gain, baseline, and
+                # units of each signal
+                for seg_ch in range(seg.n_sig):
+                    sig_name = seg.sig_name[seg_ch]
+                    # The overall channel
+                    ch = signal_names.index(sig_name)
+
+                    for field in reference_fields:
+                        item_ch = getattr(seg, field)[seg_ch]
+                        if reference_fields[field][ch] is None:
+                            reference_fields[field][ch] = item_ch
+                        # mismatch case
+                        elif reference_fields[field][ch] != item_ch:
+                            if field == "samps_per_frame":
+                                expected = reference_fields[field][ch]
+                                raise ValueError(
+                                    f"Incorrect samples per frame "
+                                    f"({item_ch} != {expected}) "
+                                    f"for signal {signal_names[ch]} "
+                                    f"in segment {seg.record_name} "
+                                    f"of {self.record_name}"
+                                )
+                            elif physical:
+                                mismatched_fields.append(field)
+                            else:
+                                raise Exception(
+                                    "This variable layout multi-segment record cannot be converted to single segment, in digital format."
+                                )
+            # Remove mismatched signal fields for physical signals
+            for field in set(mismatched_fields):
+                del reference_fields[field]
+            # At this point, the fields should be set for all channels
+            fields.update(reference_fields)
+            fields["sig_name"] = signal_names
+
+        return fields
+
+    def _single_segment_record(
+        self, fields, sig_attr, combined_signal, physical, expanded
+    ):
+        """
+        Create the single segment Record object converted from the
+        MultiRecord object, given its fields and combined signal. Helper
+        to `multi_to_single`.
+
+        Parameters
+        ----------
+        fields : dict
+            The fields of the record, as returned by
+            `_single_segment_fields`.
+        sig_attr : str
+            The signal attribute to set.
+        combined_signal : ndarray, list
+            The signal of all segments combined.
+        physical : bool
+            Whether the signal is physical or digital.
+        expanded : bool
+            Whether the signal is expanded.
+
+        Returns
+        -------
+        record : WFDB Record
+            The single segment record created.
+
+        """
+        # Create the single segment Record object and set attributes
+        record = Record()
+        for field in fields:
+            setattr(record, field, fields[field])
+        setattr(record, sig_attr, combined_signal)
 
         # Use the signal to set record features
         if physical:
@@ -1788,6 +2337,168 @@ def check_np_array(item, field_name, ndim, parent_class, channel_num=None):
 # ------------------------- Reading Records --------------------------- #
 
 
+HeaderCacheInfo = collections.namedtuple(
+    "HeaderCacheInfo", ["hits", "misses", "max_headers", "n_headers"]
+)
+
+
+class _HeaderCache(object):
+    """
+    Size-bounded, least recently used cache of parsed header files,
+    shared by the threads of the process. The cached records are never
+    handed out, only copies of them.
+
+    Parameters
+    ----------
+    max_headers : int
+        The number of cached headers, beyond which the least recently
+        used headers are evicted. The cache is disabled if 0.
+
+    """
+
+    def __init__(self, max_headers=0):
+        self.max_headers = max_headers
+        self.hits = 0
+        self.misses = 0
+        self._headers = collections.OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key):
+        with self._lock:
+            record = self._headers.get(key)
+            if record is None:
+                self.misses += 1
+            else:
+                self.hits += 1
+                self._headers.move_to_end(key)
+            return record
+
+    def put(self, key, record):
+        with self._lock:
+            if key in self._headers or not self.max_headers:
+                return
+            self._headers[key] = record
+            while len(self._headers) > self.max_headers:
+                self._headers.popitem(last=False)
+
+    def clear(self):
+        with self._lock:
+            self._headers.clear()
+            self.hits = 0
+            self.misses = 0
+
+    def info(self):
+        with self._lock:
+            return HeaderCacheInfo(
+                self.hits, self.misses, self.max_headers, len(self._headers)
+            )
+
+
+_header_cache = _HeaderCache()
+
+
+def _copy_header(record):
+    """
+    Copy a parsed header record, so that the copy can be modified
+    without affecting the original.
+
+    The header fields are immutable scalars, or lists of them, so only
+    the lists need to be copied.
+
+    Parameters
+    ----------
+    record : Record or MultiRecord
+        The record to copy, without any signals or segments.
+
+    Returns
+    -------
+    record : Record or MultiRecord
+        The copied record.
+
+    """
+    record = copy.copy(record)
+    for field, value in vars(record).items():
+        if isinstance(value, list):
+            setattr(record, field, list(value))
+    return record
+
+
+def set_header_cache(max_headers):
+    """
+    Configure the process-wide cache of parsed header files.
+
+    When enabled, `rdheader`, and every function that reads a header
+    through it (eg. `rdrecord`, `rdann`, `sampfreq`, `signame`,
+    `wfdbdesc`), parse each header file once and return copies of the
+    cached result afterwards. Local header files are parsed again when
+    their modification time or size changes. Remote header files are
+    keyed by their versioned PhysioNet directory.
+
+    Parameters
+    ----------
+    max_headers : int
+        The maximum number of cached header files. The least recently
+        used headers are evicted to stay within it. The cache is
+        disabled if 0, which is the default.
+
+    Returns
+    -------
+    N/A
+
+    Examples
+    --------
+    >>> wfdb.set_header_cache(100000)
+    >>> fs = [wfdb.sampfreq(name) for name in record_names]
+    >>> wfdb.header_cache_info()
+
+    """
+    if not hasattr(max_headers, "__index__") or max_headers < 0:
+        raise ValueError("max_headers must be a non-negative integer")
+
+    with _header_cache._lock:
+        _header_cache.max_headers = max_headers
+    _header_cache.clear()
+
+
+def header_cache_info():
+    """
+    Return the statistics of the process-wide parsed header cache.
+
+    Parameters
+    ----------
+    N/A
+
+    Returns
+    -------
+    info : HeaderCacheInfo
+        Named tuple of the number of headers found in (`hits`) and
+        missing from (`misses`) the cache since it was last cleared, its
+        capacity (`max_headers`), and the number of cached headers
+        (`n_headers`).
+
+    """
+    return _header_cache.info()
+
+
+def clear_header_cache():
+    """
+    Empty the process-wide parsed header cache, and reset its
+    statistics. This should be called after modifying header files in
+    place within the resolution of the file system's modification
+    times.
+
+    Parameters
+    ----------
+    N/A
+
+    Returns
+    -------
+    N/A
+
+    """
+    _header_cache.clear()
+
+
 def rdheader(record_name, pn_dir=None, rd_segments=False):
     """
     Read a WFDB header file and return a `Record` or `MultiRecord`
@@ -1833,8 +2544,66 @@ def rdheader(record_name, pn_dir=None, rd_segments=False):
             dir_list[0], download.get_version(dir_list[0]), *dir_list[1:]
         )
 
-    # Read the local or remote header file.
     file_name = f"{base_record_name}.hea"
+    if _header_cache.max_headers:
+        # Local headers are keyed by their modification time and size,
+        # so that edited files are parsed again. Remote headers are
+        # keyed by their versioned PhysioNet directory.
+        if pn_dir is None:
+            file_path = os.path.join(dir_name, file_name)
+            stat = os.stat(file_path)
+            key = (file_path, stat.st_mtime_ns, stat.st_size)
+        else:
+            key = (posixpath.join(pn_dir, file_name), None, None)
+        record = _header_cache.get(key)
+        if record is None:
+            record = _rd_header_file(file_name, dir_name, pn_dir)
+            _header_cache.put(key, record)
+        record = _copy_header(record)
+    else:
+        record = _rd_header_file(file_name, dir_name, pn_dir)
+
+    # If specified, read the segment headers
+    if isinstance(record, MultiRecord) and rd_segments:
+        record.segments = []
+        # Get the base record name (could be empty)
+        for s in record.seg_name:
+            if s == "~":
+                record.segments.append(None)
+            else:
+                record.segments.append(
+                    rdheader(os.path.join(dir_name, s), pn_dir)
+                )
+        # Fill in the sig_name attribute
+        record.sig_name = record.get_sig_name()
+        # Fill in the sig_segments attribute
+        record.sig_segments = record.get_sig_segments()
+
+    return record
+
+
+def _rd_header_file(file_name, dir_name, pn_dir):
+    """
+    Read and parse a WFDB header file, without its segment headers.
+
+    Parameters
+    ----------
+    file_name : str
+        The name of the header file.
+    dir_name : str
+        The full directory where the header file is located, if local.
+    pn_dir : str
+        The versioned PhysioNet directory where the header file is
+        located, if remote.
+
+    Returns
+    -------
+    record : Record or MultiRecord
+        The WFDB Record or MultiRecord object representing the contents
+        of the header read.
+
+    """
+    # Read the local or remote header file.
     if pn_dir is None:
         with open(
             os.path.join(dir_name, file_name),
@@ -1889,22 +2658,6 @@ def rdheader(record_name, pn_dir=None, rd_segments=False):
         else:
             record.layout = "fixed"
 
-        # If specified, read the segment headers
-        if rd_segments:
-            record.segments = []
-            # Get the base record name (could be empty)
-            for s in record.seg_name:
-                if s == "~":
-                    record.segments.append(None)
-                else:
-                    record.segments.append(
-                        rdheader(os.path.join(dir_name, s), pn_dir)
-                    )
-            # Fill in the sig_name attribute
-            record.sig_name = record.get_sig_name()
-            # Fill in the sig_segments attribute
-            record.sig_segments = record.get_sig_segments()
-
     # Set the comments field
     record.comments = [line.strip(" \t#") for line in comment_lines]
 
@@ -1925,6 +2678,10 @@ def rdrecord(
     force_channels=True,
     channel_names=None,
     warn_empty=False,
+    mmap=False,
+    lazy=False,
+    n_workers=1,
+    out=None,
 ):
     """
     Read a WFDB record and return the signal and record descriptors as
@@ -1941,7 +2698,9 @@ def rdrecord(
         record name, and the files fill be searched for remotely.
         Otherwise, the data files will be searched for in the local path.
     sampfrom : int, optional
-        The starting sample number to read for all channels.
+        The starting sample number to read for all channels. Format 8
+        signals are only correct when read from a nonzero `sampfrom` if
+        their dat files have been indexed with `wr_fmt8_index`.
     sampto : int, 'end', optional
         The sample number at which to stop reading for all channels.
         Reads the entire duration by default.
@@ -1990,6 +2749,43 @@ def rdrecord(
         Whether to display a warning if the specified channel indices
         or names are not contained in the record, and no signal is
         returned.
+    mmap : bool, optional
+        Whether to memory-map the dat files instead of reading them.
+        If True, the `p_signal` or `d_signal` field is a read-only
+        `MappedSignal` array-like object: indexing it, such as
+        `record.p_signal[start:stop, channels]`, reads and converts only
+        the requested samples, and its `views` attribute gives zero-copy
+        views of each channel's stored samples. Only supported for local
+        single segment records with formats 16, 32, 61, 80, and 160,
+        when `smooth_frames` is True. The record's checksum is not
+        computed when a partial signal range is read.
+    lazy : bool, optional
+        Whether to defer reading the signals until they are accessed.
+        If True, the `p_signal` or `d_signal` field is a read-only
+        `LazySignal` array-like object: indexing it, such as
+        `record.p_signal[start:stop, channels]`, reads, decodes, and
+        converts only the requested frames and channels from the dat
+        files each time. Only supported for single segment records when
+        `smooth_frames` is True, and cannot be combined with `mmap`.
+        The record's checksum is not computed when a partial signal
+        range is read.
+    n_workers : int, optional
+        The number of threads used to read and decode the dat files of
+        records with multiple signal files concurrently, or the segments
+        (and segment headers) of multi-segment records. Long reads of
+        compressed (FLAC) signal files are also split into pieces which
+        are decoded concurrently. By default, the files are read one at
+        a time.
+    out : ndarray, optional
+        A (read_len x len(channels)) array into which the signals are
+        decoded and converted, which becomes the `p_signal` or
+        `d_signal` field. It may be a view of a larger array, such as a
+        slice of a preallocated batch, so that no intermediate signal
+        array is allocated. Its dtype, which must be floating point if
+        `physical` is True and signed integer otherwise, takes
+        precedence over `return_res`. Requires `smooth_frames` to be
+        True, cannot be combined with `mmap` or `lazy`, and requires
+        `m2s` to be True for multi-segment records.
 
     Returns
     -------
@@ -2029,30 +2825,9 @@ def rdrecord(
     record = rdheader(record_name, pn_dir=pn_dir, rd_segments=False)
 
     # Set defaults for sampto and channels input variables
+    if record.sig_len is None:
+        record.sig_len = _infer_record_sig_len(record, dir_name, pn_dir)
     if sampto is None:
-        # If the header does not contain the signal length, figure it
-        # out from the first dat file. This is only possible for single
-        # segment records. If there are no signals, sig_len is 0.
-        if record.sig_len is None:
-            if record.n_sig == 0:
-                record.sig_len = 0
-            else:
-                # Calculate total number of samples per frame in the
-                # first dat file.
-                tsamps_per_frame = 0
-                for fname, spf in zip(record.file_name, record.samps_per_frame):
-                    if fname == record.file_name[0]:
-                        tsamps_per_frame += spf
-
-                # Calculate length from size of the dat file.
-                record.sig_len = _signal._infer_sig_len(
-                    file_name=record.file_name[0],
-                    fmt=record.fmt[0],
-                    tsamps_per_frame=tsamps_per_frame,
-                    byte_offset=record.byte_offset[0],
-                    dir_name=dir_name,
-                    pn_dir=pn_dir,
-                )
         sampto = record.sig_len
 
     # channel_names takes precedence over channels
@@ -2087,6 +2862,34 @@ def rdrecord(
     record.check_read_inputs(
         sampfrom, sampto, channels, physical, smooth_frames, return_res
     )
+    if not hasattr(n_workers, "__index__") or n_workers < 1:
+        raise ValueError("n_workers must be a positive integer")
+    if mmap and lazy:
+        raise ValueError("mmap and lazy cannot both be True")
+    if mmap or lazy:
+        mode = "mmap" if mmap else "lazy"
+        if not isinstance(record, Record):
+            raise ValueError(
+                "%s is only supported for single segment records" % mode
+            )
+        if not smooth_frames:
+            raise ValueError("%s requires smooth_frames to be True" % mode)
+    if mmap and pn_dir is not None:
+        raise ValueError("mmap is only supported for local records")
+    if out is not None:
+        _check_out(
+            out,
+            record,
+            sampfrom,
+            sampto,
+            channels,
+            physical,
+            smooth_frames,
+            mmap,
+            lazy,
+            m2s,
+            force_channels,
+        )
 
     # If the signal doesn't have the specified channels, there will be
     # no signal. Recall that `rdsamp` is not called on segments of multi
@@ -2105,6 +2908,108 @@ def rdrecord(
         if warn_empty:
             print("None of the specified signals were contained in the record")
 
+    # A single segment record with memory-mapped dat files
+    elif mmap:
+        views = _signal._mmap_segment(
+            file_name=record.file_name,
+            dir_name=dir_name,
+            fmt=record.fmt,
+            n_sig=record.n_sig,
+            sig_len=record.sig_len,
+            byte_offset=record.byte_offset,
+            samps_per_frame=record.samps_per_frame,
+            skew=record.skew,
+            sampfrom=sampfrom,
+            sampto=sampto,
+            channels=channels,
+            ignore_skew=ignore_skew,
+        )
+        signal = _signal.MappedSignal(
+            views=views,
+            sig_len=sampto - sampfrom,
+            fmt=[record.fmt[c] for c in channels],
+            adc_gain=[record.adc_gain[c] for c in channels],
+            baseline=[record.baseline[c] for c in channels],
+            physical=physical,
+            return_res=return_res,
+        )
+        record._arrange_proxy_fields(
+            signal=signal,
+            channels=channels,
+            sampfrom=sampfrom,
+            physical=physical,
+        )
+
+    # A single segment record read on demand
+    elif lazy:
+        signal = _signal.LazySignal(
+            file_name=record.file_name,
+            dir_name=dir_name,
+            pn_dir=pn_dir,
+            fmt=record.fmt,
+            n_sig=record.n_sig,
+            sig_len=record.sig_len,
+            byte_offset=record.byte_offset,
+            samps_per_frame=record.samps_per_frame,
+            skew=record.skew,
+            init_value=record.init_value,
+            adc_gain=record.adc_gain,
+            baseline=record.baseline,
+            sampfrom=sampfrom,
+            sampto=sampto,
+            channels=channels,
+            ignore_skew=ignore_skew,
+            physical=physical,
+            return_res=return_res,
+        )
+        record._arrange_proxy_fields(
+            signal=signal,
+            channels=channels,
+            sampfrom=sampfrom,
+            physical=physical,
+        )
+
+    # A single segment record decoded into the output array. Physical
+    # signals are decoded and converted in chunks, directly into their
+    # final array.
+    elif isinstance(record, Record) and (
+        out is not None or (physical and smooth_frames)
+    ):
+        if out is None:
+            out = np.empty(
+                (sampto - sampfrom, len(channels)),
+                dtype=_signal._np_dtype(return_res, discrete=False),
+            )
+        init_value, checksum = _signal._rd_segment(
+            file_name=record.file_name,
+            dir_name=dir_name,
+            pn_dir=pn_dir,
+            fmt=record.fmt,
+            n_sig=record.n_sig,
+            sig_len=record.sig_len,
+            byte_offset=record.byte_offset,
+            samps_per_frame=record.samps_per_frame,
+            skew=record.skew,
+            init_value=record.init_value,
+            sampfrom=sampfrom,
+            sampto=sampto,
+            channels=channels,
+            ignore_skew=ignore_skew,
+            return_res=return_res,
+            n_workers=n_workers,
+            out=out,
+            adc_gain=record.adc_gain if physical else None,
+            baseline=record.baseline if physical else None,
+        )
+        record._arrange_out_fields(
+            out=out,
+            channels=channels,
+            sampfrom=sampfrom,
+            physical=physical,
+            init_value=init_value,
+            checksum=checksum,
+        )
+
     # A single segment record
     elif isinstance(record, Record):
         no_file = False
@@ -2128,6 +3033,7 @@ def rdrecord(
             no_file=no_file,
             sig_data=sig_data,
             return_res=return_res,
+            n_workers=n_workers,
         )
 
         # Only 1 sample/frame, or frames are smoothed. Return uniform numpy array
@@ -2138,10 +3044,6 @@ def rdrecord(
                 channels=channels, sampfrom=sampfrom, smooth_frames=True
             )
 
-            if physical:
-                # Perform inplace dac to get physical signal
-                record.dac(expanded=False, return_res=return_res, inplace=True)
-
         # Return each sample of the signals with multiple samples per frame
         else:
             # Arrange/edit the object fields to reflect user channel
@@ -2152,7 +3054,12 @@ def rdrecord(
 
             if physical:
                 # Perform dac to get physical signal
-                record.dac(expanded=True, return_res=return_res, inplace=True)
+                record.dac(
+                    expanded=True,
+                    return_res=return_res,
+                    inplace=True,
+                    lut=return_res == 16,
+                )
 
     # A multi segment record
     else:
@@ -2171,37 +3078,53 @@ def rdrecord(
 
         record.segments = [None] * record.n_seg
 
-        # Variable layout, read the layout specification header
-        if record.layout == "variable":
-            record.segments[0] = rdheader(
-                os.path.join(dir_name, record.seg_name[0]), pn_dir=pn_dir
-            )
-
         # The segment numbers and samples within each segment to read.
         seg_numbers, seg_ranges = record._required_segments(sampfrom, sampto)
-        # The channels within each segment to read
-        seg_channels = record._required_channels(
-            seg_numbers, channels, dir_name, pn_dir
-        )
 
-        # Read the desired samples in the relevant segments
-        for i in range(len(seg_numbers)):
-            seg_num = seg_numbers[i]
-            # Empty segment or segment with no relevant channels
-            if record.seg_name[seg_num] == "~" or len(seg_channels[i]) == 0:
-                record.segments[seg_num] = None
-            else:
-                record.segments[seg_num] = rdrecord(
-                    os.path.join(dir_name, record.seg_name[seg_num]),
-                    sampfrom=seg_ranges[i][0],
-                    sampto=seg_ranges[i][1],
-                    channels=seg_channels[i],
-                    physical=physical,
-                    pn_dir=pn_dir,
-                    smooth_frames=smooth_frames,
-                    return_res=return_res,
+        # The remote segment headers, and then the ranges of the dat
+        # files, are fetched concurrently ahead of being read.
+        with download._RangePlan() as plan:
+            if pn_dir is not None:
+                record._plan_headers(plan, seg_numbers, pn_dir)
+
+            # Variable layout, read the layout specification header
+            if record.layout == "variable":
+                record.segments[0] = rdheader(
+                    os.path.join(dir_name, record.seg_name[0]), pn_dir=pn_dir
                 )
 
+            # The channels within each segment to read
+            seg_channels = record._required_channels(
+                seg_numbers, channels, dir_name, pn_dir, n_workers=n_workers
+            )
+            if pn_dir is not None:
+                record._plan_signals(
+                    plan,
+                    seg_numbers,
+                    seg_ranges,
+                    seg_channels,
+                    dir_name,
+                    pn_dir,
+                )
+
+            # Read the desired samples in the relevant segments. When
+            # converting to a single segment Record, the segment signals
+            # are combined as soon as each one is read.
+            combined = record._rd_segments(
+                seg_numbers=seg_numbers,
+                seg_ranges=seg_ranges,
+                seg_channels=seg_channels,
+                channels=channels,
+                dir_name=dir_name,
+                pn_dir=pn_dir,
+                physical=physical,
+                smooth_frames=smooth_frames,
+                return_res=return_res,
+                n_workers=n_workers,
+                combine=m2s,
+                out=out,
+            )
+
         # Arrange the fields of the layout specification segment, and
         # the overall object, to reflect user input.
         record._arrange_fields(
@@ -2214,14 +3137,18 @@ def rdrecord(
 
         # Convert object into a single segment Record object
         if m2s:
-            record = record.multi_to_single(
-                physical=physical,
-                expanded=(not smooth_frames),
-                return_res=return_res,
+            record = record._combined_to_single(
+                combined, physical=physical, return_res=return_res
             )
 
-    # Perform dtype conversion if necessary
-    if isinstance(record, Record) and record.n_sig > 0:
+    # Perform dtype conversion if necessary. Signal proxies already
+    # return the requested dtype, and output arrays keep their own.
+    if (
+        isinstance(record, Record)
+        and record.n_sig > 0
+        and not (mmap or lazy)
+        and out is None
+    ):
         record.convert_dtype(physical, return_res, smooth_frames)
 
     return record
@@ -2236,6 +3163,8 @@ def rdsamp(
     channel_names=None,
     warn_empty=False,
     return_res=64,
+    mmap=False,
+    out=None,
 ):
     """
     Read a WFDB record, and return the physical signals and a few important
@@ -2273,6 +3202,15 @@ def rdsamp(
         32, 16, and 8, where the value represents the numpy int or float
         dtype. Note that the value cannot be 8 when physical is True
         since there is no float8 format.
+    mmap : bool, optional
+        Whether to memory-map the dat files instead of reading them. If
+        True, `signals` is a read-only `MappedSignal` array-like object
+        which only reads and converts the samples that are indexed. See
+        `rdrecord` for the supported records.
+    out : ndarray, optional
+        A (read_len x len(channels)) float array, such as a view of a
+        larger preallocated array, into which the physical signals are
+        decoded and which is returned as `signals`. See `rdrecord`.
 
     Returns
     -------
@@ -2325,6 +3263,8 @@ def rdsamp(
         return_res=return_res,
         channel_names=channel_names,
         warn_empty=warn_empty,
+        mmap=mmap,
+        out=out,
     )
 
     signals = record.p_signal
@@ -2344,6 +3284,836 @@ def rdsamp(
     return signals, fields
 
 
+# Signal arrays of at least this many bytes are passed back from the
+# processes of `rdrecords` through shared memory rather than pickled.
+SHARED_MEMORY_MIN_BYTES = 64 * 1024
+
+
+def rdrecords(
+    record_names,
+    sampfrom=0,
+    sampto=None,
+    channels=None,
+    physical=True,
+    pn_dir=None,
+    m2s=True,
+    smooth_frames=True,
+    ignore_skew=False,
+    return_res=64,
+    force_channels=True,
+    channel_names=None,
+    warn_empty=False,
+    n_workers=1,
+    executor="thread",
+):
+    """
+    Read many WFDB records in parallel, and return them in order.
+
+    Each record is read with `rdrecord`, using the same arguments for
+    every record.
+
+    Parameters
+    ----------
+    record_names : list
+        The names of the WFDB records to be read, as given to `rdrecord`.
+    sampfrom : int, optional
+        The starting sample number to read for all channels.
+    sampto : int, 'end', optional
+        The sample number at which to stop reading for all channels.
+        Reads the entire duration by default.
+    channels : list, optional
+        List of integer indices specifying the channels to be read.
+        Reads all channels by default.
+    physical : bool, optional
+        Specifies whether to return signals in physical units in the
+        `p_signal` field (True), or digital units in the `d_signal`
+        field (False).
+    pn_dir : str, optional
+        Option used to stream data from Physionet. The Physionet
+        database directory from which to find the required record files.
+        eg. For record '100' in 'http://physionet.org/content/mitdb'
+        pn_dir='mitdb'.
+    m2s : bool, optional
+        Used when reading multi-segment records. Specifies whether to
+        directly return a WFDB MultiRecord object (False), or to convert
+        it into and return a WFDB Record object (True).
+    smooth_frames : bool, optional
+        Specifies whether to smooth the samples in signals with more
+        than one sample per frame and return an (MxN) uniform numpy
+        array as the `d_signal` or `p_signal` field (True), or to
+        return a list of 1d numpy arrays containing every expanded
+        sample as the `e_d_signal` or `e_p_signal` field (False).
+    ignore_skew : bool, optional
+        Used when reading records with at least one skewed signal.
+        Specifies whether to apply the skew to align the signals in the
+        output variable (False), or to ignore the skew field and load in
+        all values contained in the dat files unaligned (True).
+    return_res : int, optional
+        The numpy array dtype of the returned signals. Options are: 64,
+        32, 16, and 8, where the value represents the numpy int or float
+        dtype. Note that the value cannot be 8 when physical is True
+        since there is no float8 format.
+    force_channels : bool, optional
+        Used when reading multi-segment variable layout records. Whether
+        to update the layout specification record, and the converted
+        Record object if `m2s` is True, to match the input `channels`
+        argument, or to omit channels in which no read segment contains
+        the signals.
+    channel_names : list, optional
+        List of channel names to return. If this parameter is specified,
+        it takes precedence over `channels`.
+    warn_empty : bool, optional
+        Whether to display a warning if the specified channel indices
+        or names are not contained in the record, and no signal is
+        returned.
+    n_workers : int, optional
+        The number of records read concurrently. By default, the records
+        are read one at a time.
+    executor : str, optional
+        Whether the records are read by a pool of threads ('thread'), or
+        of processes ('process'). Decoding and converting the signals
+        partly holds the global interpreter lock, so processes scale
+        better with many workers. Signal arrays larger than
+        `SHARED_MEMORY_MIN_BYTES` are passed back from the processes
+        through shared memory on POSIX systems with Python 3.8 or later,
+        instead of being pickled.
+
+    Returns
+    -------
+    records : list
+        The WFDB Record or MultiRecord objects read, in the order of
+        `record_names`.
+
+    Examples
+    --------
+    >>> records = wfdb.rdrecords(['sample-data/100', 'sample-data/101'],
+                                 n_workers=2, executor='process')
+
+    """
+    if not hasattr(n_workers, "__index__") or n_workers < 1:
+        raise ValueError("n_workers must be a positive integer")
+    if executor not in ("thread", "process"):
+        raise ValueError("executor must be 'thread' or 'process'")
+
+    # Look up the database version once, rather than for every record
+    if (pn_dir is not None) and ("." not in pn_dir):
+        dir_list = pn_dir.split("/")
+        pn_dir = posixpath.join(
+            dir_list[0], download.get_version(dir_list[0]), *dir_list[1:]
+        )
+
+    kwargs = dict(
+        sampfrom=sampfrom,
+        sampto=sampto,
+        channels=channels,
+        physical=physical,
+        pn_dir=pn_dir,
+        m2s=m2s,
+        smooth_frames=smooth_frames,
+        ignore_skew=ignore_skew,
+        return_res=return_res,
+        force_channels=force_channels,
+        channel_names=channel_names,
+        warn_empty=warn_empty,
+    )
+    if n_workers == 1 or len(record_names) < 2:
+        return [rdrecord(record_name, **kwargs) for record_name in record_names]
+
+    # Shared memory was added in Python 3.8
+    share = (
+        executor == "process"
+        and os.name == "posix"
+        and sys.version_info >= (3, 8)
+    )
+    tasks = [(record_name, kwargs, share) for record_name in record_names]
+    n_workers = min(n_workers, len(record_names))
+    if executor == "process":
+        # Register the shared memory blocks of all of the processes with
+        # a single resource tracker, which cleans them up if the pool is
+        # terminated.
+        if share:
+            from multiprocessing import resource_tracker
+
+            resource_tracker.ensure_running()
+        pool = multiprocessing.Pool(processes=n_workers)
+    else:
+        pool = multiprocessing.dummy.Pool(processes=n_workers)
+
+    # Gather every result before raising any error, so that no shared
+    # memory block is left behind.
+    records = []
+    error = None
+    with pool:
+        for record, exception in pool.imap(_rd_record_task, tasks):
+            if share and record is not None:
+                _unshare_signals(record)
+            if error is None:
+                error = exception
+            records.append(record)
+    if error is not None:
+        raise error
+
+    return records
+
+
+def _rd_record_task(task):
+    """
+    Read a record for `rdrecords`, in a worker thread or process.
+
+    Parameters
+    ----------
+    task : tuple
+        The name of the record, the keyword arguments of `rdrecord`, and
+        whether to move its signal arrays into shared memory.
+
+    Returns
+    -------
+    record : Record or MultiRecord
+        The record read, or None if it could not be read.
+    exception : Exception
+        The error raised when reading the record, if any.
+
+    """
+    record_name, kwargs, share = task
+    try:
+        record = rdrecord(record_name, **kwargs)
+    except Exception as e:
+        return None, e
+    if share:
+        _share_signals(record)
+    return record, None
+
+
+# The fields of Record objects which may contain signal arrays
+_SIGNAL_FIELDS = ("p_signal", "d_signal", "e_p_signal", "e_d_signal")
+
+# A signal array stored in a named shared memory block
+_SharedArray = collections.namedtuple(
+    "_SharedArray", ["name", "shape", "dtype"]
+)
+
+
+def _share_signals(record):
+    """
+    Move the large signal arrays of a record into shared memory blocks,
+    replacing them with references to the blocks. The blocks are closed
+    in this process, and must be unlinked by `_unshare_signals`.
+
+    Parameters
+    ----------
+    record : Record or MultiRecord
+        The record whose signals are moved. The segments of MultiRecord
+        objects are handled.
+
+    Returns
+    -------
+    N/A
+
+    """
+    from multiprocessing import shared_memory
+
+    def share(array):
+        if not isinstance(array, np.ndarray) or (
+            array.nbytes < SHARED_MEMORY_MIN_BYTES
+        ):
+            return array
+        shm = shared_memory.SharedMemory(create=True, size=array.nbytes)
+        try:
+            shared = np.ndarray(array.shape, array.dtype, buffer=shm.buf)
+            shared[...] = array
+            del shared
+        except BaseException:
+            shm.close()
+            shm.unlink()
+            raise
+        shm.close()
+        return _SharedArray(shm.name, array.shape, array.dtype.str)
+
+    for rec in getattr(record, "segments", None) or [record]:
+        if rec is None:
+            continue
+        for field in _SIGNAL_FIELDS:
+            value = getattr(rec, field, None)
+            if isinstance(value, list):
+                setattr(rec, field, [share(array) for array in value])
+            elif value is not None:
+                setattr(rec, field, share(value))
+
+
+def _unshare_signals(record):
+    """
+    Restore the signal arrays of a record from the shared memory blocks
+    created by `_share_signals`. The arrays use the blocks in place, and
+    the blocks are unlinked at once, but only closed once their array is
+    garbage collected.
+
+    Parameters
+    ----------
+    record : Record or MultiRecord
+        The record whose signals are restored.
+
+    Returns
+    -------
+    N/A
+
+    """
+
+    from multiprocessing import shared_memory
+
+    def unshare(array):
+        if not isinstance(array, _SharedArray):
+            return array
+        shm = shared_memory.SharedMemory(name=array.name)
+        # The memory stays mapped after its name is removed
+        shm.unlink()
+        try:
+            unshared = np.ndarray(
+                array.shape, np.dtype(array.dtype), buffer=shm.buf
+            )
+        except BaseException:
+            shm.close()
+            raise
+        weakref.finalize(unshared, shm.close)
+        return unshared
+
+    for rec in getattr(record, "segments", None) or [record]:
+        if rec is None:
+            continue
+        for field in _SIGNAL_FIELDS:
+            value = getattr(rec, field, None)
+            if isinstance(value, list):
+                setattr(rec, field, [unshare(array) for array in value])
+            elif value is not None:
+                setattr(rec, field, unshare(value))
+
+
+def iter_record(
+    record_name,
+    chunk_frames=65536,
+    sampfrom=0,
+    sampto=None,
+    channels=None,
+    physical=True,
+    pn_dir=None,
+    smooth_frames=True,
+    ignore_skew=False,
+    return_res=64,
+):
+    """
+    Iterate over the signals of a WFDB record in consecutive blocks of
+    frames, without loading the entire record into memory.
+
+    The record header is parsed once, and the dat files are kept open
+    for the duration of the iteration. Blocks of multi-segment records
+    transparently span segment boundaries.
+
+    Parameters
+    ----------
+    record_name : str
+        The name of the WFDB record to be read, without any file
+        extensions. If the argument contains any path delimiter
+        characters, the argument will be interpreted as PATH/BASE_RECORD.
+        Both relative and absolute paths are accepted. If the `pn_dir`
+        parameter is set, this parameter should contain just the base
+        record name, and the files fill be searched for remotely.
+        Otherwise, the data files will be searched for in the local path.
+    chunk_frames : int, optional
+        The number of frames in each block. The last block may be
+        shorter.
+    sampfrom : int, optional
+        The starting sample number to read for all channels.
+    sampto : int, optional
+        The sample number at which to stop reading for all channels.
+        Reads the entire duration by default.
+    channels : list, optional
+        List of integer indices specifying the channels to be read.
+        Reads all channels by default.
+    physical : bool, optional
+        Specifies whether to return signals in physical units (True), or
+        digital units (False).
+    pn_dir : str, optional
+        Option used to stream data from Physionet. The Physionet
+        database directory from which to find the required record files.
+        eg. For record '100' in 'http://physionet.org/content/mitdb'
+        pn_dir='mitdb'.
+    smooth_frames : bool, optional
+        Specifies whether to smooth the samples in signals with more
+        than one sample per frame and return each block as an (MxN)
+        uniform numpy array (True), or to return each block as a list of
+        1d numpy arrays containing every expanded sample (False).
+    ignore_skew : bool, optional
+        Used when reading records with at least one skewed signal.
+        Specifies whether to apply the skew to align the signals in the
+        output variable (False), or to ignore the skew field and load in
+        all values contained in the dat files unaligned (True).
+    return_res : int, optional
+        The numpy array dtype of the returned signals. Options are: 64,
+        32, 16, and 8, where the value represents the numpy int or float
+        dtype. Note that the value cannot be 8 when physical is True
+        since there is no float8 format.
+
+    Returns
+    -------
+    blocks : generator
+        Generator of `(start_frame, signal)` tuples, where `start_frame`
+        is the sample number of the record at which the block starts,
+        and `signal` holds the block's samples in the same form as the
+        `p_signal`/`d_signal` (or `e_p_signal`/`e_d_signal`) field
+        returned by `rdrecord`. For multi-segment records, samples of
+        channels missing from a segment are NaN, or the digital NaN
+        value of the channel's format.
+
+    Notes
+    -----
+    Format 8 signals are reconstructed continuously across blocks,
+    consistently with reading the entire range using `rdrecord`. If
+    `sampfrom` is not 0, they are only correct if their dat files have
+    been indexed with `wr_fmt8_index`.
+
+    Examples
+    --------
+    >>> for start, signal in wfdb.iter_record('sample-data/100',
+                                              chunk_frames=3600):
+    ...     print(start, signal.mean(axis=0))
+
+    """
+    dir_name, base_record_name = os.path.split(record_name)
+    dir_name = os.path.abspath(dir_name)
+
+    if (pn_dir is not None) and ("." not in pn_dir):
+        dir_list = pn_dir.split("/")
+        pn_dir = posixpath.join(
+            dir_list[0], download.get_version(dir_list[0]), *dir_list[1:]
+        )
+
+    record = rdheader(record_name, pn_dir=pn_dir, rd_segments=False)
+
+    if sampto is None:
+        if record.sig_len is None:
+            record.sig_len = _infer_record_sig_len(record, dir_name, pn_dir)
+        sampto = record.sig_len
+    if channels is None:
+        channels = list(range(record.n_sig))
+
+    # Ensure that input fields are valid for the record
+    record.check_read_inputs(
+        sampfrom, sampto, channels, physical, smooth_frames, return_res
+    )
+    if not hasattr(chunk_frames, "__index__") or chunk_frames < 1:
+        raise ValueError("chunk_frames must be a positive integer")
+
+    read_args = {
+        "dir_name": dir_name,
+        "pn_dir": pn_dir,
+        "physical": physical,
+        "smooth_frames": smooth_frames,
+        "ignore_skew": ignore_skew,
+        "return_res": return_res,
+    }
+    if not len(channels):
+        return iter(())
+    elif isinstance(record, Record):
+        return _iter_single_segment(
+            record, sampfrom, sampto, chunk_frames, channels, read_args
+        )
+    else:
+        return _iter_multi_segment(
+            record, sampfrom, sampto, chunk_frames, channels, read_args
+        )
+
+
+def _iter_single_segment(
+    record, sampfrom, sampto, chunk_frames, channels, read_args
+):
+    """
+    Generator of the blocks of a single segment record. Helper to
+    `iter_record`.
+
+    Parameters
+    ----------
+    record : Record
+        The record header.
+    sampfrom : int
+        The starting sample number to read.
+    sampto : int
+        The sample number at which to stop reading.
+    chunk_frames : int
+        The number of frames in each block.
+    channels : list
+        The channels to read.
+    read_args : dict
+        The remaining `iter_record` arguments, as passed to
+        `_rd_signal_block`.
+
+    Yields
+    ------
+    start_frame : int
+        The sample number at which the block starts.
+    signal : ndarray, list
+        The block's signals.
+
+    """
+    init_value = record.init_value[:]
+    file_handles = {}
+    try:
+        for start in range(sampfrom, sampto, chunk_frames):
+            stop = min(start + chunk_frames, sampto)
+            signal = _rd_signal_block(
+                record,
+                start,
+                stop,
+                channels,
+                init_value,
+                file_handles,
+                fmt8_index=start == sampfrom,
+                **read_args,
+            )
+            yield start, signal
+    finally:
+        for fp in file_handles.values():
+            fp.close()
+
+
+def _iter_multi_segment(
+    record, sampfrom, sampto, chunk_frames, channels, read_args
+):
+    """
+    Generator of the blocks of a multi-segment record. Helper to
+    `iter_record`.
+
+    Each segment header is read once, when the first block containing
+    the segment is read, and the segment's dat files are closed as soon
+    as no later block needs them.
+
+    Parameters
+    ----------
+    record : MultiRecord
+        The record header.
+    sampfrom : int
+        The starting sample number to read.
+    sampto : int
+        The sample number at which to stop reading.
+    chunk_frames : int
+        The number of frames in each block.
+    channels : list
+        The channels to read, relative to the layout of the record.
+    read_args : dict
+        The remaining `iter_record` arguments, as passed to
+        `_rd_signal_block`.
+
+    Yields
+    ------
+    start_frame : int
+        The sample number at which the block starts.
+    signal : ndarray, list
+        The block's signals.
+
+    """
+    dir_name = read_args["dir_name"]
+    pn_dir = read_args["pn_dir"]
+    physical = read_args["physical"]
+    smooth_frames = read_args["smooth_frames"]
+    return_res = read_args["return_res"]
+
+    seg_numbers, seg_ranges = record._required_segments(sampfrom, sampto)
+    # The sample number of the record at which each segment starts
+    seg_starts = {}
+    seg_sampfrom = sampfrom
+    for seg_num, seg_range in zip(seg_numbers, seg_ranges):
+        seg_starts[seg_num] = seg_sampfrom - seg_range[0]
+        seg_sampfrom += seg_range[1] - seg_range[0]
+
+    # Segment headers, the segment and output channels to read, the
+    # initial values, and the open files of each segment in use
+    segments = {}
+
+    def get_segment(seg_num):
+        if seg_num not in segments:
+            seg = rdheader(
+                os.path.join(dir_name, record.seg_name[seg_num]),
+                pn_dir=pn_dir,
+            )
+            if record.layout == "fixed":
+                seg_channels = channels
+                out_channels = list(range(len(channels)))
+            else:
+                segment_channels = _get_wanted_channels(
+                    sig_names, seg.sig_name, pad=True
+                )
+                seg_channels = [c for c in segment_channels if c is not None]
+                out_channels = [
+                    i for i, c in enumerate(segment_channels) if c is not None
+                ]
+            segments[seg_num] = (
+                seg,
+                seg_channels,
+                out_channels,
+                seg.init_value[:],
+                {},
+            )
+        return segments[seg_num]
+
+    def close_segment(seg_num):
+        if seg_num in segments:
+            for fp in segments.pop(seg_num)[4].values():
+                fp.close()
+
+    if record.layout == "fixed":
+        first_seg = get_segment(seg_numbers[0])[0]
+        samps_per_frame = [first_seg.samps_per_frame[c] for c in channels]
+        fmt = [first_seg.fmt[c] for c in channels]
+    else:
+        layout = rdheader(
+            os.path.join(dir_name, record.seg_name[0]), pn_dir=pn_dir
+        )
+        sig_names = [layout.sig_name[c] for c in channels]
+        samps_per_frame = [layout.samps_per_frame[c] for c in channels]
+        fmt = [None] * len(channels)
+        if not physical:
+            # All signals of the same name must have the same fmt, gain,
+            # and baseline in all segments for the digital signals to be
+            # combined.
+            reference = {}
+            for seg_num in seg_numbers:
+                if record.seg_name[seg_num] == "~":
+                    continue
+                seg, seg_channels, out_channels, _, _ = get_segment(seg_num)
+                for seg_ch, ch in zip(seg_channels, out_channels):
+                    fields = (
+                        seg.fmt[seg_ch],
+                        seg.adc_gain[seg_ch],
+                        seg.baseline[seg_ch],
+                    )
+                    if reference.setdefault(ch, fields) != fields:
+                        raise Exception(
+                            "This variable layout multi-segment record cannot be converted to single segment, in digital format."
+                        )
+            # Signals absent from every segment read are filled with
+            # the format 16 NaN value
+            fmt = [reference.get(ch, ("16",))[0] for ch in range(len(channels))]
+    samps_per_frame = [1 if s is None else s for s in samps_per_frame]
+
+    # Value of samples not contained in any segment
+    if physical:
+        dtype = _signal._np_dtype(return_res, discrete=False)
+        nan_vals = len(channels) * [np.nan]
+    else:
+        dtype = _signal._np_dtype(return_res, discrete=True)
+        nan_vals = _signal._digi_nan(fmt)
+
+    try:
+        for start in range(sampfrom, sampto, chunk_frames):
+            stop = min(start + chunk_frames, sampto)
+            n_frames = stop - start
+
+            if smooth_frames:
+                signal = np.empty((n_frames, len(channels)), dtype=dtype)
+                signal[:] = nan_vals
+            else:
+                signal = [
+                    np.full(n_frames * spf, nan_val, dtype=dtype)
+                    for spf, nan_val in zip(samps_per_frame, nan_vals)
+                ]
+
+            for seg_num in seg_numbers:
+                seg_start = seg_starts[seg_num]
+                seg_stop = seg_start + record.seg_len[seg_num]
+                if seg_stop <= start:
+                    close_segment(seg_num)
+                    continue
+                if seg_start >= stop:
+                    break
+                if record.seg_name[seg_num] == "~":
+                    continue
+
+                (
+                    seg,
+                    seg_channels,
+                    out_channels,
+                    init_value,
+                    file_handles,
+                ) = get_segment(seg_num)
+                if not seg_channels:
+                    continue
+                block_start = max(start, seg_start)
+                block_stop = min(stop, seg_stop)
+                seg_signal = _rd_signal_block(
+                    seg,
+                    block_start - seg_start,
+                    block_stop - seg_start,
+                    seg_channels,
+                    init_value,
+                    file_handles,
+                    fmt8_index=block_start == max(sampfrom, seg_start),
+                    **read_args,
+                )
+
+                out_start = block_start - start
+                out_stop = block_stop - start
+                if smooth_frames:
+                    signal[out_start:out_stop, out_channels] = seg_signal
+                else:
+                    for i, ch in enumerate(out_channels):
+                        spf = samps_per_frame[ch]
+                        signal[ch][
+                            out_start * spf : out_stop * spf
+                        ] = seg_signal[i]
+
+            yield start, signal
+    finally:
+        for seg_num in list(segments):
+            close_segment(seg_num)
+
+
+def _rd_signal_block(
+    record,
+    sampfrom,
+    sampto,
+    channels,
+    init_value,
+    file_handles,
+    dir_name,
+    pn_dir,
+    physical,
+    smooth_frames,
+    ignore_skew,
+    return_res,
+    fmt8_index=True,
+):
+    """
+    Read a block of frames of a single segment record, and convert it
+    as `rdrecord` would. Helper to `iter_record`.
+
+    Parameters
+    ----------
+    record : Record
+        The single segment record header.
+    sampfrom : int
+        The starting sample number to read.
+    sampto : int
+        The sample number at which to stop reading.
+    channels : list
+        The channels to read.
+    init_value : list
+        The initial value of each signal of the record. Updated in place
+        to the last sample read for format 8 signals, so that the next
+        block continues from it.
+    file_handles : dict
+        Open dat files to reuse across blocks.
+    dir_name : str
+        The full directory where the dat file(s) are located, if the dat
+        file(s) are local.
+    pn_dir : str
+        The PhysioNet directory where the dat file(s) are located, if
+        the dat file(s) are remote.
+    physical : bool
+        Whether to return the physical (True) or digital (False) signals.
+    smooth_frames : bool
+        Whether to return an (MxN) uniform numpy array (True), or a list
+        of 1d numpy arrays containing every expanded sample (False).
+    ignore_skew : bool
+        Whether to ignore the skew field of the signals.
+    return_res : int
+        The numpy array dtype of the returned signals.
+    fmt8_index : bool, optional
+        Whether format 8 signals are reconstructed from the index of
+        their dat file, if it has one, rather than from `init_value`.
+        Only the first block read from a record needs the index.
+
+    Returns
+    -------
+    signal : ndarray, list
+        The block's signals.
+
+    """
+    block_init_value = init_value[:]
+    e_d_signal = _signal._rd_segment(
+        file_name=record.file_name,
+        dir_name=dir_name,
+        pn_dir=pn_dir,
+        fmt=record.fmt,
+        n_sig=record.n_sig,
+        sig_len=record.sig_len,
+        byte_offset=record.byte_offset,
+        samps_per_frame=record.samps_per_frame,
+        skew=record.skew,
+        init_value=init_value,
+        sampfrom=sampfrom,
+        sampto=sampto,
+        channels=channels,
+        ignore_skew=ignore_skew,
+        return_res=return_res,
+        file_handles=file_handles,
+        fmt8_index=fmt8_index,
+    )
+
+    # Continue format 8 sample differences from the sample preceding
+    # the next block in the dat file. Skewed signals are read `skew`
+    # frames ahead of it, so for blocks no longer than their skew, that
+    # sample is read again without skew.
+    n_frames = sampto - sampfrom
+    unskewed_channels = []
+    for ch, signal in zip(channels, e_d_signal):
+        if record.fmt[ch] == "8":
+            skew = 0 if ignore_skew else record.skew[ch] or 0
+            spf = record.samps_per_frame[ch] or 1
+            if n_frames > skew:
+                init_value[ch] = int(signal[(n_frames - skew) * spf - 1])
+            elif ch not in unskewed_channels:
+                unskewed_channels.append(ch)
+    if unskewed_channels:
+        unskewed_signal = _signal._rd_segment(
+            file_name=record.file_name,
+            dir_name=dir_name,
+            pn_dir=pn_dir,
+            fmt=record.fmt,
+            n_sig=record.n_sig,
+            sig_len=record.sig_len,
+            byte_offset=record.byte_offset,
+            samps_per_frame=record.samps_per_frame,
+            skew=record.skew,
+            init_value=block_init_value,
+            sampfrom=sampfrom,
+            sampto=sampto,
+            channels=unskewed_channels,
+            ignore_skew=True,
+            return_res=return_res,
+            file_handles=file_handles,
+            fmt8_index=fmt8_index,
+        )
+        for ch, signal in zip(unskewed_channels, unskewed_signal):
+            init_value[ch] = int(signal[-1])
+
+    block = Record(
+        n_sig=len(channels),
+        fmt=[record.fmt[c] for c in channels],
+        samps_per_frame=[record.samps_per_frame[c] for c in channels],
+        adc_gain=[record.adc_gain[c] for c in channels],
+        baseline=[record.baseline[c] for c in channels],
+        e_d_signal=e_d_signal,
+    )
+    if smooth_frames:
+        block.d_signal = block.smooth_frames("digital")
+        block.e_d_signal = None
+        if physical:
+            block.dac(
+                expanded=False, return_res=return_res, inplace=True, lut=True
+            )
+    elif physical:
+        block.dac(
+            expanded=True,
+            return_res=return_res,
+            inplace=True,
+            lut=return_res == 16,
+        )
+    block.convert_dtype(physical, return_res, smooth_frames)
+
+    if physical:
+        return block.p_signal if smooth_frames else block.e_p_signal
+    else:
+        return block.d_signal if smooth_frames else block.e_d_signal
+
+
 def sampfreq(record_name, pn_dir=None):
     """
     Read a WFDB header file and return the sampling frequency of
@@ -2732,49 +4502,204 @@ def wfdbtime(record_name, input_times, pn_dir=None):
         print(f"{sample_num:>12}{out_time:>24}{out_date:>32}")
 
 
-def _get_date_from_time(start_time, hours, minutes, seconds, out_time):
+def _get_date_from_time(start_time, hours, minutes, seconds, out_time):
+    """
+    Convert a starting time to a date using the elapsed time.
+
+    Parameters
+    ----------
+    start_time : datetime object
+        The time the record start if available.
+    hours : int
+        The number of hours elapsed.
+    minutes : int
+        The number of minutes elapsed.
+    seconds : int
+        The number of seconds elapsed.
+    out_time : str
+        The string formatted time elapsed for a desired sample, if available.
+
+    Returns
+    -------
+    out_date : datetime object
+        The time the record ends after the caculcated elapsed time.
+
+    """
+    if start_time:
+        try:
+            start_time = (
+                datetime.datetime.combine(datetime.date.min, start_time)
+                - datetime.datetime.min
+            )
+        except TypeError:
+            start_time = start_time - datetime.datetime.min
+        microseconds = int(1000000 * (seconds % 1))
+        elapsed_time = datetime.timedelta(
+            hours=hours,
+            minutes=minutes,
+            seconds=int(seconds),
+            microseconds=microseconds,
+        )
+        out_date = start_time + elapsed_time
+        out_date = f'[{(datetime.datetime.min+out_date).strftime("%H:%M:%S.%f %d/%m/%Y")}]'
+    else:
+        out_date = out_time
+    return out_date
+
+
+def _infer_record_sig_len(record, dir_name, pn_dir=None):
+    """
+    Figure out the signal length of a record whose header does not
+    contain it, from the first dat file. This is only possible for
+    single segment records. If there are no signals, sig_len is 0.
+
+    Parameters
+    ----------
+    record : Record
+        The record header, as returned by `rdheader`.
+    dir_name : str
+        The full directory where the dat file(s) are located, if the dat
+        file(s) are local.
+    pn_dir : str, optional
+        The PhysioNet directory where the dat file(s) are located, if
+        the dat file(s) are remote.
+
+    Returns
+    -------
+    sig_len : int
+        The signal length of the record.
+
+    """
+    if record.n_sig == 0:
+        return 0
+
+    # Calculate total number of samples per frame in the first dat file.
+    tsamps_per_frame = 0
+    for fname, spf in zip(record.file_name, record.samps_per_frame):
+        if fname == record.file_name[0]:
+            tsamps_per_frame += spf
+
+    # Calculate length from size of the dat file.
+    return _signal._infer_sig_len(
+        file_name=record.file_name[0],
+        fmt=record.fmt[0],
+        tsamps_per_frame=tsamps_per_frame,
+        byte_offset=record.byte_offset[0],
+        dir_name=dir_name,
+        pn_dir=pn_dir,
+    )
+
+
+def _check_out(
+    out,
+    record,
+    sampfrom,
+    sampto,
+    channels,
+    physical,
+    smooth_frames,
+    mmap,
+    lazy,
+    m2s,
+    force_channels,
+):
+    """
+    Ensure that a caller-supplied output array can hold the signals
+    read by `rdrecord`.
+
+    Parameters
+    ----------
+    out : ndarray
+        The output array to check.
+    record : Record or MultiRecord
+        The record header, as returned by `rdheader`.
+    sampfrom : int
+        The starting sample number to read.
+    sampto : int
+        The sample number at which to stop reading.
+    channels : list
+        The channel indices to read.
+    physical : bool
+        Whether physical or digital signals are read.
+    smooth_frames : bool
+        Whether the frames of the signals are smoothed.
+    mmap : bool
+        Whether the dat files are memory-mapped.
+    lazy : bool
+        Whether the signals are read on demand.
+    m2s : bool
+        Whether multi-segment records are converted to single segment
+        records.
+    force_channels : bool
+        Whether all requested channels of variable layout records are
+        kept.
+
+    Returns
+    -------
+    N/A
+
+    """
+    if not isinstance(out, np.ndarray):
+        raise TypeError("out must be a numpy array")
+    if mmap or lazy:
+        raise ValueError("out cannot be combined with mmap or lazy")
+    if not smooth_frames:
+        raise ValueError("out requires smooth_frames to be True")
+    if isinstance(record, MultiRecord):
+        if not m2s:
+            raise ValueError("out requires m2s to be True")
+        if record.layout == "variable" and not force_channels:
+            raise ValueError(
+                "out requires force_channels to be True for variable "
+                "layout records"
+            )
+    shape = (sampto - sampfrom, len(channels))
+    if out.shape != shape:
+        raise ValueError(
+            "out has shape %s, but the signal read has shape %s"
+            % (out.shape, shape)
+        )
+    if physical and not np.issubdtype(out.dtype, np.floating):
+        raise TypeError("out must have a float dtype when physical is True")
+    if not physical and not np.issubdtype(out.dtype, np.signedinteger):
+        raise TypeError(
+            "out must have a signed integer dtype when physical is False"
+        )
+    # The formats of multi-segment records are checked as their
+    # segments are read.
+    if not physical and isinstance(record, Record):
+        _check_out_dtype(out, [record.fmt[c] for c in channels])
+    if not out.flags.writeable:
+        raise ValueError("out must be writeable")
+
+
+def _check_out_dtype(out, fmt):
     """
-    Convert a starting time to a date using the elapsed time.
+    Ensure that a caller-supplied signed integer output array can hold
+    the digital samples of some dat formats.
 
     Parameters
     ----------
-    start_time : datetime object
-        The time the record start if available.
-    hours : int
-        The number of hours elapsed.
-    minutes : int
-        The number of minutes elapsed.
-    seconds : int
-        The number of seconds elapsed.
-    out_time : str
-        The string formatted time elapsed for a desired sample, if available.
+    out : ndarray
+        The output array to check.
+    fmt : list
+        The WFDB dat format of each channel read into the array.
 
     Returns
     -------
-    out_date : datetime object
-        The time the record ends after the caculcated elapsed time.
+    N/A
 
     """
-    if start_time:
-        try:
-            start_time = (
-                datetime.datetime.combine(datetime.date.min, start_time)
-                - datetime.datetime.min
+    dtype_info = np.iinfo(out.dtype)
+    for f in fmt:
+        if f is None:
+            continue
+        lower, upper = _signal._digi_bounds(f)
+        if lower < dtype_info.min or upper > dtype_info.max:
+            raise TypeError(
+                "out has dtype %s, which cannot hold the digital samples "
+                "of format %s" % (out.dtype, f)
             )
-        except TypeError:
-            start_time = start_time - datetime.datetime.min
-        microseconds = int(1000000 * (seconds % 1))
-        elapsed_time = datetime.timedelta(
-            hours=hours,
-            minutes=minutes,
-            seconds=int(seconds),
-            microseconds=microseconds,
-        )
-        out_date = start_time + elapsed_time
-        out_date = f'[{(datetime.datetime.min+out_date).strftime("%H:%M:%S.%f %d/%m/%Y")}]'
-    else:
-        out_date = out_time
-    return out_date
 
 
 def _get_wanted_channels(wanted_sig_names, record_sig_names, pad=False):
@@ -2846,20 +4771,24 @@ def wrsamp(
         A list of strings giving the units of each signal channel.
     sig_name : list, str
         A list of strings giving the signal name of each signal channel.
-    p_signal : ndarray, optional
+    p_signal : ndarray, iterable, optional
         An (MxN) 2d numpy array, where M is the signal length. Gives the
         physical signal values intended to be written. Either p_signal or
         d_signal must be set, but not both. If p_signal is set, this method will
         use it to perform analogue-digital conversion, writing the resultant
         digital values to the dat file(s). If fmt is set, gain and baseline must
         be set or unset together. If fmt is unset, gain and baseline must both
-        be unset.
-    d_signal : ndarray, optional
+        be unset. May also be a memory-mapped array, or an iterable of
+        2d arrays giving consecutive blocks of frames, which are converted
+        and written one block at a time (see Notes).
+    d_signal : ndarray, iterable, optional
         An (MxN) 2d numpy array, where M is the signal length. Gives the
         digital signal values intended to be directly written to the dat
         file(s). The dtype must be an integer type. Either p_signal or d_signal
         must be set, but not both. In addition, if d_signal is set, fmt, gain
-        and baseline must also all be set.
+        and baseline must also all be set. May also be a memory-mapped
+        array, or an iterable of 2d arrays giving consecutive blocks of
+        frames (see Notes).
     fmt : list, optional
         A list of strings giving the WFDB format of each file used to store each
         channel. Accepted formats are: '80','212','16','24', and '32'. There are
@@ -2897,6 +4826,13 @@ def wrsamp(
     advanced method, see also the `set_defaults`, `set_d_features`, and
     `set_p_features` instance methods to help populate attributes.
 
+    Signals given as a `numpy.memmap`, or as an iterable of blocks, are
+    written without holding the whole signal (or its digital conversion)
+    in memory: the `sig_len`, `init_value`, and `checksum` fields are
+    computed as the blocks are written. `fmt` must then be given. When
+    physical blocks are given as an iterable, `adc_gain` and `baseline`
+    must also be given, as the blocks can only be read once.
+
     Examples
     --------
     >>> # Read part of a record from Physionet
@@ -2920,6 +4856,42 @@ def wrsamp(
             raise Exception(
                 "When using d_signal, must also specify 'fmt', 'gain', and 'baseline' fields."
             )
+    # Write signals given in blocks as they are converted
+    if _is_signal_stream(p_signal) or _is_signal_stream(d_signal):
+        if fmt is None:
+            raise Exception(
+                "When using a memory-mapped or iterable signal, must also specify 'fmt'."
+            )
+        if isinstance(p_signal, np.memmap):
+            if adc_gain is None and baseline is None:
+                adc_gain, baseline = _calc_adc_params_blocks(p_signal, fmt)
+            elif adc_gain is None or baseline is None:
+                raise Exception(
+                    "When using a memory-mapped p_signal, must specify both or neither of the 'gain' and 'baseline' fields."
+                )
+        elif adc_gain is None or baseline is None:
+            raise Exception(
+                "When using an iterable signal, must also specify 'gain' and 'baseline' fields."
+            )
+        record = Record(
+            record_name=record_name,
+            n_sig=len(fmt),
+            p_signal=p_signal,
+            d_signal=d_signal,
+            fs=fs,
+            fmt=fmt,
+            units=units,
+            sig_name=sig_name,
+            adc_gain=adc_gain,
+            baseline=baseline,
+            comments=comments,
+            base_time=base_time,
+            base_date=base_date,
+            base_datetime=base_datetime,
+        )
+        record.set_defaults()
+        record.wrsamp(write_dir=write_dir)
+        return
     # Depending on whether d_signal or p_signal was used, set other
     # required features.
     if p_signal is not None:
@@ -2966,6 +4938,561 @@ def wrsamp(
     record.wrsamp(write_dir=write_dir)
 
 
+class RecordWriter(object):
+    """
+    Write a single segment WFDB record incrementally, by appending blocks
+    of frames to its dat files as they are acquired.
+
+    Each block is converted, encoded, and written as soon as it is given,
+    so the whole signal never needs to be held in memory. The record's
+    length, checksums, and initial values are tracked as blocks are
+    written, and the header file is (re)written whenever the writer is
+    flushed or closed. Use the writer as a context manager, or call
+    `close`, to finish the record.
+
+    Parameters
+    ----------
+    record_name : str
+        The string name of the WFDB record to be written (without any file
+        extensions). Must not contain any "."
+    fs : int, float
+        The sampling frequency of the record.
+    units : list
+        A list of strings giving the units of each signal channel.
+    sig_name : list
+        A list of strings giving the signal name of each signal channel.
+    fmt : list
+        A list of strings giving the WFDB format of each channel. The
+        formats 80, 212, 16, 24, 32, 508, 516, and 524 are supported.
+    adc_gain : list
+        A list of numbers specifying the ADC gain of each channel, used
+        to convert physical frames.
+    baseline : list
+        A list of integers specifying the digital baseline of each
+        channel, used to convert physical frames.
+    samps_per_frame : list, optional
+        The number of samples per frame of each channel. All 1 by default.
+    comments : list, optional
+        A list of string comments to be written to the header file.
+    base_time : datetime.time, optional
+        The time of day at the beginning of the record.
+    base_date : datetime.date, optional
+        The date at the beginning of the record.
+    base_datetime : datetime.datetime, optional
+        The date and time at the beginning of the record, equivalent to
+        setting both `base_date` and `base_time`.
+    write_dir : str, optional
+        The directory in which to write the files.
+
+    Attributes
+    ----------
+    record : Record
+        The header of the record written so far, without any signals.
+
+    Examples
+    --------
+    >>> with wfdb.RecordWriter('bedside', fs=250, units=['mV', 'mV'],
+                               sig_name=['II', 'V'], fmt=['16', '16'],
+                               adc_gain=[200, 200], baseline=[0, 0]) as writer:
+    ...     for p_signal in acquire_blocks():
+    ...         writer.write_frames(p_signal=p_signal)
+    ...         writer.flush()
+
+    """
+
+    def __init__(
+        self,
+        record_name,
+        fs,
+        units,
+        sig_name,
+        fmt,
+        adc_gain,
+        baseline,
+        samps_per_frame=None,
+        comments=None,
+        base_time=None,
+        base_date=None,
+        base_datetime=None,
+        write_dir="",
+    ):
+        if "." in record_name:
+            raise Exception("Record name must not contain '.'")
+        n_sig = len(fmt)
+        if samps_per_frame is None:
+            samps_per_frame = [1] * n_sig
+        record = Record(
+            record_name=record_name,
+            n_sig=n_sig,
+            fs=fs,
+            fmt=list(fmt),
+            samps_per_frame=list(samps_per_frame),
+            adc_gain=list(adc_gain),
+            baseline=list(baseline),
+            units=list(units),
+            sig_name=list(sig_name),
+            comments=comments,
+            base_time=base_time,
+            base_date=base_date,
+            base_datetime=base_datetime,
+        )
+        record.set_defaults()
+        self._open(record, write_dir)
+
+    @classmethod
+    def _from_record(cls, record, write_dir=""):
+        """
+        Create a writer of the signals of a record, described by the
+        header fields of a `Record` object. The object is not modified.
+
+        """
+        writer = cls.__new__(cls)
+        record = copy.copy(record)
+        for field in ["p_signal", "d_signal", "e_p_signal", "e_d_signal"]:
+            setattr(record, field, None)
+        if record.samps_per_frame is None:
+            record.samps_per_frame = [1] * record.n_sig
+        writer._open(record, write_dir)
+        return writer
+
+    def _open(self, record, write_dir):
+        """
+        Write the header of an empty record, and create its dat files.
+
+        Parameters
+        ----------
+        record : Record
+            The header of the record, whose `sig_len`, `init_value`, and
+            `checksum` fields are set here.
+        write_dir : str
+            The directory in which to write the files.
+
+        Returns
+        -------
+        N/A
+
+        """
+        for fmt in record.fmt:
+            if fmt not in ("80", "212", "16", "24", "32") + tuple(
+                _signal.COMPRESSED_FMTS
+            ):
+                raise ValueError(
+                    "RecordWriter only supports writing the following "
+                    "formats: 80, 212, 16, 24, 32, 508, 516, 524"
+                )
+        record.sig_len = 0
+        record.init_value = [0] * record.n_sig
+        record.checksum = [0] * record.n_sig
+        self.record = record
+        self.write_dir = write_dir
+        # Check the fields before creating any file
+        record.wrheader(write_dir=write_dir, expanded=self._expanded)
+
+        # The channels, format, open file, and for format 212, the sample
+        # left over from the last pair, of each dat file
+        file_names, dat_channels = _signal.describe_list_indices(
+            record.file_name
+        )
+        self._dat_files = []
+        try:
+            for file_name in file_names:
+                channels = dat_channels[file_name]
+                fmt = record.fmt[channels[0]]
+                file_path = os.path.join(write_dir, file_name)
+                if fmt in _signal.COMPRESSED_FMTS:
+                    fp = self._open_flac(file_path, fmt, channels)
+                else:
+                    fp = open(file_path, "wb")
+                    if record.byte_offset is not None:
+                        fp.write(bytes(record.byte_offset[channels[0]] or 0))
+                self._dat_files.append([channels, fmt, fp, None])
+        except BaseException:
+            self._close_files()
+            raise
+        self.closed = False
+
+    @property
+    def _expanded(self):
+        return any(spf != 1 for spf in self.record.samps_per_frame)
+
+    def _open_flac(self, file_path, fmt, channels):
+        """
+        Open a FLAC signal file for writing.
+
+        """
+        import soundfile
+
+        spf = [self.record.samps_per_frame[ch] for ch in channels]
+        if any(s != spf[0] for s in spf):
+            raise ValueError(
+                "All channels in a FLAC signal file must have the same "
+                "sampling rate and samples per frame"
+            )
+        if len(channels) > 8:
+            raise ValueError(
+                "A single FLAC signal file cannot contain more than 8 channels"
+            )
+        return soundfile.SoundFile(
+            file_path,
+            mode="w",
+            samplerate=96000,
+            channels=len(channels),
+            subtype={"508": "PCM_S8", "516": "PCM_16", "524": "PCM_24"}[fmt],
+            format="FLAC",
+        )
+
+    def write_frames(
+        self, p_signal=None, d_signal=None, e_p_signal=None, e_d_signal=None
+    ):
+        """
+        Append a block of frames to the record. Exactly one of the
+        arguments must be given.
+
+        Parameters
+        ----------
+        p_signal : ndarray, optional
+            An (MxN) 2d numpy array of physical frames, converted with the
+            `adc_gain` and `baseline` of each channel. NaN values are
+            written as the invalid sample value of each format. Only for
+            records with one sample per frame in every channel.
+        d_signal : ndarray, optional
+            An (MxN) 2d numpy array of digital frames. Only for records
+            with one sample per frame in every channel.
+        e_p_signal : list, optional
+            A list of 1d numpy arrays of the expanded physical samples of
+            each channel, each containing M times its samples per frame.
+        e_d_signal : list, optional
+            A list of 1d numpy arrays of the expanded digital samples of
+            each channel, each containing M times its samples per frame.
+
+        Returns
+        -------
+        N/A
+
+        """
+        if self.closed:
+            raise ValueError("I/O operation on closed RecordWriter")
+        if (
+            sum(
+                s is not None
+                for s in (p_signal, d_signal, e_p_signal, e_d_signal)
+            )
+            != 1
+        ):
+            raise Exception(
+                "Must give exactly one of the inputs: p_signal, d_signal, "
+                "e_p_signal, or e_d_signal"
+            )
+        record = self.record
+        spf = record.samps_per_frame
+
+        # Convert the block to a list of the digital samples of each
+        # channel
+        if p_signal is not None or d_signal is not None:
+            if self._expanded:
+                raise Exception(
+                    "Records with more than one sample per frame must be "
+                    "written with e_p_signal or e_d_signal"
+                )
+            if p_signal is not None:
+                d_signal = Record(
+                    p_signal=np.asarray(p_signal, dtype="float64"),
+                    fmt=record.fmt,
+                    adc_gain=record.adc_gain,
+                    baseline=record.baseline,
+                ).adc()
+            d_signal = np.asarray(d_signal)
+            if d_signal.ndim != 2 or d_signal.shape[1] != record.n_sig:
+                raise ValueError("The frames must have n_sig columns")
+            e_d_signal = [d_signal[:, ch] for ch in range(record.n_sig)]
+        elif e_p_signal is not None:
+            e_d_signal = Record(
+                e_p_signal=[np.asarray(s, dtype="float64") for s in e_p_signal],
+                fmt=record.fmt,
+                adc_gain=record.adc_gain,
+                baseline=record.baseline,
+            ).adc(expanded=True)
+        e_d_signal = [np.asarray(s) for s in e_d_signal]
+
+        if len(e_d_signal) != record.n_sig:
+            raise ValueError("n_sig does not match the length of e_d_signal")
+        n_frames = len(e_d_signal[0]) // spf[0]
+        for ch, sig in enumerate(e_d_signal):
+            if len(sig) != n_frames * spf[ch]:
+                raise ValueError(
+                    f"Length of channel {ch} does not match "
+                    f"samps_per_frame[{ch}] * the number of frames"
+                )
+            if not len(sig):
+                continue
+            dmin, dmax = _signal._digi_bounds(record.fmt[ch])
+            if sig.min() < dmin or sig.max() > dmax:
+                raise IndexError(
+                    "Channel %d contain values outside allowed range [%d, %d] for fmt %s"
+                    % (ch, dmin, dmax, record.fmt[ch])
+                )
+        if not n_frames:
+            return
+
+        for dat_file in self._dat_files:
+            channels, fmt, fp, _ = dat_file
+            # Interleave the samples of the frames of the file
+            frames = np.empty(
+                (n_frames, sum(spf[ch] for ch in channels)),
+                dtype=np.result_type(*[e_d_signal[ch] for ch in channels]),
+            )
+            expand_ch = 0
+            for ch in channels:
+                frames[:, expand_ch : expand_ch + spf[ch]] = e_d_signal[
+                    ch
+                ].reshape(-1, spf[ch])
+                expand_ch += spf[ch]
+
+            if fmt in _signal.COMPRESSED_FMTS:
+                n_chan = len(channels)
+                frames = frames.reshape(-1, n_chan, spf[channels[0]])
+                frames = frames.transpose(0, 2, 1).reshape(-1, n_chan)
+                if fmt == "524":
+                    frames = frames.astype("int32")
+                    np.left_shift(frames, 8, out=frames)
+                else:
+                    frames = frames.astype("int16")
+                    if fmt == "508":
+                        np.left_shift(frames, 8, out=frames)
+                fp.write(frames)
+                continue
+
+            samples = frames.reshape(-1)
+            if fmt == "212":
+                # Samples are packed in pairs. The first sample of a pair
+                # left over from the last block was written in the
+                # first 2 bytes of its triplet, which are rewritten.
+                if dat_file[3] is not None:
+                    samples = np.concatenate([dat_file[3], samples])
+                    fp.seek(-2, os.SEEK_CUR)
+                dat_file[3] = samples[-1:] if len(samples) % 2 else None
+            _signal._encode_samples(samples, fmt).tofile(fp)
+
+        # Update the header fields
+        for ch, sig in enumerate(e_d_signal):
+            if not record.sig_len:
+                record.init_value[ch] = int(sig[0])
+            record.checksum[ch] = int(
+                (record.checksum[ch] + np.sum(sig, dtype="int64")) % 65536
+            )
+        record.sig_len += n_frames
+
+    def flush(self):
+        """
+        Flush the frames written so far to the dat files, and rewrite the
+        header file to describe them, so that the record can be read
+        while it is being written.
+
+        Parameters
+        ----------
+        N/A
+
+        Returns
+        -------
+        N/A
+
+        """
+        if self.closed:
+            raise ValueError("I/O operation on closed RecordWriter")
+        for _, _, fp, _ in self._dat_files:
+            fp.flush()
+        self.record.wrheader(write_dir=self.write_dir, expanded=self._expanded)
+
+    def close(self):
+        """
+        Close the dat files, and write the final header file.
+
+        Parameters
+        ----------
+        N/A
+
+        Returns
+        -------
+        N/A
+
+        """
+        if self.closed:
+            return
+        self.closed = True
+        self._close_files()
+        self.record.wrheader(write_dir=self.write_dir, expanded=self._expanded)
+
+    def _close_files(self):
+        """
+        Close the open dat files.
+
+        """
+        for _, _, fp, _ in self._dat_files:
+            fp.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+
+def _is_signal_stream(signal):
+    """
+    Whether a signal should be read in blocks of frames when written:
+    either a memory-mapped array, or an iterable of blocks.
+
+    """
+    return isinstance(signal, np.memmap) or (
+        signal is not None and not isinstance(signal, np.ndarray)
+    )
+
+
+def _signal_blocks(signal):
+    """
+    Generate the blocks of frames of a memory-mapped or iterable signal.
+
+    """
+    if isinstance(signal, np.ndarray):
+        for start in range(0, len(signal), _signal.CHUNK_SIZE):
+            yield signal[start : start + _signal.CHUNK_SIZE]
+    else:
+        yield from signal
+
+
+def _calc_adc_params_blocks(p_signal, fmt):
+    """
+    Compute the `calc_adc_params` gain and baseline values of a
+    memory-mapped physical signal, reading it one block at a time.
+
+    Parameters
+    ----------
+    p_signal : ndarray
+        The (MxN) memory-mapped physical signal.
+    fmt : list
+        The WFDB format of each channel.
+
+    Returns
+    -------
+    adc_gains : list
+        List of calculated `adc_gain` values for each channel.
+    baselines : list
+        List of calculated `baseline` values for each channel.
+
+    """
+    # The parameters only depend on the minimum and maximum of each
+    # channel, ignoring nans
+    minvals = np.full(p_signal.shape[1], np.nan)
+    maxvals = np.full(p_signal.shape[1], np.nan)
+    for block in _signal_blocks(p_signal):
+        minvals = np.fmin(minvals, np.fmin.reduce(block, axis=0))
+        maxvals = np.fmax(maxvals, np.fmax.reduce(block, axis=0))
+    return Record(
+        p_signal=np.array([minvals, maxvals]), fmt=fmt
+    ).calc_adc_params()
+
+
+def _wr_signal_blocks(record, signal, physical, write_dir):
+    """
+    Write the dat files and header of a record from a memory-mapped or
+    iterable signal, one block of frames at a time.
+
+    Parameters
+    ----------
+    record : Record
+        The header fields of the record. The object is not modified.
+    signal : ndarray, iterable
+        The memory-mapped (MxN) signal, or an iterable of 2d blocks of
+        frames.
+    physical : bool
+        Whether the signal is physical, to be converted with the
+        `adc_gain` and `baseline` fields, or digital.
+    write_dir : str
+        The directory in which to write the files.
+
+    Returns
+    -------
+    header : Record
+        The header of the record written, with the `sig_len`,
+        `init_value`, and `checksum` fields of the signal.
+
+    """
+    with RecordWriter._from_record(record, write_dir) as writer:
+        for block in _signal_blocks(signal):
+            if physical:
+                writer.write_frames(p_signal=block)
+            else:
+                writer.write_frames(d_signal=block)
+    return writer.record
+
+
+def wr_fmt8_index(record_name, interval=_signal.FMT8_INDEX_INTERVAL):
+    """
+    Index the format 8 dat files of a local WFDB record, so that its
+    format 8 signals can be read from any sample number.
+
+    Format 8 stores the differences between consecutive samples, so the
+    value of a sample depends on every preceding sample. The index of
+    each format 8 dat file holds the values of its signals at regular
+    checkpoints, and is written next to the dat file, with '.idx'
+    appended to its name. `rdrecord` and `iter_record` then read from
+    the nearest checkpoint preceding `sampfrom`, instead of taking the
+    initial value of the signals as the value preceding `sampfrom`. An
+    index which no longer matches its dat file or header is ignored.
+
+    Parameters
+    ----------
+    record_name : str
+        The name of the WFDB record to index, without any file
+        extensions. If the argument contains any path delimiter
+        characters, the argument will be interpreted as PATH/BASE_RECORD.
+        Both relative and absolute paths are accepted. The segments of
+        multi-segment records are indexed.
+    interval : int, optional
+        The number of frames between checkpoints. At most this many
+        extra frames are decoded when reading a range of frames.
+
+    Returns
+    -------
+    N/A
+
+    Examples
+    --------
+    >>> wfdb.wr_fmt8_index('sample-data/format8')
+    >>> record = wfdb.rdrecord('sample-data/format8', sampfrom=100000)
+
+    """
+    if not hasattr(interval, "__index__") or interval < 1:
+        raise ValueError("interval must be a positive integer")
+
+    dir_name = os.path.abspath(os.path.dirname(record_name))
+    record = rdheader(record_name)
+
+    if isinstance(record, MultiRecord):
+        for seg_name in record.seg_name:
+            if seg_name != "~":
+                wr_fmt8_index(os.path.join(dir_name, seg_name), interval)
+        return
+
+    if record.sig_len is None:
+        record.sig_len = _infer_record_sig_len(record, dir_name)
+
+    file_name, dat_channels = _signal.describe_list_indices(record.file_name)
+    for fn in file_name:
+        channels = dat_channels[fn]
+        if record.fmt[channels[0]] != "8":
+            continue
+        _signal._wr_fmt8_index(
+            file_name=fn,
+            dir_name=dir_name,
+            sig_len=record.sig_len,
+            byte_offset=record.byte_offset[channels[0]] or 0,
+            samps_per_frame=[record.samps_per_frame[c] or 1 for c in channels],
+            init_value=[record.init_value[c] or 0 for c in channels],
+            interval=interval,
+        )
+
+
 def dl_database(
     db_dir,
     dl_dir,
@@ -3116,8 +5643,10 @@ def dl_database(
 
     print("Downloading files...")
     # Create multiple processes to download files.
-    # Limit to 2 connections to avoid overloading the server
-    pool = multiprocessing.dummy.Pool(processes=2)
+    # Limit the connections to avoid overloading the server
+    pool = multiprocessing.dummy.Pool(
+        processes=_url.transfer_options.max_connections
+    )
     pool.map(download.dl_pn_file, dl_inputs)
     print("Finished downloading files")
 